@@ -51,10 +51,29 @@ from .const import (
     FORECAST_CHART_MINUTE,
     CONF_FORECAST_ENTITY_1,
     CONF_FORECAST_ENTITY_2,
+    CONF_CHART_RENDER_PROCESSES,
+    CHART_RENDER_PROCESSES,
+    CONF_CHART_POSTPROCESS,
+    CHART_POSTPROCESS_ENABLED,
+    CHART_WARMUP_DELAY_SECONDS,
+    RENDER_PRIORITY_SCHEDULED,
+    CONF_LIVE_PUSH_INTERVAL,
+    LIVE_PUSH_INTERVAL_SECONDS,
 )
 from .storage import DataValidator
 from .storage.db_connection_manager import DatabaseConnectionManager
-from .api import async_setup_views, async_setup_websocket
+from .api import (
+    async_setup_views,
+    async_setup_websocket,
+    async_setup_render_job_views,
+    async_setup_live_push,
+    configure_live_push,
+    async_setup_batch_view,
+    async_setup_tariff_export_view,
+    async_setup_chart_export_views,
+    async_setup_tariff_simulation_view,
+    async_setup_weather_analytics_views,
+)
 from .services.daily_aggregator import DailyEnergyAggregator
 from .services.billing_calculator import BillingCalculator
 from .services.monthly_tariff_manager import MonthlyTariffManager
@@ -71,8 +90,17 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     hass.data.setdefault(DOMAIN, {})
 
+    # Take over export URLs of the compiled views, so they go first @zara
+    await async_setup_chart_export_views(hass)
+    await async_setup_tariff_export_view(hass)
+    # Before the compiled monthly_tariffs/{...} routes, which would match it @zara
+    await async_setup_tariff_simulation_view(hass)
     await async_setup_views(hass)
     await async_setup_websocket(hass)
+    await async_setup_render_job_views(hass)
+    await async_setup_live_push(hass)
+    await async_setup_batch_view(hass)
+    await async_setup_weather_analytics_views(hass)
     _LOGGER.info("SFML Stats Dashboard available at: /api/sfml_stats/dashboard")
 
     return True
@@ -159,6 +187,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     config_path = Path(hass.config.path())
     entry_config = dict(entry.data)
+
+    from .charts.postprocess import configure_postprocess
+    from .charts.render_pool import configure_render_pool
+    configure_render_pool(
+        entry_config.get(CONF_CHART_RENDER_PROCESSES, CHART_RENDER_PROCESSES)
+    )
+    configure_postprocess(
+        entry_config.get(CONF_CHART_POSTPROCESS, CHART_POSTPROCESS_ENABLED)
+    )
+
+    configure_live_push(
+        hass,
+        entry_config.get(CONF_LIVE_PUSH_INTERVAL, LIVE_PUSH_INTERVAL_SECONDS),
+    )
+
     aggregator = DailyEnergyAggregator(hass, config_path)
     billing_calculator = BillingCalculator(hass, config_path, entry_data=entry_config)
     monthly_tariff_manager = MonthlyTariffManager(hass, config_path, entry_data=entry_config)
@@ -177,7 +220,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             from .weather_collector import WeatherDataCollector
             weather_path = config_path / "sfml_stats_weather"
-            weather_collector = WeatherDataCollector(hass, weather_path)
+            weather_collector = WeatherDataCollector(hass, weather_path, db_manager)
             _LOGGER.info("Weather collector initialized for entity: %s", weather_entity)
         except Exception as err:
             _LOGGER.error("Failed to initialize weather collector: %s", err)
@@ -280,8 +323,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info("Starting scheduled forecast comparison chart generation")
         try:
             from .charts import ForecastComparisonChart
-            chart = ForecastComparisonChart(validator)
-            await chart.save()
+            from .charts.data_keys import async_chart_data_key
+            from .charts.render_queue import get_render_queue, render_job_key
+
+            async def _render() -> Path:
+                data_key = await async_chart_data_key("forecast_comparison", validator)
+                return await ForecastComparisonChart(validator).save(data_key=data_key)
+
+            await get_render_queue().run(
+                render_job_key("forecast_comparison"),
+                _render,
+                RENDER_PRIORITY_SCHEDULED,
+            )
             _LOGGER.info("Forecast comparison chart generated successfully")
         except Exception as err:
             _LOGGER.error("Forecast comparison chart generation failed: %s", err)
@@ -325,6 +378,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     hass.data[DOMAIN][entry.entry_id]["_task_aggregation"] = task_aggregation
 
+    async def _chart_warmup() -> None:
+        """Warm up matplotlib after startup settles. @zara"""
+        try:
+            from .charts.warmup import async_warm_up
+            await async_warm_up(CHART_WARMUP_DELAY_SECONDS)
+        except Exception as err:
+            _LOGGER.debug("Chart renderer warm-up failed: %s", err)
+
+    task_chart_warmup = hass.async_create_background_task(
+        _chart_warmup(),
+        f"{DOMAIN}_chart_warmup",
+    )
+    hass.data[DOMAIN][entry.entry_id]["_task_chart_warmup"] = task_chart_warmup
+
     async def _initial_forecast_collection() -> None:
         """Run initial forecast comparison collection if needed. @zara"""
         import asyncio
@@ -423,7 +490,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if "weather_collector" in entry_data and entry_data["weather_collector"]:
         _LOGGER.debug("Weather collector cleaned up")
 
-    for task_key in ("_task_aggregation", "_task_forecast"):
+    for task_key in ("_task_aggregation", "_task_forecast", "_task_chart_warmup"):
         task = entry_data.get(task_key)
         if task is not None and not task.done():
             task.cancel()
@@ -435,6 +502,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception:
         pass
 
+    try:
+        from .charts.render_queue import async_shutdown_render_queue
+        await async_shutdown_render_queue()
+    except Exception as err:
+        _LOGGER.warning("Error stopping chart render queue: %s", err)
+
+    try:
+        from .charts.render_pool import shutdown_render_pool
+        shutdown_render_pool()
+    except Exception as err:
+        _LOGGER.warning("Error stopping chart render processes: %s", err)
+
     try:
         await DatabaseConnectionManager.close_instance()
         _LOGGER.info("Database connection manager closed")
@@ -465,6 +544,19 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
     entry_data["config"] = new_config
 
+    from .charts.postprocess import configure_postprocess
+    from .charts.render_pool import configure_render_pool
+    configure_render_pool(
+        new_config.get(CONF_CHART_RENDER_PROCESSES, CHART_RENDER_PROCESSES)
+    )
+    configure_postprocess(
+        new_config.get(CONF_CHART_POSTPROCESS, CHART_POSTPROCESS_ENABLED)
+    )
+    configure_live_push(
+        hass,
+        new_config.get(CONF_LIVE_PUSH_INTERVAL, LIVE_PUSH_INTERVAL_SECONDS),
+    )
+
     if "billing_calculator" in entry_data and entry_data["billing_calculator"]:
         try:
             entry_data["billing_calculator"].update_config(new_config)
@@ -12,5 +12,23 @@ from __future__ import annotations
 
 from .views import async_setup_views
 from .websocket import async_setup_websocket
+from .render_jobs import async_setup_render_job_views
+from .live_push import async_setup_live_push, configure_live_push
+from .batch_view import async_setup_batch_view
+from .tariff_export import async_setup_tariff_export_view
+from .chart_exports import async_setup_chart_export_views
+from .tariff_simulation import async_setup_tariff_simulation_view
+from .weather_analytics import async_setup_weather_analytics_views
 
-__all__ = ["async_setup_views", "async_setup_websocket"]
+__all__ = [
+    "async_setup_views",
+    "async_setup_websocket",
+    "async_setup_render_job_views",
+    "async_setup_live_push",
+    "configure_live_push",
+    "async_setup_batch_view",
+    "async_setup_tariff_export_view",
+    "async_setup_chart_export_views",
+    "async_setup_tariff_simulation_view",
+    "async_setup_weather_analytics_views",
+]
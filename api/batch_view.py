@@ -0,0 +1,143 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Serve several dashboard resources from one request. @zara"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import nullcontext
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .dispatch import API_PREFIX, async_call_view
+from ..const import API_BATCH_MAX_RESOURCES
+from ..storage.db_connection_manager import get_manager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Views that may be combined, each served at /api/sfml_stats/<name> @zara
+BATCH_RESOURCES: frozenset[str] = frozenset({
+    "summary",
+    "energy_flow",
+    "statistics",
+    "billing",
+    "solar",
+    "prices",
+    "power_sources_history",
+    "solar_history",
+    "battery_history",
+    "house_history",
+    "grid_history",
+    "weather_history",
+    "clothing_recommendation",
+    "forecast_comparison",
+    "shadow_analytics",
+})
+
+
+def _parse_resources(request: web.Request) -> tuple[list[str], list[str]]:
+    """Return the requested resources in order without duplicates, and the unknown ones. @zara"""
+    names: list[str] = []
+    unknown: list[str] = []
+    for raw in request.query.get("resources", "").split(","):
+        name = raw.strip()
+        if not name or name in names or name in unknown:
+            continue
+        (names if name in BATCH_RESOURCES else unknown).append(name)
+    return names, unknown
+
+
+def _resource_query(request: web.Request, name: str) -> dict[str, str]:
+    """Return the parameters given as <resource>.<param>, e.g. solar.days=7. @zara"""
+    prefix = f"{name}."
+    return {
+        key[len(prefix):]: value
+        for key, value in request.query.items()
+        if key.startswith(prefix)
+    }
+
+
+class BatchView(HomeAssistantView):
+    """Return several resources in one response. @zara"""
+
+    url = "/api/sfml_stats/batch"
+    name = "api:sfml_stats:batch"
+    # The dashboard fetches without a token; every resource still runs through
+    # its own view and answers 401 there if it requires auth @zara
+    requires_auth = False
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Run the requested views concurrently sharing identical database reads.
+
+        There is no snapshot: the resources are not read in one transaction, and
+        a write between two reads shows in one resource but not in another. @zara
+        """
+        names, unknown = _parse_resources(request)
+        if unknown or not names:
+            return self.json(
+                {"success": False,
+                 "error": f"Unknown resources: {', '.join(unknown)}" if unknown else "No resources requested",
+                 "resources": sorted(BATCH_RESOURCES)},
+                HTTPStatus.BAD_REQUEST,
+            )
+        if len(names) > API_BATCH_MAX_RESOURCES:
+            return self.json(
+                {"success": False,
+                 "error": f"At most {API_BATCH_MAX_RESOURCES} resources per request"},
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        started = time.perf_counter()
+
+        # No read transaction: views and compiled readers share the manager's one
+        # connection with the writers, a transaction there would include their
+        # writes and end at their commit @zara
+        manager = get_manager()
+        dedupe = manager.dedupe_reads() if manager is not None else nullcontext()
+        async with dedupe:
+            results = await asyncio.gather(
+                *(
+                    async_call_view(request, API_PREFIX + name, _resource_query(request, name))
+                    for name in names
+                ),
+                return_exceptions=True,
+            )
+
+        resources: dict[str, Any] = {}
+        errors: dict[str, Any] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Batch resource %s failed: %s", name, result)
+                errors[name] = {"status": HTTPStatus.INTERNAL_SERVER_ERROR.value, "error": str(result)}
+                continue
+            status, body = result
+            if status == HTTPStatus.OK:
+                resources[name] = body
+            else:
+                error = body.get("error") if isinstance(body, dict) else None
+                errors[name] = {"status": status, "error": error}
+
+        _LOGGER.debug(
+            "Batch %s in %.1f ms (%d failed)",
+            ",".join(names),
+            (time.perf_counter() - started) * 1000,
+            len(errors),
+        )
+        return self.json({"success": not errors, "resources": resources, "errors": errors})
+
+
+async def async_setup_batch_view(hass: HomeAssistant) -> None:
+    """Register the batch endpoint. @zara"""
+    hass.http.register_view(BatchView())
@@ -0,0 +1,125 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Chart export endpoints of the compiled views, run through the render queue. @zara"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from ..charts.render_queue import JOB_DONE, RenderQueueFull, get_render_queue, render_job_key
+from ..const import RENDER_PRIORITY_INTERACTIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+# POST endpoints of the compiled views that render a chart into the response @zara
+CHART_EXPORTS: tuple[str, ...] = (
+    "export_solar_analytics",
+    "export_battery_analytics",
+    "export_house_analytics",
+    "export_grid_analytics",
+    "export_power_sources",
+    "export_weather_analytics",
+)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def _compiled_handler(app: web.Application, url: str) -> Handler | None:
+    """Return the POST handler registered on url after the queued one. @zara"""
+    handlers = [
+        route.handler
+        for route in app.router.routes()
+        if route.method == hdrs.METH_POST and route.resource is not None
+        and route.resource.canonical == url
+    ]
+    # The queued view is registered first, the compiled view right after it @zara
+    return handlers[1] if len(handlers) > 1 else None
+
+
+def _copy_response(response: Any) -> Any:
+    """Return a fresh response per waiter, a response can be sent only once. @zara"""
+    if isinstance(response, web.Response):
+        return web.Response(body=response.body, status=response.status, headers=response.headers)
+    return response
+
+
+class QueuedChartExportView(HomeAssistantView):
+    """Hand a chart export to the compiled view as a render queue job. @zara"""
+
+    # Auth is checked by the compiled view's own handler, which keeps its setting @zara
+    requires_auth = False
+
+    def __init__(self, export_name: str) -> None:
+        """Bind to one export endpoint. @zara"""
+        self.url = f"/api/sfml_stats/{export_name}"
+        self.name = f"api:sfml_stats:{export_name}_queued"
+        self._export_name = export_name
+        self._handler: Handler | None = None
+
+    async def post(self, request: web.Request) -> web.StreamResponse:
+        """Queue the export, identical pending exports share one render. @zara"""
+        if self._handler is None:
+            self._handler = _compiled_handler(request.app, self.url)
+        handler = self._handler
+        if handler is None:
+            return self.json(
+                {"success": False, "error": f"Export not available: {self._export_name}"},
+                HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+
+        # Read once here, aiohttp keeps the body for the compiled view @zara
+        body = await request.read()
+        # Anonymous requests never share the job of an authenticated one @zara
+        authenticated = bool(request.get(KEY_AUTHENTICATED, False))
+        digest = hashlib.sha256(bytes([authenticated]) + body).hexdigest()[:16]
+
+        async def _export() -> Any:
+            try:
+                return await handler(request)
+            except web.HTTPException as err:
+                # Kept as the result, so a 401 of the compiled view stays a 401 @zara
+                return err
+
+        try:
+            job = get_render_queue().submit(
+                render_job_key(f"{self._export_name}:{digest}"),
+                _export,
+                RENDER_PRIORITY_INTERACTIVE,
+            )
+        except RenderQueueFull as err:
+            response = self.json(
+                {"success": False, "error": str(err), "retry_after": err.retry_after},
+                HTTPStatus.TOO_MANY_REQUESTS,
+            )
+            response.headers["Retry-After"] = str(err.retry_after)
+            return response
+
+        await job.done.wait()
+        if job.status != JOB_DONE:
+            _LOGGER.warning("Chart export %s %s: %s", self._export_name, job.status, job.error)
+            return self.json(
+                {"success": False, "error": job.error or f"Export {job.status}"},
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+        if isinstance(job.result, web.HTTPException):
+            raise job.result
+        return _copy_response(job.result)
+
+
+async def async_setup_chart_export_views(hass: HomeAssistant) -> None:
+    """Register the queued export views, before the compiled views. @zara"""
+    for export_name in CHART_EXPORTS:
+        hass.http.register_view(QueuedChartExportView(export_name))
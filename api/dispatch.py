@@ -0,0 +1,69 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Call the integration's own HTTP views in-process, without a network round trip. @zara"""
+from __future__ import annotations
+
+import json
+import logging
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import hdrs, web
+from yarl import URL
+
+_LOGGER = logging.getLogger(__name__)
+
+API_PREFIX = "/api/sfml_stats/"
+
+
+def _route_url(path: str, query: dict[str, str] | None) -> URL | None:
+    """Return the URL of an sfml_stats route, None for anything else. @zara"""
+    url = URL(path)
+    if query:
+        url = url.update_query(query)
+    if not url.path.startswith(API_PREFIX) or url.is_absolute():
+        return None
+    return url
+
+
+def _get_handler(app: web.Application, path: str) -> Any:
+    """Return the GET handler of a route without path parameters, or None. @zara"""
+    for route in app.router.routes():
+        if route.method == hdrs.METH_GET and route.resource is not None \
+                and route.resource.canonical == path:
+            return route.handler
+    return None
+
+
+async def async_call_view(
+    request: web.Request,
+    path: str,
+    query: dict[str, str] | None = None,
+) -> tuple[int, Any]:
+    """Run the GET handler of an sfml_stats route on behalf of an incoming request. @zara"""
+    url = _route_url(path, query)
+    if url is None:
+        return HTTPStatus.BAD_REQUEST.value, {"success": False, "error": f"Not an sfml_stats route: {path}"}
+
+    handler = _get_handler(request.app, url.path)
+    if handler is None:
+        return HTTPStatus.NOT_FOUND.value, {"success": False, "error": f"Unknown route: {path}"}
+
+    # The incoming request already passed Home Assistant's middleware; the clone
+    # keeps that authentication, user and remote address, and the view wrapper
+    # still applies requires_auth to it @zara
+    try:
+        response = await handler(request.clone(method="GET", rel_url=url))
+    except web.HTTPException as err:
+        return err.status, {"success": False, "error": err.reason}
+
+    if not isinstance(response, web.Response) or response.content_type != "application/json":
+        return HTTPStatus.UNSUPPORTED_MEDIA_TYPE.value, {"success": False, "error": f"Not a JSON route: {path}"}
+    return response.status, json.loads(response.body) if response.body else None
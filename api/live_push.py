@@ -0,0 +1,289 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Websocket subscription pushing changed energy flow and summary fields. @zara"""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, Callable
+
+import aiohttp
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+from homeassistant.helpers.network import get_url
+
+from ..const import (
+    CONF_WEATHER_ENTITY,
+    DOMAIN,
+    LIVE_PUSH_FETCH_TIMEOUT_SECONDS,
+    LIVE_PUSH_INTERVAL_SECONDS,
+    LIVE_PUSH_MIN_INTERVAL_SECONDS,
+    LIVE_PUSH_REFRESH_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+LIVE_PUSH_DATA_KEY = f"{DOMAIN}_live_push"
+
+# Pushed section -> view that produces it @zara
+LIVE_VIEWS: dict[str, str] = {
+    "energy_flow": "/api/sfml_stats/energy_flow",
+    "summary": "/api/sfml_stats/summary",
+}
+
+
+async def async_fetch_view(hass: HomeAssistant, path: str) -> tuple[int, Any]:
+    """GET a view from Home Assistant's own HTTP server as an anonymous client. @zara"""
+    # The views build their data inside the compiled handlers, so the push goes
+    # through the real server: middleware and requires_auth apply as for the
+    # dashboard, which fetches the same URLs without a token @zara
+    url = get_url(hass, allow_external=False, allow_cloud=False) + path
+    # Own server, an internal certificate may not match the internal URL @zara
+    session = async_get_clientsession(hass, verify_ssl=False)
+    timeout = aiohttp.ClientTimeout(total=LIVE_PUSH_FETCH_TIMEOUT_SECONDS)
+    async with session.get(url, timeout=timeout) as response:
+        if response.content_type != "application/json":
+            return response.status, None
+        return response.status, await response.json()
+
+
+def flatten(payload: Any, prefix: tuple[str, ...] = ()) -> dict[tuple[str, ...], Any]:
+    """Flatten nested dicts to key paths, lists and empty dicts stay whole values. @zara"""
+    if not isinstance(payload, dict):
+        return {prefix: payload}
+    flat: dict[tuple[str, ...], Any] = {}
+    for key, value in payload.items():
+        # Key tuples, not dotted strings: sensor names and dates may contain dots @zara
+        path = (*prefix, str(key))
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+@dataclass
+class _Subscriber:
+    """One websocket subscription and the fields it has been sent. @zara"""
+
+    send: Callable[[dict[str, Any]], None]
+    sent: dict[tuple[str, ...], Any] = field(default_factory=dict)
+
+
+class LivePushHub:
+    """Refresh the live views on sensor changes, at most once per interval. @zara"""
+
+    def __init__(self, hass: HomeAssistant, interval: float = LIVE_PUSH_INTERVAL_SECONDS) -> None:
+        """Initialize an idle hub, tracking starts with the first subscriber. @zara"""
+        self._hass = hass
+        self.interval = max(LIVE_PUSH_MIN_INTERVAL_SECONDS, interval)
+        self._subscribers: list[_Subscriber] = []
+        self._unsub_tracking: list[CALLBACK_TYPE] = []
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._last_refresh = 0.0
+        self._last_payload: dict[str, Any] = {}
+        self._unauthorized: set[str] = set()
+        self.refreshes = 0
+        self.pushes = 0
+        self.skipped = 0
+
+    def subscribe(self, send: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Add a subscriber, the first push carries all fields. @zara"""
+        subscriber = _Subscriber(send)
+        self._subscribers.append(subscriber)
+        if len(self._subscribers) == 1:
+            self._start()
+        self._schedule()
+
+        @callback
+        def _unsubscribe() -> None:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            if not self._subscribers:
+                self._stop()
+
+        return _unsubscribe
+
+    def restart(self) -> None:
+        """Pick up changed entry configuration while subscribed. @zara"""
+        if self._subscribers:
+            self._stop()
+            self._start()
+        self._unauthorized.clear()
+
+    def _tracked_entities(self) -> list[str]:
+        """Return all sensors and the weather entity of the loaded entries. @zara"""
+        entities: set[str] = set()
+        for entry_data in self._hass.data.get(DOMAIN, {}).values():
+            config = entry_data.get("config", {}) if isinstance(entry_data, dict) else {}
+            for key, value in config.items():
+                if (key.startswith("sensor_") or key == CONF_WEATHER_ENTITY) \
+                        and isinstance(value, str) and "." in value:
+                    entities.add(value)
+        return sorted(entities)
+
+    def _start(self) -> None:
+        """Track sensor states and refresh periodically for non-sensor data. @zara"""
+        entities = self._tracked_entities()
+        if entities:
+            self._unsub_tracking.append(
+                async_track_state_change_event(self._hass, entities, self._on_state_change)
+            )
+        self._unsub_tracking.append(
+            async_track_time_interval(
+                self._hass, self._on_interval, timedelta(seconds=LIVE_PUSH_REFRESH_SECONDS)
+            )
+        )
+        _LOGGER.debug("Live push started, tracking %d entities", len(entities))
+
+    def _stop(self) -> None:
+        """Stop tracking when nobody listens. @zara"""
+        for unsub in self._unsub_tracking:
+            unsub()
+        self._unsub_tracking.clear()
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        _LOGGER.debug("Live push stopped")
+
+    @callback
+    def _on_state_change(self, event: Event) -> None:
+        """Schedule a refresh for a changed sensor. @zara"""
+        self._schedule()
+
+    @callback
+    def _on_interval(self, now: Any) -> None:
+        """Schedule the periodic refresh. @zara"""
+        self._schedule()
+
+    @callback
+    def _schedule(self) -> None:
+        """Coalesce changes into one refresh per interval. @zara"""
+        if self._cancel_timer is not None:
+            self.skipped += 1
+            return
+        delay = max(0.0, self._last_refresh + self.interval - time.monotonic())
+        self._cancel_timer = async_call_later(self._hass, delay, self._on_timer)
+
+    @callback
+    def _on_timer(self, now: Any) -> None:
+        """Run the scheduled refresh. @zara"""
+        self._cancel_timer = None
+        self._hass.async_create_task(self._async_refresh())
+
+    async def _async_refresh(self) -> None:
+        """Call the live views once and push each subscriber its changes. @zara"""
+        self._last_refresh = time.monotonic()
+        if not self._subscribers:
+            return
+        self.refreshes += 1
+
+        # A failed view keeps its last values instead of reporting them removed.
+        # Read anonymously, so subscribers get no more than the dashboard may fetch @zara
+        payload = dict(self._last_payload)
+        for section, path in LIVE_VIEWS.items():
+            if path in self._unauthorized:
+                continue
+            try:
+                status, body = await async_fetch_view(self._hass, path)
+            except Exception as err:
+                _LOGGER.debug("Live push could not read %s: %s", path, err)
+                continue
+            if status == HTTPStatus.UNAUTHORIZED:
+                # Each anonymous 401 counts as a failed login, so stop asking @zara
+                self._unauthorized.add(path)
+                _LOGGER.warning(
+                    "Live push stopped for %s: the view requires auth (HTTP 401), "
+                    "%s is no longer pushed until the configuration is reloaded",
+                    path, section,
+                )
+            elif status == HTTPStatus.OK and isinstance(body, dict):
+                payload[section] = body
+            else:
+                _LOGGER.debug("Live push got HTTP %s from %s", status, path)
+        if not payload:
+            return
+        self._last_payload = payload
+
+        current = flatten(payload)
+        for subscriber in list(self._subscribers):
+            changed = {
+                key: value for key, value in current.items()
+                if key not in subscriber.sent or subscriber.sent[key] != value
+            }
+            removed = [key for key in subscriber.sent if key not in current]
+            if not changed and not removed:
+                continue
+            subscriber.sent = current
+            # Paths as arrays, the client applies removed before changed @zara
+            subscriber.send({
+                "changed": [[list(key), value] for key, value in changed.items()],
+                "removed": [list(key) for key in removed],
+            })
+            self.pushes += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return subscriber and push counters. @zara"""
+        return {
+            "subscribers": len(self._subscribers),
+            "interval": self.interval,
+            "refreshes": self.refreshes,
+            "pushes": self.pushes,
+            "coalesced": self.skipped,
+            "unauthorized": sorted(self._unauthorized),
+        }
+
+
+def get_live_push_hub(hass: HomeAssistant) -> LivePushHub:
+    """Return the hub of this Home Assistant instance. @zara"""
+    hub = hass.data.get(LIVE_PUSH_DATA_KEY)
+    if hub is None:
+        hub = hass.data[LIVE_PUSH_DATA_KEY] = LivePushHub(hass)
+    return hub
+
+
+def configure_live_push(hass: HomeAssistant, interval: float) -> None:
+    """Set the minimum seconds between two pushes. @zara"""
+    hub = get_live_push_hub(hass)
+    hub.interval = max(LIVE_PUSH_MIN_INTERVAL_SECONDS, float(interval))
+    hub.restart()
+
+
+@websocket_api.websocket_command({vol.Required("type"): "sfml_stats/subscribe_live"})
+@callback
+def ws_subscribe_live(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to energy flow and summary changes. @zara"""
+    msg_id = msg["id"]
+
+    @callback
+    def _send(update: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg_id, update))
+
+    connection.subscriptions[msg_id] = get_live_push_hub(hass).subscribe(_send)
+    connection.send_result(msg_id)
+
+
+async def async_setup_live_push(hass: HomeAssistant) -> None:
+    """Register the live push websocket command. @zara"""
+    websocket_api.async_register_command(hass, ws_subscribe_live)
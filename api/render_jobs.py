@@ -0,0 +1,180 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""HTTP endpoints for submitting and polling chart render jobs. @zara"""
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from ..charts.postprocess import postprocess_stats, webp_variant
+from ..charts.render_cache import get_render_cache_stats
+from ..charts.render_queue import JOB_DONE, RenderQueueFull, get_render_queue, render_job_key
+from ..charts.styles import get_asset_cache
+from ..charts.warmup import render_timings
+from ..const import DOMAIN, RENDER_PRIORITY_INTERACTIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Charts that can be rendered from the validator alone @zara
+RENDERABLE_CHARTS: dict[str, str] = {
+    "forecast_comparison": "ForecastComparisonChart",
+}
+
+
+def _get_validator(hass: HomeAssistant) -> Any:
+    """Return the DataValidator of the first loaded entry. @zara"""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("validator") is not None:
+            return entry_data["validator"]
+    return None
+
+
+class RenderJobsView(HomeAssistantView):
+    """Submit a chart render job. @zara"""
+
+    url = "/api/sfml_stats/render_jobs"
+    name = "api:sfml_stats:render_jobs"
+    # The dashboard sends the token of the panel's Home Assistant connection @zara
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return queue and post-processing statistics. @zara"""
+        return self.json({
+            "success": True,
+            "queue": get_render_queue().stats(),
+            "postprocess": postprocess_stats.as_dict(),
+        })
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Queue a render, answering 202 with the job or 429 when full. @zara"""
+        try:
+            body = await request.json()
+        except ValueError:
+            body = {}
+
+        chart_name = body.get("chart")
+        class_name = RENDERABLE_CHARTS.get(chart_name)
+        if class_name is None:
+            return self.json(
+                {"success": False, "error": f"Unknown chart: {chart_name}",
+                 "charts": sorted(RENDERABLE_CHARTS)},
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        hass: HomeAssistant = request.app["hass"]
+        validator = _get_validator(hass)
+        if validator is None:
+            return self.json(
+                {"success": False, "error": "Integration not loaded"},
+                HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+
+        preview = bool(body.get("preview", False))
+
+        async def _render() -> Any:
+            from .. import charts
+            from ..charts.data_keys import async_chart_data_key
+
+            chart = getattr(charts, class_name)(validator)
+            data_key = await async_chart_data_key(chart_name, validator)
+            return await chart.save(preview=preview, data_key=data_key)
+
+        queue = get_render_queue()
+        try:
+            job = queue.submit(render_job_key(chart_name, preview), _render, RENDER_PRIORITY_INTERACTIVE)
+        except RenderQueueFull as err:
+            response = self.json(
+                {"success": False, "error": str(err), "retry_after": err.retry_after},
+                HTTPStatus.TOO_MANY_REQUESTS,
+            )
+            response.headers["Retry-After"] = str(err.retry_after)
+            return response
+
+        return self.json({"success": True, "job": job.as_dict()}, HTTPStatus.ACCEPTED)
+
+
+class RenderJobStatusView(HomeAssistantView):
+    """Poll the status of a render job. @zara"""
+
+    url = "/api/sfml_stats/render_jobs/{job_id}"
+    name = "api:sfml_stats:render_job_status"
+    requires_auth = True
+
+    async def get(self, request: web.Request, job_id: str) -> web.Response:
+        """Return the job status or 404. @zara"""
+        job = get_render_queue().get_job(job_id)
+        if job is None:
+            return self.json(
+                {"success": False, "error": f"Unknown job: {job_id}"},
+                HTTPStatus.NOT_FOUND,
+            )
+        return self.json({"success": True, "job": job.as_dict()})
+
+
+class RenderJobImageView(HomeAssistantView):
+    """Serve the PNG of a finished render job. @zara"""
+
+    url = "/api/sfml_stats/render_jobs/{job_id}/image"
+    name = "api:sfml_stats:render_job_image"
+    # Loaded through <img src>, which cannot send a token @zara
+    requires_auth = False
+
+    async def get(self, request: web.Request, job_id: str) -> web.StreamResponse:
+        """Return the rendered file as WebP when accepted, 404 while the job has none. @zara"""
+        job = get_render_queue().get_job(job_id)
+        if job is None or job.status != JOB_DONE or not isinstance(job.result, Path):
+            return self.json(
+                {"success": False, "error": f"No image for job: {job_id}"},
+                HTTPStatus.NOT_FOUND,
+            )
+        hass: HomeAssistant = request.app["hass"]
+        if not await hass.async_add_executor_job(job.result.is_file):
+            return self.json(
+                {"success": False, "error": f"Image of job {job_id} was removed"},
+                HTTPStatus.NOT_FOUND,
+            )
+        path = job.result
+        if "image/webp" in request.headers.get("Accept", ""):
+            # Written by the post-processing, which may still be running @zara
+            path = await hass.async_add_executor_job(webp_variant, path) or path
+        return web.FileResponse(path, headers={"Cache-Control": "no-cache", "Vary": "Accept"})
+
+
+class RenderStatsView(HomeAssistantView):
+    """Diagnostics of the chart renderer. @zara"""
+
+    url = "/api/sfml_stats/render_stats"
+    name = "api:sfml_stats:render_stats"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return render cache hits/misses, render timings and asset cache usage. @zara"""
+        return self.json({
+            "success": True,
+            "render_cache": get_render_cache_stats(),
+            "timings": render_timings.as_dict(),
+            "asset_cache": get_asset_cache().stats(),
+            "postprocess": postprocess_stats.as_dict(),
+            "queue": get_render_queue().stats(),
+        })
+
+
+async def async_setup_render_job_views(hass: HomeAssistant) -> None:
+    """Register the render job endpoints. @zara"""
+    hass.http.register_view(RenderJobsView())
+    hass.http.register_view(RenderJobStatusView())
+    hass.http.register_view(RenderJobImageView())
+    hass.http.register_view(RenderStatsView())
@@ -0,0 +1,86 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Streaming CSV export of the monthly tariffs. @zara"""
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+from ..services.monthly_tariff_manager import CSV_GRANULARITIES, CSV_GRANULARITY_MONTH
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_tariff_manager(hass: HomeAssistant) -> Any:
+    """Return the MonthlyTariffManager of the first loaded entry. @zara"""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("monthly_tariff_manager") is not None:
+            return entry_data["monthly_tariff_manager"]
+    return None
+
+
+def _parse_month(value: str) -> tuple[int, int]:
+    """Parse YYYY-MM into year and month. @zara"""
+    year, month = (int(part) for part in value.split("-", 1))
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month: {value}")
+    return year, month
+
+
+class TariffCsvExportView(HomeAssistantView):
+    """Stream monthly, daily or hourly tariff rows as CSV. @zara"""
+
+    # Same URL as the export of the compiled views, which only knows months.
+    # Registered before them, so this view answers it; without ?granularity
+    # the output is the monthly CSV as before @zara
+    url = "/api/sfml_stats/monthly_tariffs/export"
+    name = "api:sfml_stats:monthly_tariffs_export"
+    # The tariff page downloads through a path signed with auth/sign_path @zara
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream ?start=YYYY-MM&end=YYYY-MM&granularity=month|day|hour. @zara"""
+        granularity = request.query.get("granularity", CSV_GRANULARITY_MONTH)
+        try:
+            start_year, start_month = _parse_month(request.query["start"])
+            end_year, end_month = _parse_month(request.query["end"])
+        except (KeyError, ValueError):
+            return self.json(
+                {"success": False, "error": "start and end must be given as YYYY-MM"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        if granularity not in CSV_GRANULARITIES:
+            return self.json(
+                {"success": False, "error": f"Unknown granularity: {granularity}",
+                 "granularities": list(CSV_GRANULARITIES)},
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        manager = _get_tariff_manager(request.app["hass"])
+        if manager is None:
+            return self.json(
+                {"success": False, "error": "Integration not loaded"},
+                HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+
+        return await manager.stream_csv(
+            request, start_year, start_month, end_year, end_month, granularity
+        )
+
+
+async def async_setup_tariff_export_view(hass: HomeAssistant) -> None:
+    """Register the streaming CSV export, before async_setup_views. @zara"""
+    hass.http.register_view(TariffCsvExportView())
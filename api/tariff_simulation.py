@@ -0,0 +1,98 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""What-if tariff simulation over the hourly billing history. @zara"""
+from __future__ import annotations
+
+import logging
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from ..const import API_TARIFF_SIMULATION_MAX_SCENARIOS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_tariff_manager(hass: HomeAssistant) -> Any:
+    """Return the MonthlyTariffManager of the first loaded entry. @zara"""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("monthly_tariff_manager") is not None:
+            return entry_data["monthly_tariff_manager"]
+    return None
+
+
+def _optional_year(value: Any) -> int | None:
+    """Return a year given as int or digit string, None if absent. @zara"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"Invalid year: {value!r}")
+    return int(value)
+
+
+class TariffSimulationView(HomeAssistantView):
+    """Compare tariff scenarios over the full hourly history. @zara"""
+
+    url = "/api/sfml_stats/monthly_tariffs/simulate"
+    name = "api:sfml_stats:monthly_tariffs_simulate"
+    requires_auth = True
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Simulate {"scenarios": [...], "start_year": 2023, "end_year": 2025}. @zara"""
+        try:
+            body = await request.json()
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {}
+
+        # Without scenarios the configured dynamic, fixed and EEG tariffs are compared @zara
+        scenarios = body.get("scenarios")
+        if scenarios is not None and (
+            not isinstance(scenarios, list)
+            or not all(isinstance(scenario, dict) for scenario in scenarios)
+        ):
+            return self.json(
+                {"success": False, "error": "scenarios must be a list of objects"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        if scenarios is not None and len(scenarios) > API_TARIFF_SIMULATION_MAX_SCENARIOS:
+            return self.json(
+                {"success": False,
+                 "error": f"At most {API_TARIFF_SIMULATION_MAX_SCENARIOS} scenarios per request"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        try:
+            start_year = _optional_year(body.get("start_year"))
+            end_year = _optional_year(body.get("end_year"))
+        except ValueError as err:
+            return self.json({"success": False, "error": str(err)}, HTTPStatus.BAD_REQUEST)
+
+        manager = _get_tariff_manager(request.app["hass"])
+        if manager is None:
+            return self.json(
+                {"success": False, "error": "Integration not loaded"},
+                HTTPStatus.SERVICE_UNAVAILABLE,
+            )
+
+        try:
+            result = await manager.simulate_tariffs(scenarios, start_year, end_year)
+        except (TypeError, ValueError) as err:
+            # A scenario price that is not a number @zara
+            return self.json({"success": False, "error": str(err)}, HTTPStatus.BAD_REQUEST)
+        return self.json(result)
+
+
+async def async_setup_tariff_simulation_view(hass: HomeAssistant) -> None:
+    """Register the tariff simulation endpoint. @zara"""
+    hass.http.register_view(TariffSimulationView())
@@ -0,0 +1,126 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""HTTP endpoints for the weather analytics engines. @zara"""
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN, WEATHER_ANALYTICS_MAX_DAYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_weather_collector(hass: HomeAssistant) -> Any:
+    """Return the WeatherDataCollector of the first loaded entry. @zara"""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and entry_data.get("weather_collector") is not None:
+            return entry_data["weather_collector"]
+    return None
+
+
+def _unavailable(view: HomeAssistantView) -> web.Response:
+    """Answer 503 while the weather collector is not set up. @zara"""
+    return view.json(
+        {"success": False, "error": "Weather collector not available"},
+        HTTPStatus.SERVICE_UNAVAILABLE,
+    )
+
+
+class WeatherAccuracyView(HomeAssistantView):
+    """Hour-aligned MAE, RMSE and bias of the weather forecast. @zara"""
+
+    url = "/api/sfml_stats/weather_accuracy"
+    name = "api:sfml_stats:weather_accuracy"
+    # Read-only dashboard data, fetched by the panel like the other views @zara
+    requires_auth = False
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return accuracy for ?start=&end= (ISO dates) or the last ?days=30. @zara"""
+        try:
+            if "start" in request.query:
+                start_date = date.fromisoformat(request.query["start"])
+                end_date = date.fromisoformat(request.query.get("end", date.today().isoformat()))
+            else:
+                days = max(1, min(int(request.query.get("days", 30)), WEATHER_ANALYTICS_MAX_DAYS))
+                end_date = date.today()
+                start_date = end_date - timedelta(days=days - 1)
+        except ValueError:
+            return self.json(
+                {"success": False, "error": "start/end must be ISO dates, days an integer"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        if start_date > end_date:
+            return self.json(
+                {"success": False, "error": "start must not be after end"},
+                HTTPStatus.BAD_REQUEST,
+            )
+        if (end_date - start_date).days + 1 > WEATHER_ANALYTICS_MAX_DAYS:
+            return self.json(
+                {"success": False,
+                 "error": f"At most {WEATHER_ANALYTICS_MAX_DAYS} days per request"},
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        collector = _get_weather_collector(request.app["hass"])
+        if collector is None:
+            return _unavailable(self)
+        return self.json(await collector.get_forecast_accuracy(start_date, end_date))
+
+
+class RadiationYieldView(HomeAssistantView):
+    """Fitted kWh per kWh/m² with residuals and outlier days. @zara"""
+
+    url = "/api/sfml_stats/weather_radiation_yield"
+    name = "api:sfml_stats:weather_radiation_yield"
+    requires_auth = False
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the cached fit with residuals of the last ?days=30. @zara"""
+        try:
+            days = max(0, min(int(request.query.get("days", 30)), WEATHER_ANALYTICS_MAX_DAYS))
+        except ValueError:
+            return self.json(
+                {"success": False, "error": "days must be an integer"},
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        collector = _get_weather_collector(request.app["hass"])
+        if collector is None:
+            return _unavailable(self)
+        return self.json(await collector.get_radiation_yield(days))
+
+
+class WeatherLatencyView(HomeAssistantView):
+    """Diagnostics: critical-path trace of the latest weather loads. @zara"""
+
+    url = "/api/sfml_stats/weather_latency"
+    name = "api:sfml_stats:weather_latency"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the span timings of each traced collector method. @zara"""
+        collector = _get_weather_collector(request.app["hass"])
+        if collector is None:
+            return _unavailable(self)
+        return self.json({"success": True, "traces": collector.get_latency_traces()})
+
+
+async def async_setup_weather_analytics_views(hass: HomeAssistant) -> None:
+    """Register the weather analytics endpoints. @zara"""
+    hass.http.register_view(WeatherAccuracyView())
+    hass.http.register_view(RadiationYieldView())
+    hass.http.register_view(WeatherLatencyView())
@@ -0,0 +1,36 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Load SFML Stats modules for benchmarks without starting Home Assistant. @zara"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_NAME = "sfml_stats"
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load(module: str, subpackages: tuple[str, ...] = ()) -> types.ModuleType:
+    """Import a module of the integration without running its __init__ files. @zara"""
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(PACKAGE_ROOT)]
+        sys.modules[PACKAGE_NAME] = package
+
+    for name in subpackages:
+        full_name = f"{PACKAGE_NAME}.{name}"
+        if full_name not in sys.modules:
+            subpackage = types.ModuleType(full_name)
+            subpackage.__path__ = [str(PACKAGE_ROOT / name)]
+            sys.modules[full_name] = subpackage
+
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
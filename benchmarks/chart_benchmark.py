@@ -0,0 +1,447 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Render every chart type on synthetic week, month and year data. @zara
+
+Usage: python benchmarks/chart_benchmark.py [--runs 3] [--scales week,month,year]
+           [--charts weekly_report,...] [--output report.json] [--compare old.json]
+           [--real --config-dir /config]
+
+Each case runs in a fresh process so peak RSS belongs to that case alone.
+render_ms times save() only, the dataset is built beforehand. The
+background PNG post-processing is reported apart as postprocess_ms.
+The JSON report is sorted and stable, so two versions can be diffed.
+
+The chart modules are compiled and read their data through the readers,
+so synthetic data cannot be fed into them directly. The default mode
+renders a synthetic driver per chart that reproduces its layout with the
+shared BaseChart pipeline and style helpers. --real renders the real
+classes against the data of an existing Home Assistant config directory.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import _bootstrap  # noqa: E402
+
+SCALES = {"week": 7, "month": 30, "year": 365}
+
+# Chart module name -> figure size of the synthetic driver @zara
+CHARTS = {
+    "weekly_report": (16, 20),
+    "forecast_comparison": (14, 8),
+    "solar_analytics": (16, 10),
+    "battery_analytics": (16, 10),
+    "grid_analytics": (16, 10),
+    "house_analytics": (16, 10),
+    "weather_analytics": (16, 12),
+    "power_sources": (16, 10),
+    "panel_seasonal_report": (16, 12),
+}
+
+
+class _Validator:
+    """Minimal stand-in for DataValidator export paths. @zara"""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def get_export_path(self, subpath: str = "") -> Path:
+        path = self._root / subpath
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+def make_dataset(days: int, seed: int = 42) -> dict[str, Any]:
+    """Generate hourly energy, price, weather and forecast series. @zara"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    hours = days * 24
+    start = date.today() - timedelta(days=days)
+    hour_of_day = np.tile(np.arange(24), days)
+    day_of_year = np.repeat(
+        [(start + timedelta(days=d)).timetuple().tm_yday for d in range(days)], 24
+    )
+    season = np.cos((day_of_year - 172) / 365 * 2 * np.pi)
+    daylight = np.clip(np.sin((hour_of_day - 6) / 12 * np.pi), 0, None)
+    clouds = np.clip(rng.normal(50, 30, hours), 0, 100)
+
+    radiation = 900 * daylight * (0.6 + 0.4 * season) * (1 - clouds / 130)
+    solar = radiation / 1000 * 8.5 * rng.uniform(0.85, 1.0, hours)
+    consumption = 0.4 + 0.6 * rng.random(hours) + 1.2 * ((hour_of_day >= 17) & (hour_of_day <= 21))
+    surplus = solar - consumption
+    soc = np.clip(np.cumsum(surplus * 8) % 100, 5, 100)
+    grid_export = np.clip(surplus, 0, None) * (soc > 95)
+    grid_import = np.clip(-surplus, 0, None) * (soc < 10)
+
+    actual_daily = solar.reshape(days, 24).sum(axis=1)
+    forecasts = {
+        name: actual_daily * rng.normal(1.0, spread, days)
+        for name, spread in (("sfml", 0.08), ("external_1", 0.15), ("external_2", 0.2))
+    }
+
+    return {
+        "days": days,
+        "dates": [start + timedelta(days=d) for d in range(days)],
+        "hour_of_day": hour_of_day,
+        "solar_kw": solar,
+        "consumption_kw": consumption,
+        "battery_soc": soc,
+        "grid_import_kw": grid_import,
+        "grid_export_kw": grid_export,
+        "price_ct": 25 + 8 * np.sin(hour_of_day / 24 * 2 * np.pi) + rng.normal(0, 3, hours),
+        "temperature_c": 10 + 8 * season + 5 * daylight + rng.normal(0, 1.5, hours),
+        "radiation_wm2": radiation,
+        "cloud_cover": clouds,
+        "actual_daily": actual_daily,
+        "forecast_daily": forecasts,
+        "panels": {
+            f"Panel {n}": solar * share
+            for n, share in ((1, 0.45), (2, 0.35), (3, 0.2))
+        },
+    }
+
+
+def _driver_class(base: Any, styles: Any) -> type:
+    """Build the synthetic BaseChart subclass on the loaded modules. @zara"""
+
+    class SyntheticChart(base.BaseChart):
+        """Draw the layout of one chart type from a synthetic dataset. @zara"""
+
+        def __init__(self, validator: Any, chart: str, data: dict[str, Any]) -> None:
+            super().__init__(validator, figsize=CHARTS[chart])
+            self._chart = chart
+            self._data = data
+
+        def get_filename(self, **kwargs: Any) -> str:
+            return f"{self._chart}_{self._data['days']}d.png"
+
+        async def generate(self, **kwargs: Any):
+            return await self._run_in_executor(getattr(self, f"_draw_{self._chart}"))
+
+        def _lines(self, ax: Any, series: dict[str, Any], title: str) -> None:
+            colors = [self.styles.solar_yellow, self.styles.neon_cyan,
+                      self.styles.neon_pink, self.styles.neon_green]
+            for (label, values), color in zip(series.items(), colors):
+                x = range(len(values))
+                styles.add_glow_effect(ax, x, values, color)
+                ax.plot(x, values, color=color, linewidth=1.5, label=label)
+            ax.legend(loc="upper right", fontsize=8)
+            self._add_title(ax, title)
+
+        def _daily_bars(self, ax: Any, values: Any, color: str, title: str) -> None:
+            for i, value in enumerate(values):
+                styles.draw_rounded_bar(ax, i, float(value), 0.7, color)
+            ax.set_xlim(-1, len(values))
+            ax.set_ylim(0, float(max(values)) * 1.15 if len(values) else 1)
+            self._add_title(ax, title)
+
+        def _heatmap(self, ax: Any, values: Any, cmap: Any, title: str) -> None:
+            days = self._data["days"]
+            image = ax.imshow(values.reshape(days, 24).T, aspect="auto", cmap=cmap, origin="lower")
+            ax.figure.colorbar(image, ax=ax, fraction=0.03)
+            self._add_title(ax, title)
+
+        def _finish(self, fig: Any, ax: Any, kpis: dict[str, Any]) -> Any:
+            self._add_kpi_box(ax, kpis)
+            self._add_footer(fig)
+            return fig
+
+        def _draw_weekly_report(self) -> Any:
+            d = self._data
+            fig, axes = self._create_figure(4, 2)
+            self._daily_bars(axes[0, 0], d["actual_daily"], self.styles.solar_yellow, "Produktion")
+            self._lines(axes[0, 1], {"IST": d["actual_daily"], **d["forecast_daily"]}, "Prognose")
+            self._lines(axes[1, 0], {"Preis": d["price_ct"]}, "Strompreis")
+            self._lines(axes[1, 1], {"SOC": d["battery_soc"]}, "Batterie")
+            axes[2, 0].stackplot(range(len(d["solar_kw"])), d["solar_kw"], d["grid_import_kw"],
+                                 colors=[self.styles.solar_orange, self.styles.neon_pink], alpha=0.7)
+            self._add_title(axes[2, 0], "Verbrauch")
+            error = abs(d["forecast_daily"]["sfml"] - d["actual_daily"])
+            self._daily_bars(axes[2, 1], error, self.styles.neon_purple, "Abweichung")
+            self._lines(axes[3, 0], {"Temperatur": d["temperature_c"]}, "Wetter")
+            self._heatmap(axes[3, 1], d["radiation_wm2"], styles.create_solar_colormap(), "Strahlung")
+            return self._finish(fig, axes[0, 0], {"Summe": self._format_kwh(d["actual_daily"].sum())})
+
+        def _draw_forecast_comparison(self) -> Any:
+            d = self._data
+            fig, (top, bottom) = self._create_figure(2, 1)
+            self._lines(top, {"IST": d["actual_daily"], **d["forecast_daily"]}, "Prognosevergleich")
+            for offset, values in enumerate(d["forecast_daily"].values()):
+                bottom.bar([i + offset * 0.25 for i in range(len(values))],
+                           values - d["actual_daily"], width=0.25)
+            self._add_title(bottom, "Fehler")
+            return self._finish(fig, top, {"Tage": d["days"]})
+
+        def _draw_solar_analytics(self) -> Any:
+            d = self._data
+            fig, axes = self._create_figure(2, 2)
+            self._heatmap(axes[0, 0], d["solar_kw"], styles.create_solar_colormap(), "Leistung")
+            self._daily_bars(axes[0, 1], d["actual_daily"], self.styles.solar_yellow, "Ertrag")
+            self._lines(axes[1, 0], {"Kumuliert": d["actual_daily"].cumsum()}, "Kumuliert")
+            profile = d["solar_kw"].reshape(d["days"], 24).mean(axis=0)
+            self._daily_bars(axes[1, 1], profile, self.styles.solar_orange, "Tagesprofil")
+            return self._finish(fig, axes[0, 0], {"Max": self._format_kwh(d["actual_daily"].max())})
+
+        def _draw_battery_analytics(self) -> Any:
+            d = self._data
+            fig, (top, bottom) = self._create_figure(2, 1)
+            self._lines(top, {"SOC": d["battery_soc"]}, "Ladezustand")
+            flow = d["solar_kw"] - d["consumption_kw"]
+            bottom.bar(range(len(flow)), flow, color=[
+                self.styles.neon_green if v > 0 else self.styles.neon_pink for v in flow
+            ])
+            self._add_title(bottom, "Laden / Entladen")
+            return self._finish(fig, top, {"Min SOC": self._format_percent(d["battery_soc"].min())})
+
+        def _draw_grid_analytics(self) -> Any:
+            d = self._data
+            fig, (top, bottom) = self._create_figure(2, 1)
+            days = d["days"]
+            self._daily_bars(top, d["grid_import_kw"].reshape(days, 24).sum(axis=1),
+                             self.styles.neon_pink, "Netzbezug")
+            bottom.scatter(d["price_ct"], d["grid_import_kw"], s=4,
+                           c=d["price_ct"], cmap=styles.create_price_colormap())
+            self._add_title(bottom, "Preis / Bezug")
+            return self._finish(fig, top, {"Preis": self._format_price(d["price_ct"].mean())})
+
+        def _draw_house_analytics(self) -> Any:
+            d = self._data
+            fig, (top, bottom) = self._create_figure(2, 1)
+            own = d["consumption_kw"] - d["grid_import_kw"]
+            top.stackplot(range(len(own)), own, d["grid_import_kw"],
+                          colors=[self.styles.solar_yellow, self.styles.neon_pink], alpha=0.7)
+            self._add_title(top, "Hausverbrauch")
+            profile = d["consumption_kw"].reshape(d["days"], 24).mean(axis=0)
+            self._daily_bars(bottom, profile, self.styles.neon_cyan, "Tagesprofil")
+            return self._finish(fig, top, {"Summe": self._format_kwh(d["consumption_kw"].sum())})
+
+        def _draw_weather_analytics(self) -> Any:
+            d = self._data
+            fig, axes = self._create_figure(2, 2)
+            self._lines(axes[0, 0], {"Temperatur": d["temperature_c"]}, "Temperatur")
+            axes[0, 1].fill_between(range(len(d["radiation_wm2"])), d["radiation_wm2"],
+                                    color=self.styles.solar_orange, alpha=0.5)
+            self._add_title(axes[0, 1], "Strahlung")
+            self._heatmap(axes[1, 0], d["cloud_cover"], "Blues", "Bewölkung")
+            axes[1, 1].scatter(d["radiation_wm2"], d["solar_kw"], s=3, color=self.styles.neon_cyan)
+            self._add_title(axes[1, 1], "Strahlung / Ertrag")
+            return self._finish(fig, axes[0, 0], {"Mittel": f"{d['temperature_c'].mean():.1f} °C"})
+
+        def _draw_power_sources(self) -> Any:
+            d = self._data
+            fig, (top, bottom) = self._create_figure(1, 2)
+            battery = (d["consumption_kw"] - d["solar_kw"]).clip(0) - d["grid_import_kw"]
+            top.stackplot(range(len(battery)), d["solar_kw"], battery.clip(0), d["grid_import_kw"],
+                          colors=[self.styles.solar_yellow, self.styles.neon_green,
+                                  self.styles.neon_pink], alpha=0.7)
+            self._add_title(top, "Energiequellen")
+            bottom.pie([d["solar_kw"].sum(), battery.clip(0).sum() + 0.1, d["grid_import_kw"].sum() + 0.1],
+                       labels=["Solar", "Batterie", "Netz"])
+            return self._finish(fig, top, {"Autarkie": self._format_percent(72.5)})
+
+        def _draw_panel_seasonal_report(self) -> Any:
+            d = self._data
+            fig, axes = self._create_figure(len(d["panels"]), 2)
+            for row, (name, values) in enumerate(d["panels"].items()):
+                daily = values.reshape(d["days"], 24).sum(axis=1)
+                self._daily_bars(axes[row, 0], daily, self.styles.solar_gold, name)
+                self._heatmap(axes[row, 1], values, styles.create_solar_colormap(), f"{name} Stunden")
+            return self._finish(fig, axes[0, 0], {"Panels": len(d["panels"])})
+
+    return SyntheticChart
+
+
+def _find_chart_class(module: Any, base: Any) -> type:
+    """Return the BaseChart subclass defined in a chart module. @zara"""
+    for obj in vars(module).values():
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, base.BaseChart)
+            and obj is not base.BaseChart
+            and obj.__module__ == module.__name__
+        ):
+            return obj
+    raise LookupError(f"No chart class in {module.__name__}")
+
+
+async def _render_case(
+    chart: str,
+    data: dict[str, Any] | None,
+    export_root: Path,
+    config_dir: str | None,
+) -> tuple[Path, dict[str, float]]:
+    """Render one chart once, timing render and post-processing apart. @zara"""
+    base = _bootstrap.load("charts.base", ("charts",))
+    styles = _bootstrap.load("charts.styles", ("charts",))
+    styles.apply_dark_theme()
+
+    if data is None:
+        from types import SimpleNamespace
+
+        # Compiled modules import the PyArmor runtime from the package root @zara
+        if str(_bootstrap.PACKAGE_ROOT) not in sys.path:
+            sys.path.insert(0, str(_bootstrap.PACKAGE_ROOT))
+        data_validator = _bootstrap.load("storage.data_validator", ("storage",))
+        root = Path(config_dir)
+        hass = SimpleNamespace(config=SimpleNamespace(path=lambda *parts: str(root.joinpath(*parts))))
+        validator = data_validator.DataValidator(hass)
+        await validator.async_initialize()
+        module = _bootstrap.load(f"charts.{chart}", ("charts",))
+        instance = _find_chart_class(module, base)(validator)
+    else:
+        instance = _driver_class(base, styles)(_Validator(export_root), chart, data)
+
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    path = await instance.save()
+    timings = {
+        "render": time.perf_counter() - wall_started,
+        "cpu": time.process_time() - cpu_started,
+    }
+    postprocess_started = time.perf_counter()
+    await asyncio.gather(*base._POSTPROCESS_TASKS)
+    timings["postprocess"] = time.perf_counter() - postprocess_started
+    return path, timings
+
+
+def run_case(chart: str, scale: str, runs: int, real: bool, config_dir: str | None) -> dict[str, Any]:
+    """Measure one chart and scale (runs in its own process). @zara"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    days = SCALES[scale]
+    result: dict[str, Any] = {"chart": chart, "scale": scale, "days": days}
+    timings: dict[str, list[float]] = {"render": [], "cpu": [], "postprocess": []}
+
+    try:
+        # Built once and outside the timed region @zara
+        data = None if real else make_dataset(days)
+        for _ in range(runs):
+            # Fresh export directory, otherwise the render cache skips the work @zara
+            with tempfile.TemporaryDirectory() as tmp:
+                path, run = asyncio.run(_render_case(chart, data, Path(tmp), config_dir))
+                for key, value in run.items():
+                    timings[key].append(value)
+                result["output_bytes"] = path.stat().st_size
+                webp = path.with_suffix(".webp")
+                result["webp_bytes"] = webp.stat().st_size if webp.exists() else None
+    except Exception as err:
+        result["status"] = f"error: {type(err).__name__}: {err}"
+        return result
+
+    def _median_ms(values: list[float]) -> float:
+        # The first run pays for imports and font loading @zara
+        return round(statistics.median(values[1:] or values) * 1000, 1)
+
+    result.update({
+        "status": "ok",
+        "first_render_ms": round(timings["render"][0] * 1000, 1),
+        "render_ms": _median_ms(timings["render"]),
+        "cpu_ms": _median_ms(timings["cpu"]),
+        "postprocess_ms": _median_ms(timings["postprocess"]),
+        # ru_maxrss is KiB on Linux and bytes on macOS @zara
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            / (1024 * 1024 if sys.platform == "darwin" else 1024), 1
+        ),
+    })
+    return result
+
+
+def _compare(report: dict[str, Any], old_path: Path) -> None:
+    """Print wall time, RSS and size deltas against an older report. @zara"""
+    old_report = json.loads(old_path.read_text())
+    old = {(r["chart"], r["scale"]): r for r in old_report["results"]}
+    print(f"\nCompared with {old_path} (version {old_report.get('version', '?')})")
+    for result in report["results"]:
+        before = old.get((result["chart"], result["scale"]))
+        if not before or result["status"] != "ok" or before.get("status") != "ok":
+            continue
+        deltas = []
+        for key in ("render_ms", "postprocess_ms", "cpu_ms", "peak_rss_mb", "output_bytes"):
+            if before.get(key):
+                deltas.append(f"{key} {(result[key] / before[key] - 1) * 100:+.1f}%")
+        print(f"  {result['chart']:<22} {result['scale']:<6} " + "  ".join(deltas))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scales", default=",".join(SCALES))
+    parser.add_argument("--charts", default=",".join(CHARTS))
+    parser.add_argument("--output", type=Path, default=Path("chart_benchmark.json"))
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--real", action="store_true", help="render the compiled chart classes")
+    parser.add_argument("--config-dir", help="Home Assistant config directory for --real")
+    args = parser.parse_args()
+
+    if args.real and not args.config_dir:
+        parser.error("--real needs --config-dir")
+
+    const = _bootstrap.load("const")
+    import matplotlib
+
+    report: dict[str, Any] = {
+        "version": const.VERSION,
+        "mode": "real" if args.real else "synthetic",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "matplotlib": matplotlib.__version__,
+        "machine": platform.machine(),
+        "runs": args.runs,
+        "results": [],
+    }
+
+    cases = [
+        (chart, scale)
+        for chart in args.charts.split(",")
+        for scale in args.scales.split(",")
+    ]
+    for chart, scale in cases:
+        # spawn, so no case inherits memory from the parent or an earlier case @zara
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            result = pool.submit(run_case, chart, scale, args.runs, args.real, args.config_dir).result()
+        report["results"].append(result)
+        if result["status"] == "ok":
+            print(
+                f"{chart:<22} {scale:<6} render {result['render_ms']:8.1f} ms  cpu {result['cpu_ms']:8.1f} ms"
+                f"  post {result['postprocess_ms']:8.1f} ms  first {result['first_render_ms']:8.1f} ms"
+                f"  rss {result['peak_rss_mb']:6.1f} MB"
+                f"  png {result['output_bytes'] / 1024:7.1f} kB"
+            )
+        else:
+            print(f"{chart:<22} {scale:<6} {result['status']}")
+
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True, default=str) + "\n")
+    print(f"\nReport written to {args.output}")
+
+    if args.compare:
+        _compare(report, args.compare)
+
+    return 0 if all(r["status"] == "ok" for r in report["results"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
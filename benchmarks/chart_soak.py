@@ -0,0 +1,150 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Render many charts through BaseChart and check that memory stays flat. @zara
+
+Usage: python benchmarks/chart_soak.py [--renders 1000] [--warmup 50] [--max-growth-mb 20]
+Exits with status 1 if RSS or the number of live figures grows after warm-up.
+
+The first renders fill font and glyph caches and give every executor thread
+its own malloc arena, which RSS shows as growth that levels off after about
+30 renders. glibc hands freed arena memory back unevenly, so single samples
+swing by 10-20 MB; growth is therefore the peak RSS of the second half of
+the run against the peak of the first half.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import math
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import _bootstrap  # noqa: E402
+
+base = _bootstrap.load("charts.base", ("charts",))
+styles = _bootstrap.load("charts.styles", ("charts",))
+
+
+class _Validator:
+    """Minimal stand-in for DataValidator export paths. @zara"""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def get_export_path(self, subpath: str = "") -> Path:
+        path = self._root / subpath
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+class SoakChart(base.BaseChart):
+    """Two-panel chart with lines, bars, fills and text like the real reports. @zara"""
+
+    def __init__(self, validator: Any, seed: int) -> None:
+        super().__init__(validator, figsize=(8, 5))
+        self._seed = seed
+
+    async def generate(self, **kwargs: Any):
+        rng = random.Random(self._seed)
+        hours = list(range(24))
+        values = [max(0.0, math.sin((h - 6) / 12 * math.pi)) * rng.uniform(2, 6) for h in hours]
+
+        def _draw():
+            fig, (top, bottom) = self._create_figure(2, 1)
+            top.plot(hours, values, color=self.styles.solar_yellow)
+            top.fill_between(hours, values, alpha=0.3, color=self.styles.solar_orange)
+            bottom.bar(hours, values, color=self.styles.neon_cyan)
+            self._add_title(top, f"Soak {self._seed}", "synthetic")
+            self._add_kpi_box(top, {"Total": sum(values)})
+            self._add_footer(fig)
+            return fig
+
+        return await self._run_in_executor(_draw)
+
+    def get_filename(self, **kwargs: Any) -> str:
+        return "soak.png"
+
+
+def _rss_mb() -> float:
+    """Return the current resident set size in MB. @zara"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * resource.getpagesize() / 1024 / 1024
+    except OSError:
+        # Peak RSS only, still catches unbounded growth @zara
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _live_figures() -> int:
+    """Count Figure objects that survived garbage collection. @zara"""
+    from matplotlib.figure import Figure
+
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Figure))
+
+
+async def main(renders: int, warmup: int, max_growth_mb: float) -> int:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    styles.apply_dark_theme()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        validator = _Validator(Path(tmp))
+        for i in range(warmup):
+            await SoakChart(validator, -1 - i).save()
+        await asyncio.gather(*base._POSTPROCESS_TASKS)
+        print(f"warm-up: {warmup} renders, RSS {_rss_mb():.1f} MB", flush=True)
+
+        every = max(1, renders // 20)
+        samples: list[tuple[int, float, int]] = []
+        started = time.perf_counter()
+        print("  renders      RSS MB   live figures", flush=True)
+
+        for i in range(renders):
+            await SoakChart(validator, i).save()
+            if (i + 1) % every == 0:
+                # Let background post-processing finish before sampling @zara
+                await asyncio.gather(*base._POSTPROCESS_TASKS)
+                samples.append((i + 1, _rss_mb(), _live_figures()))
+                count, rss, figures = samples[-1]
+                print(f"  {count:7d}  {rss:10.1f}   {figures:12d}", flush=True)
+
+        elapsed = time.perf_counter() - started
+
+    half = len(samples) // 2
+    growth = max(s[1] for s in samples[half:]) - max(s[1] for s in samples[:half])
+    leaked = samples[-1][2] - samples[0][2]
+    pyplot_loaded = "matplotlib.pyplot" in sys.modules
+    print(f"{renders} renders in {elapsed:.1f} s ({elapsed / renders * 1000:.1f} ms each)")
+    print(f"  peak RSS growth, 2nd vs 1st half {growth:8.1f} MB (limit {max_growth_mb})")
+    print(f"  figure growth after warm-up      {leaked:8d}")
+    print(f"  pyplot imported                  {pyplot_loaded!s:>8}")
+
+    return 0 if growth <= max_growth_mb and leaked <= 0 and not pyplot_loaded else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--max-growth-mb", type=float, default=20.0)
+    args = parser.parse_args()
+    if args.renders < 2:
+        parser.error("--renders must be at least 2")
+    sys.exit(asyncio.run(main(args.renders, args.warmup, args.max_growth_mb)))
@@ -0,0 +1,172 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Compare SQLite GROUP BY with Python daily weather aggregation. @zara
+
+Builds a hourly_weather_actual table in a temporary Solar Forecast ML database
+and reads it through DatabaseConnectionManager.execute_read, like the collector.
+
+Usage: python benchmarks/weather_aggregation_benchmark.py [--days 730] [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import aiosqlite
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import _bootstrap  # noqa: E402
+
+aggregation = _bootstrap.load("weather_aggregation")
+arrays = _bootstrap.load("weather_arrays")
+queries = _bootstrap.load("readers.weather_queries", ("readers", "storage"))
+manager_module = _bootstrap.load("storage.db_connection_manager", ("storage",))
+const = _bootstrap.load("const")
+
+TABLE = queries.HOURLY_WEATHER_TABLE
+COLUMNS = arrays.HOURLY_WEATHER_FIELDS
+SELECT_ROWS = f"SELECT date, hour, {', '.join(COLUMNS)} FROM {TABLE} ORDER BY date, hour"
+
+
+@dataclass
+class HourlyWeather:
+    """Hourly row shaped like the reader's weather objects. @zara"""
+
+    date: date
+    hour: int
+    temperature_c: float | None
+    humidity_percent: float | None
+    wind_speed_ms: float | None
+    precipitation_mm: float | None
+    solar_radiation_wm2: float | None
+    cloud_cover_percent: float | None
+
+
+def _synthetic_rows(days: int) -> list[tuple]:
+    """Generate hourly weather rows with a few gaps. @zara"""
+    rng = random.Random(42)
+    start = date.today() - timedelta(days=days)
+    rows = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        season = math.cos((day.timetuple().tm_yday - 172) / 365 * 2 * math.pi)
+        for hour in range(24):
+            daylight = max(0.0, math.sin((hour - 6) / 12 * math.pi))
+            rows.append((
+                day.isoformat(), hour,
+                10 + 8 * season + 5 * daylight + rng.gauss(0, 1.5),
+                rng.uniform(40, 95),
+                abs(rng.gauss(3, 2)),
+                rng.random() * 0.6 if rng.random() < 0.15 else 0.0,
+                None if rng.random() < 0.01 else 800 * daylight * (0.6 + 0.4 * season) * rng.random(),
+                rng.uniform(0, 100),
+            ))
+    return rows
+
+
+async def _create_database(config_path: Path, days: int) -> None:
+    """Write the hourly table into the database file the manager opens. @zara"""
+    db_path = config_path / const.SOLAR_FORECAST_DB
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(str(db_path)) as db:
+        await db.execute(
+            f"CREATE TABLE {TABLE} (date TEXT, hour INTEGER, "
+            + ", ".join(f"{name} REAL" for name in COLUMNS) + ")"
+        )
+        await db.executemany(
+            f"INSERT INTO {TABLE} VALUES ({', '.join('?' * (len(COLUMNS) + 2))})",
+            _synthetic_rows(days),
+        )
+        await db.execute(f"CREATE INDEX idx_{TABLE}_date ON {TABLE}(date)")
+        await db.commit()
+
+
+async def _fetch_rows(manager) -> list[HourlyWeather]:
+    """Fetch all hourly rows across the aiosqlite thread boundary. @zara"""
+    raw = await manager.execute_read(SELECT_ROWS)
+    return [HourlyWeather(date.fromisoformat(r[0]), *r[1:]) for r in raw]
+
+
+def _to_days(accumulators: dict) -> list[dict]:
+    """Convert accumulators into sorted observed days. @zara"""
+    return [
+        day for date_str in sorted(accumulators)
+        if (day := accumulators[date_str].to_day(date_str)) is not None
+    ]
+
+
+async def _time(func, runs: int) -> tuple[float, object]:
+    """Return the median wall time in ms and the last result. @zara"""
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+async def main(days: int, runs: int) -> None:
+    """Run the benchmark. @zara"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp)
+        await _create_database(config_path, days)
+        manager = manager_module.DatabaseConnectionManager(config_path)
+        await manager.connect()
+        weather_queries = queries.HourlyWeatherQueries(manager)
+        if not await weather_queries.async_is_available():
+            raise SystemExit(f"{TABLE} lacks the expected columns")
+
+        async def fetch_then_accumulate():
+            return aggregation.aggregate_daily_weather(await _fetch_rows(manager))
+
+        async def fetch_then_arrays():
+            rows = await _fetch_rows(manager)
+            return aggregation.aggregate_daily_weather(arrays.HourlyWeatherArrays.from_rows(rows))
+
+        async def group_by():
+            return _to_days(await weather_queries.async_get_daily_weather())
+
+        fetch_ms, _ = await _time(lambda: _fetch_rows(manager), runs)
+        accumulate_ms, accumulated = await _time(fetch_then_accumulate, runs)
+        arrays_ms, _ = await _time(fetch_then_arrays, runs)
+        sql_ms, grouped = await _time(group_by, runs)
+        await manager.close()
+
+    mismatched = [
+        a["date"] for a, b in zip(accumulated, grouped) if a != b
+    ]
+
+    print(f"{days} days, {days * 24} hourly rows, median of {runs} runs")
+    print(f"  fetch rows only             {fetch_ms:8.1f} ms")
+    print(f"  fetch + single-pass accum.  {accumulate_ms:8.1f} ms  ({len(accumulated)} days)")
+    print(f"  fetch + column arrays       {arrays_ms:8.1f} ms")
+    print(f"  SQLite GROUP BY             {sql_ms:8.1f} ms  ({len(grouped)} days)")
+    print(f"  speedup GROUP BY vs accum.  {accumulate_ms / sql_ms:8.1f}x")
+    print(f"  day count equal             {str(len(accumulated) == len(grouped)):>8}")
+    # SQLite sums in its own order, the 1-decimal rounding can differ at x.x5 @zara
+    print(f"  days differing              {len(mismatched):8d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.days, args.runs))
@@ -10,7 +10,7 @@
 """Charts module for SFML Stats. @zara"""
 from __future__ import annotations
 
-from .styles import ChartStyles, apply_dark_theme
+from .styles import ChartStyles, apply_dark_theme, get_asset_cache, get_chart_styles
 from .base import BaseChart
 from .weekly_report import WeeklyReportChart
 from .forecast_comparison import ForecastComparisonChart
@@ -18,6 +18,8 @@ from .forecast_comparison import ForecastComparisonChart
 __all__ = [
     "ChartStyles",
     "apply_dark_theme",
+    "get_asset_cache",
+    "get_chart_styles",
     "BaseChart",
     "WeeklyReportChart",
     "ForecastComparisonChart",
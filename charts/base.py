@@ -11,15 +11,28 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import logging
+import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
-from .styles import ChartStyles
-from ..const import CHART_DPI
+from .render_cache import (
+    VOLATILE_GID,
+    RenderCache,
+    data_fingerprint,
+    figure_fingerprint,
+    get_render_cache,
+)
+from .postprocess import POSTPROCESS_EXECUTOR, postprocess_chart
+from .render_pool import async_render_png
+from .styles import ChartStyles, get_chart_styles, preview_mode
+from .warmup import render_timings
+from ..const import CHART_DPI, CHART_PREVIEW_DPI, CHART_PREVIEW_SUFFIX
 
 if TYPE_CHECKING:
     import matplotlib.patches as mpatches
@@ -30,6 +43,38 @@ _LOGGER = logging.getLogger(__name__)
 
 _MATPLOTLIB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="matplotlib")
 
+# Strong references so pending post-processing tasks are not collected @zara
+_POSTPROCESS_TASKS: set[asyncio.Task] = set()
+
+# Aggressive path simplification for preview renders @zara
+_PREVIEW_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+_DENSE_SERIES_POINTS = 500
+
+
+def _dense_series(fig: "Figure") -> list[Any]:
+    """Return the lines and collections with many points. @zara"""
+    # Only the data artists, Figure.findobj would also walk every tick @zara
+    dense = []
+    for ax in fig.axes:
+        for line in ax.lines:
+            if len(line.get_xydata()) > _DENSE_SERIES_POINTS:
+                dense.append(line)
+        for collection in ax.collections:
+            if len(collection.get_offsets()) > _DENSE_SERIES_POINTS:
+                dense.append(collection)
+    return dense
+
+
+# plt.subplots keywords that belong to the Figure, not to Figure.subplots @zara
+_FIGURE_KWARGS = (
+    "dpi", "edgecolor", "linewidth", "frameon",
+    "layout", "constrained_layout", "tight_layout",
+)
+
 
 class BaseChart(ABC):
     """Abstract base class for all charts. @zara"""
@@ -42,7 +87,7 @@ class BaseChart(ABC):
         """Initialize the chart. @zara"""
         self._validator = validator
         self._figsize = figsize
-        self._styles = ChartStyles()
+        self._styles = get_chart_styles()
         self._fig: "Figure | None" = None
 
     @property
@@ -60,46 +105,184 @@ class BaseChart(ABC):
         """Generate the chart. @zara"""
 
     async def _run_in_executor(self, func, *args, **kwargs):
-        """Run a function in the executor. @zara"""
-        import functools
+        """Run a function in the executor, keeping context variables. @zara"""
         loop = asyncio.get_running_loop()
         if kwargs:
             func = functools.partial(func, **kwargs)
-        return await loop.run_in_executor(_MATPLOTLIB_EXECUTOR, func, *args)
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(_MATPLOTLIB_EXECUTOR, context.run, func, *args)
 
     @abstractmethod
     def get_filename(self, **kwargs: Any) -> str:
         """Return the filename for the chart. @zara"""
 
-    async def save(self, filename: str | None = None, **kwargs: Any) -> Path:
-        """Save the chart as PNG. @zara"""
-        if self._fig is None:
-            self._fig = await self.generate(**kwargs)
-
-        if filename is None:
-            filename = self.get_filename(**kwargs)
+    def get_cache_key(self, **kwargs: Any) -> Any:
+        """Return the chart input data to skip generate on a cache hit, or None. @zara"""
+        return None
 
-        file_path = self.export_path / filename
+    @property
+    def render_cache(self) -> RenderCache:
+        """Return the render cache in sfml_stats/.cache. @zara"""
+        return get_render_cache(self._validator.get_export_path(".cache"))
 
-        def _save_sync():
-            import matplotlib.pyplot as plt
-            self._fig.savefig(
-                file_path,
-                dpi=CHART_DPI,
-                bbox_inches="tight",
-                facecolor=self._styles.background,
-                edgecolor="none",
+    async def save(
+        self,
+        filename: str | None = None,
+        preview: bool = False,
+        data_key: Any = None,
+        **kwargs: Any,
+    ) -> Path:
+        """Save the chart as PNG, data_key is input data the caller already read. @zara"""
+        if preview:
+            with preview_mode():
+                return await self._save(filename, True, data_key, kwargs)
+        return await self._save(filename, False, data_key, kwargs)
+
+    def _schedule_postprocess(
+        self,
+        file_path: Path,
+        cache: RenderCache,
+        cache_key: str | None,
+    ) -> None:
+        """Optimize the saved PNG in the background, then record it in the cache. @zara"""
+        async def _run() -> None:
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(POSTPROCESS_EXECUTOR, postprocess_chart, file_path)
+                # After optimizing, the cache entry records the final file size @zara
+                if cache_key is not None:
+                    await loop.run_in_executor(POSTPROCESS_EXECUTOR, cache.store, file_path, cache_key)
+            except Exception as err:
+                _LOGGER.warning("Chart post-processing failed for %s: %s", file_path, err)
+
+        task = asyncio.get_running_loop().create_task(_run())
+        _POSTPROCESS_TASKS.add(task)
+        task.add_done_callback(_POSTPROCESS_TASKS.discard)
+
+    @staticmethod
+    def _preview_filename(filename: str) -> str:
+        """Insert the preview suffix before the extension. @zara"""
+        path = Path(filename)
+        return str(path.with_name(f"{path.stem}{CHART_PREVIEW_SUFFIX}{path.suffix}"))
+
+    async def _save(
+        self,
+        filename: str | None,
+        preview: bool,
+        data_key: Any,
+        kwargs: dict[str, Any],
+    ) -> Path:
+        """Render and write the PNG. @zara"""
+        started = time.perf_counter()
+        if preview:
+            # No tight bbox, it costs a second full draw @zara
+            savefig_kwargs = {
+                "dpi": CHART_PREVIEW_DPI,
+                "facecolor": self._styles.background,
+                "edgecolor": "none",
+            }
+        else:
+            savefig_kwargs = {
+                "dpi": CHART_DPI,
+                "bbox_inches": "tight",
+                "facecolor": self._styles.background,
+                "edgecolor": "none",
+            }
+        cache = self.render_cache
+        cache_key = None
+
+        def _resolve_path() -> Path:
+            name = filename or self.get_filename(**kwargs)
+            return self.export_path / (self._preview_filename(name) if preview else name)
+
+        # Inputs known up front can skip generate as well as savefig @zara
+        if self._fig is not None:
+            data_key = None
+        elif data_key is None:
+            data_key = self.get_cache_key(**kwargs)
+        if data_key is not None:
+            file_path = _resolve_path()
+            cache_key = data_fingerprint(
+                [type(self).__name__, data_key, savefig_kwargs, self._figsize]
             )
-            plt.close(self._fig)
+            if await self._run_in_executor(cache.is_fresh, file_path, cache_key):
+                _LOGGER.debug("Render cache hit (data): %s", file_path)
+                return file_path
+
+        if self._fig is None:
+            self._fig = await self.generate(**kwargs)
+
+        if data_key is None:
+            file_path = _resolve_path()
+        fig = self._fig
+
+        # Previews are cheap enough that hashing the figure does not pay off @zara
+        if cache_key is None and not preview:
+            def _check_sync() -> tuple[str | None, bool]:
+                try:
+                    key = figure_fingerprint(fig, [type(self).__name__, savefig_kwargs])
+                except Exception as err:
+                    _LOGGER.debug("Figure fingerprint failed, rendering uncached: %s", err)
+                    return None, False
+                return key, cache.is_fresh(file_path, key)
+
+            cache_key, fresh = await self._run_in_executor(_check_sync)
+            if fresh:
+                _LOGGER.debug("Render cache hit (figure): %s", file_path)
+                await self._run_in_executor(self._close_figure, fig)
+                self._fig = None
+                return file_path
+
+        def _savefig_sync():
+            if not preview:
+                fig.savefig(file_path, **savefig_kwargs)
+                return
+            import matplotlib
+            from matplotlib.ticker import NullLocator
+            with matplotlib.rc_context(_PREVIEW_RC):
+                for artist in _dense_series(fig):
+                    artist.set_rasterized(True)
+                # Tick layout dominates small renders and is unreadable at preview DPI @zara
+                for ax in fig.axes:
+                    for axis in (ax.xaxis, ax.yaxis):
+                        axis.set_major_locator(NullLocator())
+                        axis.set_minor_locator(NullLocator())
+                fig.savefig(file_path, **savefig_kwargs)
 
         try:
-            await self._run_in_executor(_save_sync)
+            png = None
+            if not preview:
+                png = await async_render_png(fig, savefig_kwargs, _MATPLOTLIB_EXECUTOR)
+            if png is not None:
+                await self._run_in_executor(file_path.write_bytes, png)
+            else:
+                await self._run_in_executor(_savefig_sync)
+            if not preview:
+                self._schedule_postprocess(file_path, cache, cache_key)
+            elif cache_key is not None:
+                await self._run_in_executor(cache.store, file_path, cache_key)
+            render_timings.record_render(
+                f"{type(self).__name__}{CHART_PREVIEW_SUFFIX if preview else ''}",
+                time.perf_counter() - started,
+            )
             _LOGGER.info("Chart gespeichert: %s", file_path)
         finally:
+            # Also on errors, so failed renders do not leak figures @zara
             self._fig = None
+            await self._run_in_executor(self._close_figure, fig)
 
         return file_path
 
+    @staticmethod
+    def _close_figure(fig: "Figure") -> None:
+        """Release a figure. @zara"""
+        if getattr(fig.canvas, "manager", None) is not None:
+            # Registered with pyplot by code outside _create_figure @zara
+            import matplotlib.pyplot as plt
+            plt.close(fig)
+        else:
+            fig.clear()
+
     def _create_figure(
         self,
         nrows: int = 1,
@@ -107,16 +290,21 @@ class BaseChart(ABC):
         figsize: tuple[int, int] | None = None,
         **kwargs: Any,
     ) -> tuple["Figure", Any]:
-        """Create a new figure with subplots. @zara"""
-        import matplotlib.pyplot as plt
+        """Create a new figure with subplots, without pyplot state. @zara"""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
         size = figsize or self._figsize
-        fig, axes = plt.subplots(
-            nrows=nrows,
-            ncols=ncols,
+        figure_kwargs = {
+            key: kwargs.pop(key) for key in _FIGURE_KWARGS if key in kwargs
+        }
+        fig = Figure(
             figsize=size,
             facecolor=self._styles.background,
-            **kwargs,
+            **figure_kwargs,
         )
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(nrows=nrows, ncols=ncols, **kwargs)
         return fig, axes
 
     def _add_title(
@@ -165,6 +353,7 @@ class BaseChart(ABC):
             ha="right",
             va="bottom",
             transform=fig.transFigure,
+            gid=VOLATILE_GID,
         )
 
         fig.text(
@@ -0,0 +1,51 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Chart input data read by the caller, so a render cache hit skips generate. @zara"""
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ..const import FORECAST_COMPARISON_CHART_DAYS, SOLAR_FORECAST_DB
+
+if TYPE_CHECKING:
+    from ..storage import DataValidator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_forecast_comparison_key(validator: "DataValidator") -> Any:
+    """Return the comparison days the forecast chart is drawn from. @zara"""
+    from ..readers.forecast_comparison_reader import ForecastComparisonReader
+
+    reader = ForecastComparisonReader(validator.config_path / SOLAR_FORECAST_DB)
+    if not reader.is_available:
+        return None
+    days = await reader.async_get_comparison_days(days=FORECAST_COMPARISON_CHART_DAYS)
+    # The date is part of the key, the chart window moves at midnight @zara
+    return [date.today().isoformat(), days]
+
+
+_DATA_KEYS: dict[str, Callable[["DataValidator"], Awaitable[Any]]] = {
+    "forecast_comparison": async_forecast_comparison_key,
+}
+
+
+async def async_chart_data_key(chart_name: str, validator: "DataValidator") -> Any:
+    """Return the input data key of a chart, or None to fall back to the figure hash. @zara"""
+    builder = _DATA_KEYS.get(chart_name)
+    if builder is None:
+        return None
+    try:
+        return await builder(validator)
+    except Exception as err:
+        _LOGGER.debug("No data key for %s, hashing the figure instead: %s", chart_name, err)
+        return None
@@ -0,0 +1,164 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""PNG optimisation and WebP variants for saved charts. @zara"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..const import (
+    CHART_PALETTE_COLORS,
+    CHART_POSTPROCESS_ENABLED,
+    CHART_WEBP_QUALITY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Own thread, so encoding does not hold up the matplotlib executor @zara
+POSTPROCESS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart_postprocess")
+
+_enabled: bool = CHART_POSTPROCESS_ENABLED
+
+try:
+    from PIL import Image, features
+
+    PIL_AVAILABLE = True
+    WEBP_AVAILABLE = bool(features.check("webp"))
+except ImportError:
+    PIL_AVAILABLE = False
+    WEBP_AVAILABLE = False
+
+
+class PostprocessStats:
+    """Byte counts before and after post-processing. @zara"""
+
+    def __init__(self) -> None:
+        """Initialize empty counters. @zara"""
+        self._lock = threading.Lock()
+        self.files = 0
+        self.original_bytes = 0
+        self.png_bytes = 0
+        self.webp_bytes = 0
+
+    def record(self, result: dict[str, Any]) -> None:
+        """Add the result of one file. @zara"""
+        with self._lock:
+            self.files += 1
+            self.original_bytes += result["original_bytes"]
+            self.png_bytes += result["png_bytes"]
+            self.webp_bytes += result.get("webp_bytes") or 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return totals and the PNG saving in percent. @zara"""
+        with self._lock:
+            return {
+                "enabled": postprocess_enabled(),
+                "webp": WEBP_AVAILABLE,
+                "files": self.files,
+                "original_bytes": self.original_bytes,
+                "png_bytes": self.png_bytes,
+                "saved_bytes": self.original_bytes - self.png_bytes,
+                "saved_percent": (
+                    round((1 - self.png_bytes / self.original_bytes) * 100, 1)
+                    if self.original_bytes else 0.0
+                ),
+                "webp_bytes": self.webp_bytes,
+            }
+
+
+postprocess_stats = PostprocessStats()
+
+
+def configure_postprocess(enabled: bool) -> None:
+    """Switch the lossy post-processing on or off. @zara"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def postprocess_enabled() -> bool:
+    """Return True when saved charts are optimized. @zara"""
+    return _enabled and PIL_AVAILABLE
+
+
+def webp_variant(file_path: Path) -> Path | None:
+    """Return the WebP variant of a chart if it belongs to the current PNG. @zara"""
+    webp_path = file_path.with_suffix(".webp")
+    try:
+        if webp_path.stat().st_mtime >= file_path.stat().st_mtime:
+            return webp_path
+    except OSError:
+        pass
+    return None
+
+
+def _temp_path(file_path: Path) -> Path:
+    """Return a unique hidden temp file next to the target. @zara"""
+    # Unique name, a newer render of the same chart may be post-processed too @zara
+    return file_path.with_name(f".{file_path.stem}.{uuid.uuid4().hex[:8]}.tmp{file_path.suffix}")
+
+
+def _write_smaller(image: "Image.Image", file_path: Path, original_size: int) -> int:
+    """Write an optimized PNG, keeping the original if it is not smaller. @zara"""
+    temp_path = _temp_path(file_path)
+    try:
+        image.save(temp_path, format="PNG", optimize=True)
+        size = temp_path.stat().st_size
+        if size < original_size:
+            os.replace(temp_path, file_path)
+            return size
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return original_size
+
+
+def postprocess_chart(file_path: Path) -> dict[str, Any] | None:
+    """Quantize and optimize a PNG and write its WebP variant (executor thread). @zara"""
+    if not postprocess_enabled():
+        return None
+
+    try:
+        original_size = file_path.stat().st_size
+        with Image.open(file_path) as source:
+            image = source.convert("RGBA")
+
+        result: dict[str, Any] = {"file": file_path.name, "original_bytes": original_size}
+
+        palette = image.quantize(colors=CHART_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+        result["png_bytes"] = _write_smaller(palette, file_path, original_size)
+
+        # From the full-colour image, written last so it is not older than the PNG @zara
+        if WEBP_AVAILABLE:
+            webp_path = file_path.with_suffix(".webp")
+            # Moved into place whole, the image view may serve it at any moment @zara
+            temp_path = _temp_path(webp_path)
+            try:
+                image.save(temp_path, format="WEBP", quality=CHART_WEBP_QUALITY, method=2)
+                result["webp_bytes"] = temp_path.stat().st_size
+                os.replace(temp_path, webp_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Chart post-processing failed for %s: %s", file_path, err)
+        return None
+
+    postprocess_stats.record(result)
+    _LOGGER.debug(
+        "Chart optimiert: %s %d -> %d bytes (WebP %s)",
+        file_path.name,
+        original_size,
+        result["png_bytes"],
+        result.get("webp_bytes"),
+    )
+    return result
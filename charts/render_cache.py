@@ -0,0 +1,205 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Content-hash render cache for generated charts. @zara"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..const import RENDER_CACHE_MANIFEST
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+_LOGGER = logging.getLogger(__name__)
+
+# Texts tagged with this gid change on every render and are not hashed @zara
+VOLATILE_GID = "sfml_volatile"
+
+_caches: dict[Path, RenderCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _feed(hasher: Any, value: Any) -> None:
+    """Add a value to the hash in a stable binary form. @zara"""
+    if hasattr(value, "tobytes"):
+        hasher.update(str(getattr(value, "shape", "")).encode())
+        hasher.update(value.tobytes())
+    else:
+        hasher.update(repr(value).encode())
+    hasher.update(b"\x00")
+
+
+def _artist_state(artist: Any) -> list[Any]:
+    """Return the drawable state of one artist. @zara"""
+    import numpy as np
+    from matplotlib.axes import Axes
+    from matplotlib.collections import Collection
+    from matplotlib.image import AxesImage
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotlib.text import Text
+
+    state: list[Any] = [type(artist).__name__, artist.get_visible(), artist.get_zorder()]
+    if isinstance(artist, Text):
+        if artist.get_gid() == VOLATILE_GID:
+            return state
+        bbox = artist.get_bbox_patch()
+        state += [artist.get_text(), artist.get_position(), artist.get_color(),
+                  artist.get_fontsize(), artist.get_rotation(), artist.get_fontweight(),
+                  artist.get_fontstyle(), artist.get_fontfamily(),
+                  artist.get_horizontalalignment(), artist.get_verticalalignment(),
+                  artist.get_alpha()]
+        if bbox is not None:
+            state += [bbox.get_boxstyle(), bbox.get_facecolor(), bbox.get_edgecolor(),
+                      bbox.get_linewidth(), bbox.get_alpha()]
+    elif isinstance(artist, Line2D):
+        state += [np.asarray(artist.get_xydata(), dtype=float), artist.get_color(),
+                  artist.get_linestyle(), artist.get_linewidth(), artist.get_marker(),
+                  artist.get_markersize(), artist.get_markerfacecolor(),
+                  artist.get_markeredgecolor(), artist.get_alpha()]
+    elif isinstance(artist, Patch):
+        state += [np.asarray(artist.get_path().vertices, dtype=float),
+                  artist.get_patch_transform().get_matrix(),
+                  artist.get_facecolor(), artist.get_edgecolor(),
+                  artist.get_linewidth(), artist.get_alpha()]
+    elif isinstance(artist, Collection):
+        state += [np.asarray(artist.get_offsets(), dtype=float),
+                  [np.asarray(p.vertices, dtype=float) for p in artist.get_paths()],
+                  np.asarray(artist.get_facecolor()), np.asarray(artist.get_edgecolor()),
+                  np.asarray(artist.get_linewidths(), dtype=float),
+                  np.asarray(artist.get_sizes(), dtype=float)
+                  if hasattr(artist, "get_sizes") else None,
+                  artist.get_array(), artist.get_alpha()]
+    elif isinstance(artist, AxesImage):
+        state += [np.asarray(artist.get_array()), artist.get_extent(),
+                  artist.get_cmap().name, artist.get_alpha()]
+    elif isinstance(artist, Axes):
+        state += [artist.get_position().bounds, artist.get_xlim(), artist.get_ylim(),
+                  artist.get_xscale(), artist.get_yscale(), artist.get_facecolor()]
+    return state
+
+
+def figure_fingerprint(fig: "Figure", extra: Any = None) -> str:
+    """Hash everything that ends up in the PNG except volatile texts. @zara"""
+    hasher = hashlib.sha256()
+    _feed(hasher, (tuple(fig.get_size_inches()), fig.get_dpi(), fig.get_facecolor(), extra))
+    for artist in fig.findobj():
+        for value in _artist_state(artist):
+            if isinstance(value, list):
+                for item in value:
+                    _feed(hasher, item)
+            else:
+                _feed(hasher, value)
+    return hasher.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize reader records by their fields, other objects by str. @zara"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    return str(value)
+
+
+def data_fingerprint(data: Any) -> str:
+    """Hash JSON-compatible chart input data and style parameters. @zara"""
+    payload = json.dumps(data, sort_keys=True, default=_json_default, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RenderCache:
+    """Manifest of rendered files and the content hash they were built from. @zara"""
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache for a directory. @zara"""
+        self._manifest_path = cache_dir / RENDER_CACHE_MANIFEST
+        self._manifest: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load the manifest from disk once (executor thread). @zara"""
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._manifest = {}
+            except (OSError, ValueError) as err:
+                _LOGGER.warning("Render cache manifest unreadable, starting empty: %s", err)
+                self._manifest = {}
+        return self._manifest
+
+    def is_fresh(self, file_path: Path, key: str) -> bool:
+        """Return True if the file exists and was rendered from the same key. @zara"""
+        with self._lock:
+            entry = self._load().get(str(file_path))
+            fresh = (
+                entry is not None
+                and entry.get("key") == key
+                and file_path.exists()
+                and file_path.stat().st_size == entry.get("size")
+            )
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return fresh
+
+    def store(self, file_path: Path, key: str) -> None:
+        """Record a rendered file and persist the manifest atomically. @zara"""
+        with self._lock:
+            manifest = self._load()
+            manifest[str(file_path)] = {
+                "key": key,
+                "size": file_path.stat().st_size,
+                "rendered": datetime.now().isoformat(timespec="seconds"),
+            }
+            try:
+                self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self._manifest_path.with_suffix(".tmp")
+                temp_path.write_text(json.dumps(manifest, indent=None), encoding="utf-8")
+                os.replace(temp_path, self._manifest_path)
+            except OSError as err:
+                _LOGGER.warning("Could not write render cache manifest: %s", err)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit and miss counters. @zara"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 1) if total else 0.0,
+            "entries": len(self._manifest or {}),
+        }
+
+
+def get_render_cache(cache_dir: Path) -> RenderCache:
+    """Return the shared cache of a directory. @zara"""
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = _caches[cache_dir] = RenderCache(cache_dir)
+        return cache
+
+
+def get_render_cache_stats() -> dict[str, dict[str, Any]]:
+    """Return statistics of all render caches. @zara"""
+    with _caches_lock:
+        return {str(path): cache.stats() for path, cache in _caches.items()}
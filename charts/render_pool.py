@@ -0,0 +1,142 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Optional process pool for rasterizing charts outside the HA process. @zara"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from ..const import CHART_RENDER_PROCESSES, CHART_RENDER_TIMEOUT_SECONDS
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+_LOGGER = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers: int = CHART_RENDER_PROCESSES
+_pool_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    """Select the Agg backend before anything else touches matplotlib. @zara"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_png(figure_data: bytes, savefig_kwargs: dict[str, Any]) -> bytes:
+    """Unpickle a figure and rasterize it to PNG bytes (worker side). @zara"""
+    import io
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = pickle.loads(figure_data)
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def configure_render_pool(workers: int) -> None:
+    """Set the number of render processes, 0 disables the pool. @zara"""
+    global _pool_workers
+    workers = max(0, int(workers))
+    with _pool_lock:
+        if workers == _pool_workers:
+            return
+        _pool_workers = workers
+    shutdown_render_pool()
+    _LOGGER.info("Chart render processes: %d", workers)
+
+
+def render_pool_enabled() -> bool:
+    """Return True if charts should be rasterized in worker processes. @zara"""
+    return _pool_workers > 0
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the pool, creating it on first use. @zara"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn avoids forking the threaded HA process @zara
+            _pool = ProcessPoolExecutor(
+                max_workers=_pool_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken or hung pool so the next render starts fresh. @zara"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # shutdown() alone leaves a hung worker running, kill the processes first @zara
+    for process in list((pool._processes or {}).values()):
+        if process.is_alive():
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_render_pool() -> None:
+    """Stop all render processes. @zara"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_render_png(
+    fig: "Figure",
+    savefig_kwargs: dict[str, Any],
+    pickle_executor: Executor | None = None,
+) -> bytes | None:
+    """Rasterize a figure in a worker process, None means fall back to threads. @zara"""
+    if not render_pool_enabled():
+        return None
+
+    loop = asyncio.get_running_loop()
+    try:
+        figure_data = await loop.run_in_executor(
+            pickle_executor, pickle.dumps, fig, pickle.HIGHEST_PROTOCOL
+        )
+    except Exception as err:
+        _LOGGER.debug("Figure not picklable, rendering in thread: %s", err)
+        return None
+
+    pool = _get_pool()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(pool, _render_png, figure_data, savefig_kwargs),
+            CHART_RENDER_TIMEOUT_SECONDS,
+        )
+    except BrokenProcessPool:
+        _LOGGER.warning("Chart render process crashed, restarting pool")
+        _discard_pool(pool)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Chart render process timed out after %ds, restarting pool",
+            CHART_RENDER_TIMEOUT_SECONDS,
+        )
+        _discard_pool(pool)
+    except Exception as err:
+        _LOGGER.warning("Chart render process failed: %s", err)
+    return None
@@ -0,0 +1,253 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Prioritised, bounded render job queue with deduplication. @zara"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..const import (
+    RENDER_JOB_HISTORY,
+    RENDER_PRIORITY_SCHEDULED,
+    RENDER_QUEUE_MAX_DEPTH,
+    RENDER_QUEUE_RETRY_AFTER_SECONDS,
+    RENDER_QUEUE_WORKERS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+def render_job_key(chart_name: str, preview: bool = False) -> str:
+    """Return the deduplication key of a chart render job. @zara"""
+    return f"{chart_name}:{'preview' if preview else 'full'}"
+
+
+class RenderQueueFull(Exception):
+    """Raised when the queue is at its maximum depth. @zara"""
+
+    def __init__(self, depth: int, retry_after: int) -> None:
+        """Initialize with the current depth and a retry hint. @zara"""
+        super().__init__(f"Render queue full ({depth} jobs pending)")
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+@dataclass
+class RenderJob:
+    """One render request and its state. @zara"""
+
+    job_id: str
+    key: str
+    priority: int
+    factory: Callable[[], Awaitable[Any]]
+    status: str = JOB_QUEUED
+    submitted: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    result: Any = None
+    error: str | None = None
+    waiters: int = 1
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pollable job status. @zara"""
+        return {
+            "job_id": self.job_id,
+            "key": self.key,
+            "priority": self.priority,
+            "status": self.status,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "wait_ms": (
+                round((self.started - self.submitted) * 1000, 1)
+                if self.started is not None else None
+            ),
+            "run_ms": (
+                round((self.finished - self.started) * 1000, 1)
+                if self.finished is not None and self.started is not None else None
+            ),
+            "result": str(self.result) if self.result is not None else None,
+            "error": self.error,
+            "deduplicated": self.waiters - 1,
+        }
+
+
+class RenderQueue:
+    """Run render jobs on a fixed number of workers, interactive first. @zara"""
+
+    def __init__(
+        self,
+        max_depth: int = RENDER_QUEUE_MAX_DEPTH,
+        workers: int = RENDER_QUEUE_WORKERS,
+    ) -> None:
+        """Initialize an idle queue, workers start on first submit. @zara"""
+        self._max_depth = max_depth
+        self._worker_count = workers
+        self._queue: asyncio.PriorityQueue[tuple[int, int, RenderJob]] = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending: dict[str, RenderJob] = {}
+        self._jobs: OrderedDict[str, RenderJob] = OrderedDict()
+        self._workers: list[asyncio.Task] = []
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued and running jobs. @zara"""
+        return len(self._pending)
+
+    def submit(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: int = RENDER_PRIORITY_SCHEDULED,
+    ) -> RenderJob:
+        """Queue a job, or return the pending job with the same key. @zara"""
+        job = self._pending.get(key)
+        if job is not None:
+            job.waiters += 1
+            self.deduplicated += 1
+            if job.status == JOB_QUEUED and priority < job.priority:
+                # Re-queue at the higher priority, the stale entry is skipped @zara
+                job.priority = priority
+                self._queue.put_nowait((priority, next(self._sequence), job))
+            return job
+
+        if len(self._pending) >= self._max_depth:
+            self.rejected += 1
+            raise RenderQueueFull(len(self._pending), RENDER_QUEUE_RETRY_AFTER_SECONDS)
+
+        job = RenderJob(uuid.uuid4().hex[:12], key, priority, factory)
+        self._pending[key] = job
+        self._remember(job)
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        self.submitted += 1
+        self._ensure_workers()
+        _LOGGER.debug("Render job %s queued (%s, priority %d)", job.job_id, key, priority)
+        return job
+
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: int = RENDER_PRIORITY_SCHEDULED,
+    ) -> Any:
+        """Submit a job and wait for its result. @zara"""
+        job = self.submit(key, factory, priority)
+        await job.done.wait()
+        if job.status != JOB_DONE:
+            raise RuntimeError(job.error or f"Render job {job.job_id} {job.status}")
+        return job.result
+
+    def get_job(self, job_id: str) -> RenderJob | None:
+        """Return a queued, running or recently finished job. @zara"""
+        return self._jobs.get(job_id)
+
+    def _remember(self, job: RenderJob) -> None:
+        """Keep finished jobs for polling, dropping the oldest ones. @zara"""
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > RENDER_JOB_HISTORY:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest.status in (JOB_QUEUED, JOB_RUNNING):
+                break
+            del self._jobs[oldest_id]
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks on the running loop. @zara"""
+        self._workers = [task for task in self._workers if not task.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._workers) < self._worker_count:
+            self._workers.append(
+                loop.create_task(self._worker(), name=f"sfml_stats_render_worker_{len(self._workers)}")
+            )
+
+    async def _worker(self) -> None:
+        """Take jobs in priority order and run them one at a time. @zara"""
+        while True:
+            priority, _, job = await self._queue.get()
+            try:
+                if job.status != JOB_QUEUED or priority != job.priority:
+                    continue
+                job.status = JOB_RUNNING
+                job.started = time.time()
+                try:
+                    job.result = await job.factory()
+                    job.status = JOB_DONE
+                except asyncio.CancelledError:
+                    job.status = JOB_CANCELLED
+                    raise
+                except Exception as err:
+                    job.status = JOB_FAILED
+                    job.error = str(err)
+                    _LOGGER.error("Render job %s (%s) failed: %s", job.job_id, job.key, err)
+                finally:
+                    job.finished = time.time()
+                    self._pending.pop(job.key, None)
+                    job.done.set()
+            finally:
+                self._queue.task_done()
+
+    async def async_shutdown(self) -> None:
+        """Cancel workers and mark pending jobs as cancelled. @zara"""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for job in self._pending.values():
+            if job.status in (JOB_QUEUED, JOB_RUNNING):
+                job.status = JOB_CANCELLED
+                job.done.set()
+        self._pending.clear()
+        self._queue = asyncio.PriorityQueue()
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and counters. @zara"""
+        return {
+            "depth": self.depth,
+            "max_depth": self._max_depth,
+            "workers": self._worker_count,
+            "running": sum(1 for job in self._pending.values() if job.status == JOB_RUNNING),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+        }
+
+
+_render_queue: RenderQueue | None = None
+
+
+def get_render_queue() -> RenderQueue:
+    """Return the shared render queue. @zara"""
+    global _render_queue
+    if _render_queue is None:
+        _render_queue = RenderQueue()
+    return _render_queue
+
+
+async def async_shutdown_render_queue() -> None:
+    """Stop the shared render queue. @zara"""
+    global _render_queue
+    queue, _render_queue = _render_queue, None
+    if queue is not None:
+        await queue.async_shutdown()
@@ -10,16 +10,22 @@
 """Chart styles for SFML Stats. @zara"""
 from __future__ import annotations
 
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
-from ..const import COLORS
+from ..const import COLORS, RENDER_ASSET_CACHE_MAX_BYTES, RENDER_ASSET_CACHE_MAX_ENTRIES
 
 if TYPE_CHECKING:
+    import numpy as np
     from matplotlib.colors import LinearSegmentedColormap
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChartStyles:
     """Central style configuration for all charts. @zara"""
 
@@ -98,14 +104,129 @@ class ChartStyles:
             return self.solar_orange
 
 
+class RenderAssetCache:
+    """LRU cache for colormaps and styles shared across renders. @zara"""
+
+    def __init__(self, max_bytes: int, max_entries: int) -> None:
+        """Initialize the cache with byte and entry limits. @zara"""
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, factory: Callable[[], Any], size: Callable[[Any], int]) -> Any:
+        """Return a cached asset, building and accounting it on a miss. @zara"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = factory()
+        nbytes = size(value)
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            while self._entries and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop all assets. @zara"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count, bytes held and hit/miss counters. @zara"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_asset_cache = RenderAssetCache(RENDER_ASSET_CACHE_MAX_BYTES, RENDER_ASSET_CACHE_MAX_ENTRIES)
+
+
+_preview_mode: ContextVar[bool] = ContextVar("sfml_chart_preview", default=False)
+
+
+def is_preview() -> bool:
+    """Return True while rendering a lightweight preview. @zara"""
+    return _preview_mode.get()
+
+
+@contextmanager
+def preview_mode(enabled: bool = True) -> Iterator[None]:
+    """Render without decorative effects inside this block. @zara"""
+    token = _preview_mode.set(enabled)
+    try:
+        yield
+    finally:
+        _preview_mode.reset(token)
+
+
+def get_asset_cache() -> RenderAssetCache:
+    """Return the process-wide render asset cache. @zara"""
+    return _asset_cache
+
+
+def get_chart_styles() -> ChartStyles:
+    """Return the shared, frozen ChartStyles instance. @zara"""
+    return _asset_cache.get(("styles",), ChartStyles, lambda obj: sys.getsizeof(obj.__dict__))
+
+
+def _colormap_bytes(cmap: Any) -> int:
+    """Estimate the lookup table size of a colormap. @zara"""
+    return (cmap.N + 3) * 4 * 8
+
+
+def _build_colormap(name: str, colors: list[str]) -> "LinearSegmentedColormap":
+    """Build a 256-step colormap with its lookup table filled. @zara"""
+    from matplotlib.colors import LinearSegmentedColormap
+
+    cmap = LinearSegmentedColormap.from_list(name, colors, N=256)
+    cmap(0.0)
+    return cmap
+
+
+def _cached_colormap(name: str, colors: list[str]) -> "LinearSegmentedColormap":
+    """Return a private copy of the cached colormap, callers may change it. @zara"""
+    cmap = _asset_cache.get(
+        ("colormap", name, tuple(colors)),
+        lambda: _build_colormap(name, colors),
+        _colormap_bytes,
+    )
+    # copy() reuses the filled lookup table instead of interpolating it again @zara
+    return cmap.copy()
+
+
 def apply_dark_theme() -> None:
     """Apply dark theme globally to matplotlib. @zara"""
-    import matplotlib.pyplot as plt
     import matplotlib as mpl
+    import matplotlib.style
 
-    styles = ChartStyles()
+    styles = get_chart_styles()
 
-    plt.style.use("dark_background")
+    matplotlib.style.use("dark_background")
 
     mpl.rcParams.update({
         "figure.facecolor": styles.background,
@@ -172,31 +293,35 @@ def create_gradient_image(
     import numpy as np
     from matplotlib.colors import to_rgba
 
-    start_rgba = to_rgba(color_start)
-    end_rgba = to_rgba(color_end)
+    start_rgba = np.array(to_rgba(color_start))
+    end_rgba = np.array(to_rgba(color_end))
 
+    # Interpolate one row/column and broadcast it, not every pixel per channel @zara
     if direction == "horizontal":
-        gradient = np.linspace(0, 1, width)
-        gradient = np.tile(gradient, (height, 1))
+        ramp = np.linspace(0, 1, width).reshape(1, width, 1)
     else:
-        gradient = np.linspace(0, 1, height)
-        gradient = np.tile(gradient.reshape(-1, 1), (1, width))
-
-    result = np.zeros((height, width, 4))
-    for i in range(4):
-        result[:, :, i] = start_rgba[i] + gradient * (end_rgba[i] - start_rgba[i])
-
-    return result
+        ramp = np.linspace(0, 1, height).reshape(height, 1, 1)
+    gradient = np.empty((height, width, 4))
+    gradient[...] = start_rgba + ramp * (end_rgba - start_rgba)
+    return gradient
 
 
 def add_glow_effect(ax, x, y, color: str, alpha: float = 0.3, linewidth: float = 8.0) -> None:
     """Add a glow effect to a line. @zara"""
+    if is_preview():
+        return
     for lw, a in [(linewidth, alpha * 0.2), (linewidth * 0.6, alpha * 0.4), (linewidth * 0.3, alpha * 0.6)]:
         ax.plot(x, y, color=color, linewidth=lw, alpha=a, solid_capstyle="round")
 
 
 def draw_rounded_bar(ax, x, height, width, color, radius: float = 0.3, **kwargs) -> None:
     """Draw a bar with rounded corners. @zara"""
+    if is_preview():
+        from matplotlib.patches import Rectangle
+
+        ax.add_patch(Rectangle((x - width / 2, 0), width, height, facecolor=color, edgecolor="none", **kwargs))
+        return
+
     from matplotlib.patches import FancyBboxPatch
 
     left = x - width / 2
@@ -232,15 +357,23 @@ def draw_glass_box(
     from matplotlib.patches import FancyBboxPatch
     from matplotlib.transforms import Bbox
 
-    styles = ChartStyles()
+    styles = get_chart_styles()
 
-    props = dict(
-        boxstyle="round,pad=0.5,rounding_size=0.2",
-        facecolor=styles.background_card,
-        edgecolor=border_color or styles.border,
-        alpha=0.85,
-        linewidth=1.5,
-    )
+    if is_preview():
+        props = dict(
+            boxstyle="square,pad=0.5",
+            facecolor=styles.background_card,
+            edgecolor=border_color or styles.border,
+            linewidth=1.0,
+        )
+    else:
+        props = dict(
+            boxstyle="round,pad=0.5,rounding_size=0.2",
+            facecolor=styles.background_card,
+            edgecolor=border_color or styles.border,
+            alpha=0.85,
+            linewidth=1.5,
+        )
 
     ax.text(
         x, y,
@@ -257,29 +390,23 @@ def draw_glass_box(
 
 def create_price_colormap() -> "LinearSegmentedColormap":
     """Create a colormap for prices. @zara"""
-    from matplotlib.colors import LinearSegmentedColormap
-
-    styles = ChartStyles()
+    styles = get_chart_styles()
     colors = [styles.price_green, styles.solar_yellow, styles.price_red]
-    return LinearSegmentedColormap.from_list("price_cmap", colors, N=256)
+    return _cached_colormap("price_cmap", colors)
 
 
 def create_accuracy_colormap() -> "LinearSegmentedColormap":
     """Create a colormap for accuracy. @zara"""
-    from matplotlib.colors import LinearSegmentedColormap
-
-    styles = ChartStyles()
+    styles = get_chart_styles()
     colors = [styles.accuracy_bad, styles.accuracy_medium, styles.accuracy_good]
-    return LinearSegmentedColormap.from_list("accuracy_cmap", colors, N=256)
+    return _cached_colormap("accuracy_cmap", colors)
 
 
 def create_solar_colormap() -> "LinearSegmentedColormap":
     """Create a colormap for solar production. @zara"""
-    from matplotlib.colors import LinearSegmentedColormap
-
-    styles = ChartStyles()
+    styles = get_chart_styles()
     colors = [styles.background_light, styles.solar_yellow, styles.solar_orange]
-    return LinearSegmentedColormap.from_list("solar_cmap", colors, N=256)
+    return _cached_colormap("solar_cmap", colors)
 
 
 COLOR_PALETTE_SOLAR = [
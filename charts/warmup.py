@@ -0,0 +1,145 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Renderer warm-up and render timing statistics. @zara"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RenderTimings:
+    """Warm-up time kept apart from the time spent on real charts. @zara"""
+
+    def __init__(self) -> None:
+        """Initialize empty counters. @zara"""
+        self._lock = threading.Lock()
+        self.warmup_seconds: float | None = None
+        self.warmup_steps: dict[str, float] = {}
+        self._renders: dict[str, list[float]] = {}
+
+    def record_warmup(self, steps: dict[str, float]) -> None:
+        """Store the duration of each warm-up step. @zara"""
+        with self._lock:
+            self.warmup_steps = steps
+            self.warmup_seconds = sum(steps.values())
+
+    def record_render(self, chart: str, seconds: float) -> None:
+        """Add one chart render (count, total, last, max). @zara"""
+        with self._lock:
+            entry = self._renders.setdefault(chart, [0, 0.0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = seconds
+            entry[3] = max(entry[3], seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return warm-up and per-chart render timings in milliseconds. @zara"""
+        with self._lock:
+            return {
+                "warmup_ms": (
+                    round(self.warmup_seconds * 1000, 1)
+                    if self.warmup_seconds is not None else None
+                ),
+                "warmup_steps_ms": {
+                    step: round(seconds * 1000, 1)
+                    for step, seconds in self.warmup_steps.items()
+                },
+                "renders": {
+                    chart: {
+                        "count": count,
+                        "avg_ms": round(total / count * 1000, 1),
+                        "last_ms": round(last * 1000, 1),
+                        "max_ms": round(peak * 1000, 1),
+                    }
+                    for chart, (count, total, last, peak) in self._renders.items()
+                },
+            }
+
+
+render_timings = RenderTimings()
+
+
+def warm_up_renderer() -> dict[str, float]:
+    """Import matplotlib, load fonts and styles, and draw a tiny figure. @zara"""
+    steps: dict[str, float] = {}
+
+    started = time.perf_counter()
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    steps["import"] = time.perf_counter() - started
+
+    from .styles import (
+        apply_dark_theme,
+        create_accuracy_colormap,
+        create_price_colormap,
+        create_solar_colormap,
+        get_chart_styles,
+    )
+
+    started = time.perf_counter()
+    from matplotlib import font_manager
+
+    font_manager.findfont(get_chart_styles().font_family)
+    steps["fonts"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    apply_dark_theme()
+    create_price_colormap()
+    create_accuracy_colormap()
+    create_solar_colormap()
+    steps["styles"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    fig = Figure(figsize=(1, 1))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.plot([0, 1], [0, 1])
+    ax.set_title("warm-up")
+    canvas.draw()
+    fig.clear()
+    steps["render"] = time.perf_counter() - started
+
+    return steps
+
+
+async def async_warm_up(delay: float = 0.0) -> dict[str, Any]:
+    """Warm up the render executor (and process pool) in the background. @zara"""
+    from .base import _MATPLOTLIB_EXECUTOR
+    from .render_pool import async_render_png, render_pool_enabled
+
+    if delay:
+        await asyncio.sleep(delay)
+
+    loop = asyncio.get_running_loop()
+    steps = await loop.run_in_executor(_MATPLOTLIB_EXECUTOR, warm_up_renderer)
+
+    if render_pool_enabled():
+        from matplotlib.figure import Figure
+
+        started = time.perf_counter()
+        fig = await loop.run_in_executor(_MATPLOTLIB_EXECUTOR, Figure, (1, 1))
+        await async_render_png(fig, {"dpi": 50}, _MATPLOTLIB_EXECUTOR)
+        steps["process_pool"] = time.perf_counter() - started
+
+    render_timings.record_warmup(steps)
+    _LOGGER.info(
+        "Chart renderer warmed up in %.0f ms (%s)",
+        sum(steps.values()) * 1000,
+        ", ".join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in steps.items()),
+    )
+    return render_timings.as_dict()
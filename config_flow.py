@@ -100,6 +100,13 @@ from .const import (
     CONF_SENSOR_WALLBOX_POWER,
     CONF_SENSOR_WALLBOX_DAILY,
     CONF_SENSOR_WALLBOX_STATE,
+    CONF_CHART_RENDER_PROCESSES,
+    CHART_RENDER_PROCESSES,
+    CONF_CHART_POSTPROCESS,
+    CHART_POSTPROCESS_ENABLED,
+    CONF_LIVE_PUSH_INTERVAL,
+    LIVE_PUSH_INTERVAL_SECONDS,
+    LIVE_PUSH_MIN_INTERVAL_SECONDS,
 )
 from .sensor_helpers import check_and_suggest_helpers
 
@@ -710,6 +717,8 @@ class SFMLStatsOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_forecast_comparison()
             elif next_step == "debug_mode":
                 return await self.async_step_debug_mode()
+            elif next_step == "performance":
+                return await self.async_step_performance()
 
         return self.async_show_form(
             step_id="advanced",
@@ -719,6 +728,7 @@ class SFMLStatsOptionsFlow(config_entries.OptionsFlow):
                     "panel_group_names": "Panel Group Names",
                     "forecast_comparison": "Forecast Comparison",
                     "debug_mode": "Full-KI Transparency Mode",
+                    "performance": "Performance",
                 }),
             }),
         )
@@ -897,3 +907,35 @@ class SFMLStatsOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(CONF_SHOW_PANEL_GROUPS, default=is_active): selector.BooleanSelector(),
             }),
         )
+
+    async def async_step_performance(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> FlowResult:
+        """Chart render processes, post-processing and live push rate. @zara"""
+        if user_input is not None:
+            new_data = {**self._config_entry.data, **user_input}
+            self.hass.config_entries.async_update_entry(
+                self._config_entry, data=new_data
+            )
+            return self.async_create_entry(title="", data={})
+
+        current = self._config_entry.data
+
+        return self.async_show_form(
+            step_id="performance",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_CHART_RENDER_PROCESSES,
+                    default=current.get(CONF_CHART_RENDER_PROCESSES, CHART_RENDER_PROCESSES),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=8)),
+                vol.Required(
+                    CONF_CHART_POSTPROCESS,
+                    default=current.get(CONF_CHART_POSTPROCESS, CHART_POSTPROCESS_ENABLED),
+                ): bool,
+                vol.Required(
+                    CONF_LIVE_PUSH_INTERVAL,
+                    default=current.get(CONF_LIVE_PUSH_INTERVAL, LIVE_PUSH_INTERVAL_SECONDS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=LIVE_PUSH_MIN_INTERVAL_SECONDS)),
+            }),
+        )
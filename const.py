@@ -67,6 +67,35 @@ MONTHLY_REPORT_PATTERN: Final = "monthly_report_{year}_{month:02d}.png"
 CHART_SIZE_WEEKLY: Final = (16, 20)
 CHART_SIZE_MONTHLY: Final = (18, 24)
 CHART_DPI: Final = 150
+CHART_PREVIEW_DPI: Final = 50
+CHART_PREVIEW_SUFFIX: Final = "_preview"
+
+# 0 keeps rendering on the in-process thread executor @zara
+CHART_RENDER_PROCESSES: Final = 0
+CHART_RENDER_TIMEOUT_SECONDS: Final = 120
+RENDER_CACHE_MANIFEST: Final = "render_manifest.json"
+CHART_WARMUP_DELAY_SECONDS: Final = 30
+RENDER_ASSET_CACHE_MAX_BYTES: Final = 32 * 1024 * 1024
+RENDER_ASSET_CACHE_MAX_ENTRIES: Final = 128
+
+# Lossy PNG palette optimisation and WebP variant after each render @zara
+CHART_POSTPROCESS_ENABLED: Final = True
+CHART_PALETTE_COLORS: Final = 256
+CHART_WEBP_QUALITY: Final = 85
+
+# Render job queue, lower priority values run first @zara
+RENDER_PRIORITY_INTERACTIVE: Final = 0
+RENDER_PRIORITY_SCHEDULED: Final = 10
+RENDER_QUEUE_MAX_DEPTH: Final = 16
+RENDER_QUEUE_WORKERS: Final = 2
+RENDER_QUEUE_RETRY_AFTER_SECONDS: Final = 10
+RENDER_JOB_HISTORY: Final = 50
+
+# Websocket live push of energy flow and summary @zara
+LIVE_PUSH_INTERVAL_SECONDS: Final = 2.0
+LIVE_PUSH_MIN_INTERVAL_SECONDS: Final = 0.5
+LIVE_PUSH_REFRESH_SECONDS: Final = 60
+LIVE_PUSH_FETCH_TIMEOUT_SECONDS: Final = 10
 
 WEEKLY_REPORT_DAY: Final = 6
 WEEKLY_REPORT_HOUR: Final = 23
@@ -118,6 +147,9 @@ CONF_GENERATE_MONTHLY: Final = "generate_monthly"
 CONF_AUTO_GENERATE: Final = "auto_generate"
 CONF_THEME: Final = "theme"
 CONF_DASHBOARD_STYLE: Final = "dashboard_style"
+CONF_CHART_RENDER_PROCESSES: Final = "chart_render_processes"
+CONF_LIVE_PUSH_INTERVAL: Final = "live_push_interval"
+CONF_CHART_POSTPROCESS: Final = "chart_postprocess"
 
 THEME_DARK: Final = "dark"
 THEME_LIGHT: Final = "light"
@@ -275,10 +307,17 @@ POWER_COLLECTION_INTERVAL_SECONDS: Final = 300
 POWER_DATA_RETENTION_DAYS: Final = 730
 
 API_CACHE_TTL_SECONDS: Final = 30
+API_BATCH_MAX_RESOURCES: Final = 12
+API_TARIFF_SIMULATION_MAX_SCENARIOS: Final = 50
 MAX_HISTORY_HOURS: Final = 168
 
 WEATHER_HISTORY_DAYS: Final = 365
 SUN_HOURS_RADIATION_THRESHOLD: Final = 100
+WEATHER_ROLLUPS_FILE: Final = "daily_weather_rollups.json"
+WEATHER_ROLLUP_RECOMPUTE_DAYS: Final = 2
+WEATHER_STATS_REFRESH_SECONDS: Final = 300
+WEATHER_ACCURACY_MAX_DAYS: Final = 800
+WEATHER_ANALYTICS_MAX_DAYS: Final = 365
 
 FILE_RETRY_COUNT: Final = 3
 FILE_RETRY_DELAY_SECONDS: Final = 0.1
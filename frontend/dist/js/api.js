@@ -52,63 +52,111 @@ const SFMLApi = {
 
     // Convenience methods for common endpoints
     async getSummary(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/summary', { forceRefresh });
+        return this.fetch(this.resourceUrl('summary'), { forceRefresh });
     },
 
     async getSolar(days = 7, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/solar?days=${days}`, { forceRefresh });
+        return this.fetch(this.resourceUrl('solar', { days }), { forceRefresh });
     },
 
     async getPrices(days = 2, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/prices?days=${days}`, { forceRefresh });
+        return this.fetch(this.resourceUrl('prices', { days }), { forceRefresh });
     },
 
     async getEnergyFlow(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/energy_flow', { forceRefresh });
+        return this.fetch(this.resourceUrl('energy_flow'), { forceRefresh });
     },
 
     async getStatistics(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/statistics', { forceRefresh });
+        return this.fetch(this.resourceUrl('statistics'), { forceRefresh });
     },
 
     async getBilling(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/billing', { forceRefresh });
+        return this.fetch(this.resourceUrl('billing'), { forceRefresh });
     },
 
     async getPowerSourcesHistory(hours = 24, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/power_sources_history?hours=${hours}`, { forceRefresh, ttl: 60000 });
+        return this.fetch(this.resourceUrl('power_sources_history', { hours }), { forceRefresh, ttl: 60000 });
     },
 
     async getSolarHistory(days = 30, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/solar_history?days=${days}`, { forceRefresh, ttl: 300000 });
+        return this.fetch(this.resourceUrl('solar_history', { days }), { forceRefresh, ttl: 300000 });
     },
 
     async getBatteryHistory(hours = 24, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/battery_history?hours=${hours}`, { forceRefresh, ttl: 60000 });
+        return this.fetch(this.resourceUrl('battery_history', { hours }), { forceRefresh, ttl: 60000 });
     },
 
     async getHouseHistory(hours = 24, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/house_history?hours=${hours}`, { forceRefresh, ttl: 60000 });
+        return this.fetch(this.resourceUrl('house_history', { hours }), { forceRefresh, ttl: 60000 });
     },
 
     async getGridHistory(hours = 24, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/grid_history?hours=${hours}`, { forceRefresh, ttl: 60000 });
+        return this.fetch(this.resourceUrl('grid_history', { hours }), { forceRefresh, ttl: 60000 });
     },
 
     async getWeatherHistory(days = 7, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/weather_history?days=${days}`, { forceRefresh, ttl: 300000 });
+        return this.fetch(this.resourceUrl('weather_history', { days }), { forceRefresh, ttl: 300000 });
     },
 
     async getClothingRecommendation(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/clothing_recommendation', { forceRefresh, ttl: 300000 });
+        return this.fetch(this.resourceUrl('clothing_recommendation'), { forceRefresh, ttl: 300000 });
     },
 
     async getForecastComparison(forceRefresh = false) {
-        return this.fetch('/api/sfml_stats/forecast_comparison', { forceRefresh, ttl: 300000 });
+        return this.fetch(this.resourceUrl('forecast_comparison'), { forceRefresh, ttl: 300000 });
     },
 
     async getShadowAnalytics(days = 30, forceRefresh = false) {
-        return this.fetch(`/api/sfml_stats/shadow_analytics?days=${days}`, { forceRefresh, ttl: 300000 });
+        return this.fetch(this.resourceUrl('shadow_analytics', { days }), { forceRefresh, ttl: 300000 });
+    },
+
+    // URL of a single resource; getBatch caches under the same URL
+    resourceUrl(name, params = {}) {
+        const query = new URLSearchParams(params).toString();
+        return `/api/sfml_stats/${name}${query ? `?${query}` : ''}`;
+    },
+
+    // Several resources in one request, e.g. { summary: {}, solar: { days: 7 } }
+    // or ['summary', 'statistics']. Resources still cached are not requested;
+    // the rest seed the per-URL cache the single getters read from.
+    // Resolves to { name: data } for every resource that could be served.
+    async getBatch(resources, options = {}) {
+        const { ttl = this.defaultTTL, forceRefresh = false } = options;
+        const wanted = Array.isArray(resources)
+            ? Object.fromEntries(resources.map(name => [name, {}]))
+            : resources;
+
+        const data = {};
+        const query = new URLSearchParams();
+        const missing = [];
+        for (const [name, params] of Object.entries(wanted)) {
+            const cached = this.cache.get(this.resourceUrl(name, params));
+            if (!forceRefresh && cached && Date.now() - cached.timestamp < ttl) {
+                data[name] = cached.data;
+                continue;
+            }
+            missing.push(name);
+            for (const [key, value] of Object.entries(params || {})) {
+                query.set(`${name}.${key}`, value);
+            }
+        }
+        if (!missing.length) {
+            return data;
+        }
+
+        query.set('resources', missing.join(','));
+        const response = await fetch(`/api/sfml_stats/batch?${query}`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        const result = await response.json();
+        const timestamp = Date.now();
+        for (const [name, value] of Object.entries(result.resources || {})) {
+            this.cache.set(this.resourceUrl(name, wanted[name]), { data: value, timestamp });
+            data[name] = value;
+        }
+        return data;
     },
 
     // Clear cache (useful for forcing refresh)
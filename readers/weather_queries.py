@@ -0,0 +1,119 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""SQL queries on the observed hourly weather table of Solar Forecast ML. @zara"""
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Any
+
+from ..const import SUN_HOURS_RADIATION_THRESHOLD
+from ..storage.db_connection_manager import DatabaseConnectionManager
+from ..weather_aggregation import DailyWeatherAccumulator
+from ..weather_arrays import HOURLY_WEATHER_FIELDS, HourlyWeatherArrays
+
+_LOGGER = logging.getLogger(__name__)
+
+HOURLY_WEATHER_TABLE = "hourly_weather_actual"
+_REQUIRED_COLUMNS = frozenset({"date", "hour", *HOURLY_WEATHER_FIELDS})
+
+_HOURLY_SELECT = (
+    f"SELECT date, hour, {', '.join(HOURLY_WEATHER_FIELDS)} FROM {HOURLY_WEATHER_TABLE}"
+)
+
+# One row per day with the DailyWeatherAccumulator fields in __slots__ order @zara
+_DAILY_AGGREGATE_SELECT = """
+    SELECT
+        date,
+        COUNT(temperature_c), SUM(temperature_c), MIN(temperature_c), MAX(temperature_c),
+        COUNT(humidity_percent), SUM(humidity_percent),
+        COUNT(wind_speed_ms), SUM(wind_speed_ms), MAX(wind_speed_ms),
+        COUNT(precipitation_mm), SUM(precipitation_mm),
+        COUNT(solar_radiation_wm2), SUM(solar_radiation_wm2),
+        COUNT(CASE WHEN solar_radiation_wm2 > ? THEN 1 END),
+        COUNT(cloud_cover_percent), SUM(cloud_cover_percent)
+    FROM hourly_weather_actual
+"""
+
+
+def _date_window(start_date: date | None, end_date: date | None) -> tuple[str, list[str]]:
+    """Return the WHERE clause and parameters of an inclusive date window. @zara"""
+    conditions: list[str] = []
+    params: list[str] = []
+    if start_date is not None:
+        conditions.append("date >= ?")
+        params.append(start_date.isoformat())
+    if end_date is not None:
+        conditions.append("date <= ?")
+        params.append(end_date.isoformat())
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+def accumulator_from_row(row: Any) -> DailyWeatherAccumulator:
+    """Fill an accumulator from one daily aggregate row, skipping NULL aggregates. @zara"""
+    accumulator = DailyWeatherAccumulator()
+    for name, value in zip(DailyWeatherAccumulator.__slots__, tuple(row)[1:]):
+        if value is not None:
+            setattr(accumulator, name, value)
+    return accumulator
+
+
+class HourlyWeatherQueries:
+    """Date-window and GROUP BY queries the compiled WeatherDataReader does not offer. @zara"""
+
+    def __init__(self, manager: DatabaseConnectionManager) -> None:
+        """Bind to the shared connection manager. @zara"""
+        self._manager = manager
+        self._available: bool | None = None
+
+    async def async_is_available(self) -> bool:
+        """Return whether the table has the columns the queries use, checked once. @zara"""
+        if self._available is None:
+            try:
+                rows = await self._manager.execute_read(
+                    f"PRAGMA table_info({HOURLY_WEATHER_TABLE})"
+                )
+            except Exception as err:
+                _LOGGER.debug("Could not inspect %s: %s", HOURLY_WEATHER_TABLE, err)
+                return False
+            missing = _REQUIRED_COLUMNS - {row[1] for row in rows}
+            self._available = not missing
+            if missing:
+                _LOGGER.warning(
+                    "%s lacks %s, aggregating weather rows in Python",
+                    HOURLY_WEATHER_TABLE, ", ".join(sorted(missing)),
+                )
+        return self._available
+
+    async def async_get_daily_weather(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        sun_threshold: float = SUN_HOURS_RADIATION_THRESHOLD,
+    ) -> dict[str, DailyWeatherAccumulator]:
+        """Aggregate hourly rows per day in SQLite, one row per day is fetched. @zara"""
+        where, params = _date_window(start_date, end_date)
+        rows = await self._manager.execute_read(
+            f"{_DAILY_AGGREGATE_SELECT} {where} GROUP BY date ORDER BY date",
+            [sun_threshold, *params],
+        )
+        return {str(row[0])[:10]: accumulator_from_row(row) for row in rows}
+
+    async def async_get_hourly_weather(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> HourlyWeatherArrays:
+        """Read the hourly rows of an inclusive date window, filtered in SQL. @zara"""
+        where, params = _date_window(start_date, end_date)
+        rows = await self._manager.execute_read(
+            f"{_HOURLY_SELECT} {where} ORDER BY date, hour", params
+        )
+        return HourlyWeatherArrays.from_records(rows)
@@ -11,11 +11,13 @@
 from .daily_aggregator import DailyEnergyAggregator
 from .billing_calculator import BillingCalculator
 from .monthly_tariff_manager import MonthlyTariffManager
+from .tariff_simulator import TariffSimulator
 from .forecast_comparison_collector import ForecastComparisonCollector
 
 __all__ = [
     "DailyEnergyAggregator",
     "BillingCalculator",
     "MonthlyTariffManager",
+    "TariffSimulator",
     "ForecastComparisonCollector",
 ]
@@ -0,0 +1,180 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Epoch-hour index with local calendar boundaries for hourly billing data. @zara"""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from calendar import monthrange
+from datetime import date, datetime, timezone, tzinfo
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_PER_HOUR = 3600
+
+
+def parse_hour_key(hour_key: str, tz: tzinfo) -> int | None:
+    """Convert a local 'YYYY-MM-DD HH' style key to a UTC epoch-hour. @zara"""
+    try:
+        local = datetime(
+            int(hour_key[0:4]),
+            int(hour_key[5:7]),
+            int(hour_key[8:10]),
+            int(hour_key[11:13]) if len(hour_key) >= 13 else 0,
+            tzinfo=tz,
+        )
+    except (ValueError, IndexError):
+        return None
+    return int(local.timestamp()) // SECONDS_PER_HOUR
+
+
+def billing_period_start(year: int, start_month: int, start_day: int) -> date:
+    """Return the first day of a billing year, the month's last day if it is shorter. @zara"""
+    return date(year, start_month, min(start_day, monthrange(year, start_month)[1]))
+
+
+class HourlyBillingIndex:
+    """Sorted integer epoch-hour keys with bisect-based calendar slices. @zara"""
+
+    def __init__(self, hours: dict[str, Any], tz: tzinfo | None = None) -> None:
+        """Build the index from an hourly history mapping. @zara"""
+        self._tz = tz or timezone.utc
+
+        parsed = []
+        skipped = 0
+        for hour_key in hours:
+            epoch_hour = parse_hour_key(hour_key, self._tz)
+            if epoch_hour is None:
+                skipped += 1
+                continue
+            parsed.append((epoch_hour, hour_key))
+        parsed.sort()
+
+        self._epochs: list[int] = [epoch for epoch, _ in parsed]
+        self._keys: list[str] = [key for _, key in parsed]
+
+        # Local calendar boundaries, DST days simply span 23 or 25 hours @zara
+        self._day_bounds: dict[date, tuple[int, int]] = {}
+        self._month_bounds: dict[tuple[int, int], tuple[int, int]] = {}
+        if parsed:
+            first = self._to_local_date(self._epochs[0])
+            last = self._to_local_date(self._epochs[-1])
+            self._build_calendar(first, last)
+
+        if skipped:
+            _LOGGER.debug("Hourly index skipped %d unparseable keys", skipped)
+
+    def __len__(self) -> int:
+        """Return the number of indexed hours. @zara"""
+        return len(self._epochs)
+
+    @property
+    def keys(self) -> list[str]:
+        """Return all hour keys in chronological order. @zara"""
+        return self._keys
+
+    def _to_local_date(self, epoch_hour: int) -> date:
+        """Convert an epoch-hour to its local calendar date. @zara"""
+        return datetime.fromtimestamp(
+            epoch_hour * SECONDS_PER_HOUR, tz=self._tz
+        ).date()
+
+    def local_epoch_hour(self, day: date) -> int:
+        """Return the epoch-hour of local midnight for a date. @zara"""
+        local = datetime(day.year, day.month, day.day, tzinfo=self._tz)
+        return int(local.timestamp()) // SECONDS_PER_HOUR
+
+    def _build_calendar(self, first: date, last: date) -> None:
+        """Precompute day and month boundaries covering the indexed range. @zara"""
+        month = (first.year, first.month)
+        end_month = (last.year, last.month)
+        while month <= end_month:
+            year, mon = month
+            next_month = (year + 1, 1) if mon == 12 else (year, mon + 1)
+            start = self.local_epoch_hour(date(year, mon, 1))
+            stop = self.local_epoch_hour(date(next_month[0], next_month[1], 1))
+            self._month_bounds[month] = (start, stop)
+
+            day_start = start
+            for day_num in range(1, 32):
+                try:
+                    day = date(year, mon, day_num)
+                except ValueError:
+                    break
+                day_stop = self.local_epoch_hour(date.fromordinal(day.toordinal() + 1))
+                self._day_bounds[day] = (day_start, day_stop)
+                day_start = day_stop
+
+            month = next_month
+
+    def _slice(self, start: int, stop: int) -> tuple[int, int]:
+        """Return list positions for the half-open epoch-hour range. @zara"""
+        return bisect_left(self._epochs, start), bisect_left(self._epochs, stop)
+
+    def range_keys(self, start: int, stop: int) -> list[str]:
+        """Return keys within a half-open epoch-hour range. @zara"""
+        lo, hi = self._slice(start, stop)
+        return self._keys[lo:hi]
+
+    def month_bounds(self, year: int, month: int) -> tuple[int, int]:
+        """Return the epoch-hour range of a local calendar month. @zara"""
+        bounds = self._month_bounds.get((year, month))
+        if bounds is None:
+            next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+            bounds = (
+                self.local_epoch_hour(date(year, month, 1)),
+                self.local_epoch_hour(next_month),
+            )
+        return bounds
+
+    def day_bounds(self, day: date) -> tuple[int, int]:
+        """Return the epoch-hour range of a local calendar day. @zara"""
+        bounds = self._day_bounds.get(day)
+        if bounds is None:
+            bounds = (
+                self.local_epoch_hour(day),
+                self.local_epoch_hour(date.fromordinal(day.toordinal() + 1)),
+            )
+        return bounds
+
+    def billing_period_bounds(
+        self, year: int, start_month: int, start_day: int
+    ) -> tuple[int, int]:
+        """Return the epoch-hour range of the billing year starting in a year. @zara"""
+        return (
+            self.local_epoch_hour(billing_period_start(year, start_month, start_day)),
+            self.local_epoch_hour(billing_period_start(year + 1, start_month, start_day)),
+        )
+
+    def month_slices(self) -> list[tuple[int, int, list[str]]]:
+        """Return year, month and hour keys of every indexed month with data. @zara"""
+        slices = []
+        for (year, month), (start, stop) in sorted(self._month_bounds.items()):
+            keys = self.range_keys(start, stop)
+            if keys:
+                slices.append((year, month, keys))
+        return slices
+
+    def month_keys(self, year: int, month: int) -> list[str]:
+        """Return the hour keys of a local calendar month. @zara"""
+        return self.range_keys(*self.month_bounds(year, month))
+
+    def day_keys(self, day: date) -> list[str]:
+        """Return the hour keys of a local calendar day. @zara"""
+        return self.range_keys(*self.day_bounds(day))
+
+    def billing_period_keys(
+        self, year: int, start_month: int, start_day: int
+    ) -> list[str]:
+        """Return the hour keys of a billing period. @zara"""
+        return self.range_keys(
+            *self.billing_period_bounds(year, start_month, start_day)
+        )
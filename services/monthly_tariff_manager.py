@@ -10,19 +10,28 @@
 """Monthly tariff manager for EEG and Energy Sharing support. @zara"""
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
-from datetime import date, datetime
+from calendar import monthrange
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
+from zoneinfo import ZoneInfo
 
 import aiofiles
+from aiohttp import web
 
 from homeassistant.core import HomeAssistant
 
 from ..const import (
     DOMAIN,
     SFML_STATS_DATA,
+    CONF_BILLING_START_DAY,
+    CONF_BILLING_START_MONTH,
+    DEFAULT_BILLING_START_DAY,
+    DEFAULT_BILLING_START_MONTH,
     MONTHLY_TARIFFS_FILE,
     HOURLY_BILLING_HISTORY,
     CONF_FEED_IN_TARIFF,
@@ -47,10 +56,41 @@ from ..const import (
     GRID_FEE_FACTOR_LOW,
     GRID_FEE_FACTOR_VERY_LOW,
 )
+from .hourly_index import HourlyBillingIndex, billing_period_start
+
+CSV_GRANULARITY_MONTH = "month"
+CSV_GRANULARITY_DAY = "day"
+CSV_GRANULARITY_HOUR = "hour"
+CSV_GRANULARITIES = (CSV_GRANULARITY_MONTH, CSV_GRANULARITY_DAY, CSV_GRANULARITY_HOUR)
+
+CSV_HEADER_MONTH = (
+    "Monat;Bezug (kWh);Bezugspreis (ct/kWh);Quelle Bezugspreis;"
+    "Einspeisung (kWh);Vergütung (ct/kWh);Quelle Vergütung;"
+    "Eigenverbrauch (kWh);Referenzpreis (ct/kWh);"
+    "Netzgebühren (ct/kWh);EEG-Anteil (%);"
+    "Stromkosten (EUR);Einspeise-Erlös (EUR);Einsparung (EUR);"
+    "Status"
+)
+CSV_HEADER_DETAIL = (
+    "{period};Bezug (kWh);Börsenpreis (ct/kWh);Bezugspreis (ct/kWh);"
+    "Einspeisung (kWh);Vergütung (ct/kWh);"
+    "Eigenverbrauch (kWh);Referenzpreis (ct/kWh);"
+    "Stromkosten (EUR);Einspeise-Erlös (EUR);Einsparung (EUR);"
+    "Status"
+)
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _check_granularity(granularity: str) -> None:
+    """Reject unknown CSV granularities instead of falling back to daily rows. @zara"""
+    if granularity not in CSV_GRANULARITIES:
+        raise ValueError(
+            f"Unknown CSV granularity: {granularity} (expected one of {', '.join(CSV_GRANULARITIES)})"
+        )
+
+
 class MonthlyTariffManager:
     """Manage monthly tariffs with smart defaults and manual overrides. @zara"""
 
@@ -68,6 +108,7 @@ class MonthlyTariffManager:
         self._tariff_file = self._data_path / MONTHLY_TARIFFS_FILE
         self._hourly_file = self._data_path / HOURLY_BILLING_HISTORY
         self._cache: dict[str, Any] | None = None
+        self._hourly_cache: tuple[int, dict[str, Any], HourlyBillingIndex] | None = None
 
     def update_config(self, new_config: dict[str, Any]) -> None:
         """Update cached configuration. @zara"""
@@ -157,16 +198,40 @@ class MonthlyTariffManager:
 
     async def _load_hourly_data(self) -> dict[str, Any]:
         """Load hourly billing history data. @zara"""
-        if not self._hourly_file.exists():
-            return {"hours": {}}
+        hourly_data, _ = await self._load_hourly_indexed()
+        return hourly_data
+
+    async def _load_hourly_indexed(self) -> tuple[dict[str, Any], HourlyBillingIndex]:
+        """Load hourly data with its epoch-hour index, reusing both while unchanged. @zara"""
+        try:
+            mtime_ns = self._hourly_file.stat().st_mtime_ns
+        except OSError:
+            self._hourly_cache = None
+            return {"hours": {}}, HourlyBillingIndex({}, self._get_timezone())
+
+        if self._hourly_cache is not None and self._hourly_cache[0] == mtime_ns:
+            return self._hourly_cache[1], self._hourly_cache[2]
 
         try:
             async with aiofiles.open(self._hourly_file, "r", encoding="utf-8") as f:
                 content = await f.read()
-                return json.loads(content)
+                hourly_data = json.loads(content)
         except Exception as err:
             _LOGGER.error("Error loading hourly data: %s", err)
-            return {"hours": {}}
+            return {"hours": {}}, HourlyBillingIndex({}, self._get_timezone())
+
+        index = await self._hass.async_add_executor_job(
+            HourlyBillingIndex, hourly_data.get("hours", {}), self._get_timezone()
+        )
+        self._hourly_cache = (mtime_ns, hourly_data, index)
+        return hourly_data, index
+
+    def _get_timezone(self) -> ZoneInfo | None:
+        """Return the Home Assistant time zone used by the hourly keys. @zara"""
+        try:
+            return ZoneInfo(self._hass.config.time_zone)
+        except Exception:
+            return None
 
     def _get_month_key(self, year: int, month: int) -> str:
         """Generate month key in YYYY-MM format. @zara"""
@@ -202,14 +267,8 @@ class MonthlyTariffManager:
         share = (standard_price - weighted_price) / (standard_price - eeg_price) * 100
         return max(0.0, min(100.0, share))
 
-    async def calculate_weighted_average_price(
-        self, year: int, month: int
-    ) -> dict[str, float]:
-        """Calculate consumption-weighted average price for a month. @zara"""
-        month_key = self._get_month_key(year, month)
-        hourly_data = await self._load_hourly_data()
-        hours = hourly_data.get("hours", {})
-
+    def _summarize_hours(self, hour_items: Iterable[dict[str, Any]]) -> dict[str, float]:
+        """Calculate consumption-weighted price and totals for hourly records. @zara"""
         total_cost_ct = 0.0
         total_import_kwh = 0.0
         total_export_kwh = 0.0
@@ -217,10 +276,7 @@ class MonthlyTariffManager:
         price_count = 0
         price_sum = 0.0
 
-        for hour_key, hour_data in hours.items():
-            if not hour_key.startswith(month_key):
-                continue
-
+        for hour_data in hour_items:
             import_kwh = hour_data.get("grid_import_kwh", 0) or 0
             export_kwh = hour_data.get("grid_export_kwh", 0) or 0
             price_ct = hour_data.get("price_ct_kwh", 0) or 0
@@ -253,13 +309,61 @@ class MonthlyTariffManager:
             "hours_with_data": price_count,
         }
 
+    async def calculate_weighted_average_price(
+        self, year: int, month: int
+    ) -> dict[str, float]:
+        """Calculate consumption-weighted average price for a month. @zara"""
+        hourly_data, index = await self._load_hourly_indexed()
+        hours = hourly_data.get("hours", {})
+
+        return self._summarize_hours(
+            hours[hour_key] for hour_key in index.month_keys(year, month)
+        )
+
+    async def calculate_billing_period_summary(self, year: int) -> dict[str, Any]:
+        """Calculate totals for the billing year that starts in the given year. @zara"""
+        config = self._get_config()
+        start_month = config.get(CONF_BILLING_START_MONTH, DEFAULT_BILLING_START_MONTH)
+        start_day = config.get(CONF_BILLING_START_DAY, DEFAULT_BILLING_START_DAY)
+
+        hourly_data, index = await self._load_hourly_indexed()
+        hours = hourly_data.get("hours", {})
+
+        summary: dict[str, Any] = self._summarize_hours(
+            hours[hour_key]
+            for hour_key in index.billing_period_keys(year, start_month, start_day)
+        )
+        end = billing_period_start(year + 1, start_month, start_day) - timedelta(days=1)
+        summary["start"] = billing_period_start(year, start_month, start_day).isoformat()
+        summary["end"] = end.isoformat()
+        return summary
+
     async def get_monthly_data(self, year: int, month: int) -> dict[str, Any]:
         """Get complete monthly data with auto-calculated and override values. @zara"""
         month_key = self._get_month_key(year, month)
         data = await self._load_data()
+
+        month_data = data.get("months", {}).get(month_key, {})
+        snapshot = month_data.get("snapshot")
+        if month_data.get("is_finalized") and snapshot:
+            # Deep copy, callers must not reach into the cached snapshot @zara
+            return copy.deepcopy(snapshot)
+
+        return await self._compute_monthly_data(year, month)
+
+    async def _compute_monthly_data(
+        self,
+        year: int,
+        month: int,
+        auto_calc: dict[str, float] | None = None,
+    ) -> dict[str, Any]:
+        """Compute monthly data from hourly history, overrides and defaults. @zara"""
+        month_key = self._get_month_key(year, month)
+        data = await self._load_data()
         defaults = self._get_defaults()
 
-        auto_calc = await self.calculate_weighted_average_price(year, month)
+        if auto_calc is None:
+            auto_calc = await self.calculate_weighted_average_price(year, month)
 
         eeg_share = None
         if auto_calc["weighted_avg_price_ct"] > 0:
@@ -376,6 +480,12 @@ class MonthlyTariffManager:
 
         data["months"][month_key]["overrides"] = existing_overrides
         data["months"][month_key]["updated_at"] = datetime.now().isoformat()
+        data["months"][month_key].pop("snapshot", None)
+
+        if data["months"][month_key].get("is_finalized"):
+            # Refreeze with the new overrides, the cache already holds them @zara
+            snapshot = await self._compute_monthly_data(year, month)
+            data["months"][month_key]["snapshot"] = snapshot
 
         return await self._save_data(data)
 
@@ -386,30 +496,64 @@ class MonthlyTariffManager:
         recalculate_history: bool = True,
     ) -> dict[str, Any]:
         """Mark a month as finalized after billing. @zara"""
+        batch = await self.finalize_months([(year, month)], recalculate_history)
         month_key = self._get_month_key(year, month)
         data = await self._load_data()
 
+        result = {
+            "success": True,
+            "month_key": month_key,
+            "finalized_at": data["months"][month_key]["finalized_at"],
+            "recalculated": False,
+        }
+
+        if recalculate_history:
+            recalc_result = self._single_month_result(batch["recalculation_details"], month_key)
+            result["recalculated"] = recalc_result
+            result["recalculation_details"] = recalc_result
+
+        return result
+
+    async def finalize_months(
+        self,
+        periods: list[tuple[int, int]],
+        recalculate_history: bool = True,
+    ) -> dict[str, Any]:
+        """Finalize several months with one tariff save and one history write. @zara"""
+        data = await self._load_data()
+
         if "months" not in data:
             data["months"] = {}
 
-        if month_key not in data["months"]:
-            data["months"][month_key] = {"overrides": {}}
+        finalized_at = datetime.now().isoformat()
+        month_keys = []
+        for year, month in periods:
+            month_key = self._get_month_key(year, month)
+            month_keys.append(month_key)
 
-        data["months"][month_key]["is_finalized"] = True
-        data["months"][month_key]["finalized_at"] = datetime.now().isoformat()
+            if month_key not in data["months"]:
+                data["months"][month_key] = {"overrides": {}}
+
+            data["months"][month_key]["is_finalized"] = True
+            data["months"][month_key]["finalized_at"] = finalized_at
+            data["months"][month_key].pop("snapshot", None)
+
+            # Freeze the fully computed result, only unfinalize/override drop it @zara
+            snapshot = await self._compute_monthly_data(year, month)
+            data["months"][month_key]["snapshot"] = snapshot
 
         await self._save_data(data)
 
         result = {
             "success": True,
-            "month_key": month_key,
-            "finalized_at": data["months"][month_key]["finalized_at"],
+            "month_keys": month_keys,
+            "finalized_at": finalized_at,
             "recalculated": False,
         }
 
         if recalculate_history:
-            recalc_result = await self._recalculate_month_history(year, month)
-            result["recalculated"] = recalc_result
+            recalc_result = await self._recalculate_months_history(periods)
+            result["recalculated"] = recalc_result.get("success", False)
             result["recalculation_details"] = recalc_result
 
         return result
@@ -422,6 +566,7 @@ class MonthlyTariffManager:
         if month_key in data.get("months", {}):
             data["months"][month_key]["is_finalized"] = False
             data["months"][month_key].pop("finalized_at", None)
+            data["months"][month_key].pop("snapshot", None)
             return await self._save_data(data)
 
         return True
@@ -430,13 +575,39 @@ class MonthlyTariffManager:
         self, year: int, month: int
     ) -> dict[str, Any]:
         """Recalculate historical data for a month with correct prices. @zara"""
-        month_key = self._get_month_key(year, month)
-        month_data = await self.get_monthly_data(year, month)
+        recalc_result = await self._recalculate_months_history([(year, month)])
+        return self._single_month_result(recalc_result, self._get_month_key(year, month))
+
+    @staticmethod
+    def _single_month_result(recalc_result: dict[str, Any], month_key: str) -> dict[str, Any]:
+        """Reduce a multi-month recalculation to the single-month result shape. @zara"""
+        if not recalc_result.get("success"):
+            return recalc_result
+        month_result = recalc_result.get("months", {}).get(month_key, {})
+        return {
+            "success": True,
+            "days_updated": month_result.get("days_updated", 0),
+            "prices_used": month_result.get("prices_used", {}),
+            "bytes_written": recalc_result["bytes_written"],
+        }
 
-        effective = month_data["effective"]
-        import_price = effective["import_price_ct"]["value"]
-        export_price = effective["export_price_ct"]["value"]
-        reference_price = effective["reference_price_ct"]["value"]
+    async def _recalculate_months_history(
+        self, periods: list[tuple[int, int]]
+    ) -> dict[str, Any]:
+        """Recalculate daily history for several months in a single write.
+
+        The file is shared with the compiled aggregator and views, so it is
+        still read and rewritten whole; batching months saves the repeats. @zara
+        """
+        prices_by_month: dict[str, dict[str, float]] = {}
+        for year, month in periods:
+            month_data = await self.get_monthly_data(year, month)
+            effective = month_data["effective"]
+            prices_by_month[month_data["month_key"]] = {
+                "import_ct": effective["import_price_ct"]["value"],
+                "export_ct": effective["export_price_ct"]["value"],
+                "reference_ct": effective["reference_price_ct"]["value"],
+            }
 
         daily_file = self._data_path / "daily_energy_history.json"
         if not daily_file.exists():
@@ -447,15 +618,25 @@ class MonthlyTariffManager:
                 content = await f.read()
                 daily_data = json.loads(content)
         except Exception as err:
+            _LOGGER.error("Error loading daily history for recalculation: %s", err)
             return {"success": False, "error": "Internal server error"}
 
-        days_updated = 0
         days = daily_data.get("days", {})
+        months_result: dict[str, dict[str, Any]] = {
+            month_key: {"days_updated": 0, "prices_used": prices}
+            for month_key, prices in prices_by_month.items()
+        }
+        records_changed = 0
 
         for day_key, day_data in days.items():
-            if not day_key.startswith(month_key):
+            prices = prices_by_month.get(day_key[:7])
+            if prices is None:
                 continue
 
+            import_price = prices["import_ct"]
+            export_price = prices["export_ct"]
+            reference_price = prices["reference_ct"]
+
             import_kwh = day_data.get("grid_import_kwh", 0) or 0
             export_kwh = day_data.get("grid_export_kwh", 0) or 0
             self_consumption_kwh = (
@@ -463,38 +644,58 @@ class MonthlyTariffManager:
                 (day_data.get("battery_to_house_kwh", 0) or 0)
             )
 
-            day_data["finalized_import_price_ct"] = import_price
-            day_data["finalized_export_price_ct"] = export_price
-            day_data["finalized_reference_price_ct"] = reference_price
-            day_data["grid_cost_eur"] = round((import_kwh * import_price) / 100, 2)
-            day_data["feed_in_revenue_eur"] = round((export_kwh * export_price) / 100, 2)
-            day_data["savings_eur"] = round((self_consumption_kwh * reference_price) / 100, 2)
-            day_data["is_finalized"] = True
-
-            days_updated += 1
-
-        daily_data["days"] = days
-        daily_data["last_recalculation"] = datetime.now().isoformat()
-
-        try:
-            async with aiofiles.open(daily_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(daily_data, indent=2, ensure_ascii=False))
-        except Exception as err:
-            return {"success": False, "error": "Internal server error"}
-
-        _LOGGER.info(
-            "Recalculated %d days for %s with import=%.2f, export=%.2f, ref=%.2f ct/kWh",
-            days_updated, month_key, import_price, export_price, reference_price
+            updates = {
+                "finalized_import_price_ct": import_price,
+                "finalized_export_price_ct": export_price,
+                "finalized_reference_price_ct": reference_price,
+                "grid_cost_eur": round((import_kwh * import_price) / 100, 2),
+                "feed_in_revenue_eur": round((export_kwh * export_price) / 100, 2),
+                "savings_eur": round((self_consumption_kwh * reference_price) / 100, 2),
+                "is_finalized": True,
+            }
+            if any(day_data.get(key) != value for key, value in updates.items()):
+                day_data.update(updates)
+                records_changed += 1
+
+            months_result[day_key[:7]]["days_updated"] += 1
+
+        bytes_written = 0
+        if records_changed:
+            daily_data["last_recalculation"] = datetime.now().isoformat()
+            payload = json.dumps(daily_data, indent=2, ensure_ascii=False).encode("utf-8")
+            temp_file = daily_file.with_suffix(".tmp")
+
+            try:
+                async with aiofiles.open(temp_file, "wb") as f:
+                    await f.write(payload)
+                await self._hass.async_add_executor_job(temp_file.replace, daily_file)
+            except Exception as err:
+                _LOGGER.error("Error writing recalculated daily history: %s", err)
+                await self._hass.async_add_executor_job(
+                    functools.partial(temp_file.unlink, missing_ok=True)
+                )
+                return {"success": False, "error": "Internal server error"}
+
+            bytes_written = len(payload)
+
+        for month_key, month_result in months_result.items():
+            prices = month_result["prices_used"]
+            _LOGGER.info(
+                "Recalculated %d days for %s with import=%.2f, export=%.2f, ref=%.2f ct/kWh",
+                month_result["days_updated"], month_key,
+                prices["import_ct"], prices["export_ct"], prices["reference_ct"],
+            )
+        _LOGGER.debug(
+            "History recalculation for %d months changed %d records, wrote %d bytes",
+            len(months_result), records_changed, bytes_written,
         )
 
         return {
             "success": True,
-            "days_updated": days_updated,
-            "prices_used": {
-                "import_ct": import_price,
-                "export_ct": export_price,
-                "reference_ct": reference_price,
-            },
+            "days_updated": sum(m["days_updated"] for m in months_result.values()),
+            "records_changed": records_changed,
+            "bytes_written": bytes_written,
+            "months": months_result,
         }
 
     async def get_all_months(
@@ -506,16 +707,42 @@ class MonthlyTariffManager:
         if year is None:
             year = date.today().year
 
-        months = []
+        periods = []
         for month in range(1, 13):
             if year == date.today().year and month > date.today().month:
                 if not include_empty:
                     continue
+            periods.append((year, month))
 
-            month_data = await self.get_monthly_data(year, month)
-            months.append(month_data)
+        hourly_data, index = await self._load_hourly_indexed()
+        hours = hourly_data.get("hours", {})
+
+        return [
+            await self._get_monthly_data_shared(y, m, hours, index)
+            for y, m in periods
+        ]
+
+    async def _get_monthly_data_shared(
+        self,
+        year: int,
+        month: int,
+        hours: dict[str, Any],
+        index: HourlyBillingIndex,
+    ) -> dict[str, Any]:
+        """Get monthly data from an already loaded and grouped hourly history. @zara"""
+        month_key = self._get_month_key(year, month)
+        data = await self._load_data()
+
+        month_data = data.get("months", {}).get(month_key, {})
+        snapshot = month_data.get("snapshot")
+        if month_data.get("is_finalized") and snapshot:
+            # Deep copy, callers must not reach into the cached snapshot @zara
+            return copy.deepcopy(snapshot)
 
-        return months
+        auto_calc = self._summarize_hours(
+            hours[hour_key] for hour_key in index.month_keys(year, month)
+        )
+        return await self._compute_monthly_data(year, month, auto_calc)
 
     async def get_year_summary(self, year: int) -> dict[str, Any]:
         """Get yearly summary with totals and averages. @zara"""
@@ -556,6 +783,9 @@ class MonthlyTariffManager:
 
         avg_import_price = price_sum / price_count if price_count > 0 else 0
 
+        # Totals of the configured billing year, which need not start on January 1st @zara
+        billing_period = await self.calculate_billing_period_summary(year)
+
         return {
             "year": year,
             "months_with_data": len([m for m in months if m["auto_calculated"]["hours_with_data"] > 0]),
@@ -572,69 +802,217 @@ class MonthlyTariffManager:
             "averages": {
                 "import_price_ct": round(avg_import_price, 2),
             },
+            "billing_period": billing_period,
             "months": months,
         }
 
-    async def export_csv(
+    async def iter_csv(
         self,
         start_year: int,
         start_month: int,
         end_year: int,
         end_month: int,
-    ) -> str:
-        """Export monthly data as CSV. @zara"""
-        lines = [
-            "Monat;Bezug (kWh);Bezugspreis (ct/kWh);Quelle Bezugspreis;"
-            "Einspeisung (kWh);Vergütung (ct/kWh);Quelle Vergütung;"
-            "Eigenverbrauch (kWh);Referenzpreis (ct/kWh);"
-            "Netzgebühren (ct/kWh);EEG-Anteil (%);"
-            "Stromkosten (EUR);Einspeise-Erlös (EUR);Einsparung (EUR);"
-            "Status"
-        ]
+        granularity: str = CSV_GRANULARITY_MONTH,
+    ) -> AsyncIterator[str]:
+        """Yield CSV lines for a month range from one pass over the history. @zara"""
+        _check_granularity(granularity)
+        hourly_data, index = await self._load_hourly_indexed()
+        hours = hourly_data.get("hours", {})
+
+        if granularity == CSV_GRANULARITY_MONTH:
+            yield CSV_HEADER_MONTH
+        else:
+            period = "Stunde" if granularity == CSV_GRANULARITY_HOUR else "Tag"
+            yield CSV_HEADER_DETAIL.format(period=period)
 
         current = date(start_year, start_month, 1)
         end = date(end_year, end_month, 1)
 
         while current <= end:
-            m = await self.get_monthly_data(current.year, current.month)
-            auto = m["auto_calculated"]
-            eff = m["effective"]
-
-            import_price = eff["import_price_ct"]["value"]
-            export_price = eff["export_price_ct"]["value"]
-            reference_price = eff["reference_price_ct"]["value"]
-            grid_fee = eff["grid_fee_ct"]["value"]
-            eeg_share = eff["eeg_share_percent"]["value"]
-
-            grid_cost = (auto["import_kwh"] * import_price) / 100
-            feed_in = (auto["export_kwh"] * export_price) / 100
-            savings = (auto["self_consumption_kwh"] * reference_price) / 100
-
-            status = "Finalisiert" if m["is_finalized"] else "Offen"
-
-            line = (
-                f"{m['month_key']};"
-                f"{auto['import_kwh']:.2f};"
-                f"{import_price:.2f};{eff['import_price_ct']['source']};"
-                f"{auto['export_kwh']:.2f};"
-                f"{export_price:.2f};{eff['export_price_ct']['source']};"
-                f"{auto['self_consumption_kwh']:.2f};"
-                f"{reference_price:.2f};"
-                f"{grid_fee:.2f};"
-                f"{eeg_share:.1f};"
-                f"{grid_cost:.2f};"
-                f"{feed_in:.2f};"
-                f"{savings:.2f};"
-                f"{status}"
+            m = await self._get_monthly_data_shared(
+                current.year, current.month, hours, index
             )
-            lines.append(line)
+
+            if granularity == CSV_GRANULARITY_MONTH:
+                yield self._format_month_row(m)
+            else:
+                if granularity == CSV_GRANULARITY_HOUR:
+                    periods = [
+                        (hour_key, [hour_key])
+                        for hour_key in index.month_keys(current.year, current.month)
+                    ]
+                else:
+                    # Slices between local midnights instead of grouping by key prefix @zara
+                    days = (
+                        date(current.year, current.month, day)
+                        for day in range(1, monthrange(current.year, current.month)[1] + 1)
+                    )
+                    periods = [(day.isoformat(), index.day_keys(day)) for day in days]
+                for line in self._format_detail_rows(m, hours, periods, granularity):
+                    yield line
 
             if current.month == 12:
                 current = date(current.year + 1, 1, 1)
             else:
                 current = date(current.year, current.month + 1, 1)
 
-        return "\n".join(lines)
+    def _format_month_row(self, m: dict[str, Any]) -> str:
+        """Format one monthly CSV row. @zara"""
+        auto = m["auto_calculated"]
+        eff = m["effective"]
+
+        import_price = eff["import_price_ct"]["value"]
+        export_price = eff["export_price_ct"]["value"]
+        reference_price = eff["reference_price_ct"]["value"]
+        grid_fee = eff["grid_fee_ct"]["value"]
+        eeg_share = eff["eeg_share_percent"]["value"]
+
+        grid_cost = (auto["import_kwh"] * import_price) / 100
+        feed_in = (auto["export_kwh"] * export_price) / 100
+        savings = (auto["self_consumption_kwh"] * reference_price) / 100
+
+        status = "Finalisiert" if m["is_finalized"] else "Offen"
+
+        return (
+            f"{m['month_key']};"
+            f"{auto['import_kwh']:.2f};"
+            f"{import_price:.2f};{eff['import_price_ct']['source']};"
+            f"{auto['export_kwh']:.2f};"
+            f"{export_price:.2f};{eff['export_price_ct']['source']};"
+            f"{auto['self_consumption_kwh']:.2f};"
+            f"{reference_price:.2f};"
+            f"{grid_fee:.2f};"
+            f"{eeg_share:.1f};"
+            f"{grid_cost:.2f};"
+            f"{feed_in:.2f};"
+            f"{savings:.2f};"
+            f"{status}"
+        )
+
+    def _format_detail_rows(
+        self,
+        m: dict[str, Any],
+        hours: dict[str, Any],
+        periods: Iterable[tuple[str, list[str]]],
+        granularity: str,
+    ) -> Iterable[str]:
+        """Yield daily or hourly CSV rows priced with the month's effective tariffs. @zara"""
+        eff = m["effective"]
+        import_price = eff["import_price_ct"]["value"]
+        export_price = eff["export_price_ct"]["value"]
+        reference_price = eff["reference_price_ct"]["value"]
+        status = "Finalisiert" if m["is_finalized"] else "Offen"
+
+        for period, hour_keys in periods:
+            if not hour_keys:
+                continue
+            total_import = total_export = total_self = cost = priced_kwh = 0.0
+            price_ct = 0.0
+            for hour_key in hour_keys:
+                hour_data = hours[hour_key]
+                import_kwh = hour_data.get("grid_import_kwh", 0) or 0
+                price_ct = hour_data.get("price_ct_kwh", 0) or 0
+                total_import += import_kwh
+                total_export += hour_data.get("grid_export_kwh", 0) or 0
+                total_self += (
+                    (hour_data.get("solar_to_house_kwh", 0) or 0) +
+                    (hour_data.get("battery_to_house_kwh", 0) or 0)
+                )
+                if import_kwh > 0 and price_ct > 0:
+                    cost += import_kwh * price_ct
+                    priced_kwh += import_kwh
+
+            # An hour shows its market price, a day the import-weighted average @zara
+            if granularity == CSV_GRANULARITY_HOUR:
+                market = price_ct
+            else:
+                market = cost / priced_kwh if priced_kwh > 0 else 0.0
+
+            yield (
+                f"{period};"
+                f"{total_import:.3f};"
+                f"{market:.2f};"
+                f"{import_price:.2f};"
+                f"{total_export:.3f};"
+                f"{export_price:.2f};"
+                f"{total_self:.3f};"
+                f"{reference_price:.2f};"
+                f"{(total_import * import_price) / 100:.2f};"
+                f"{(total_export * export_price) / 100:.2f};"
+                f"{(total_self * reference_price) / 100:.2f};"
+                f"{status}"
+            )
+
+    async def stream_csv(
+        self,
+        request: web.Request,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        granularity: str = CSV_GRANULARITY_MONTH,
+    ) -> web.StreamResponse:
+        """Stream a CSV export as a chunked aiohttp response. @zara"""
+        _check_granularity(granularity)
+        filename = (
+            f"sfml_tarife_{start_year:04d}-{start_month:02d}_"
+            f"{end_year:04d}-{end_month:02d}_{granularity}.csv"
+        )
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/csv; charset=utf-8",
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            }
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        buffer: list[str] = []
+        buffered = 0
+        async for line in self.iter_csv(
+            start_year, start_month, end_year, end_month, granularity
+        ):
+            # Every line carries its own terminator, chunk borders do not matter @zara
+            buffer.append(f"{line}\n")
+            buffered += len(line) + 1
+            if buffered >= CSV_STREAM_CHUNK_SIZE:
+                await response.write("".join(buffer).encode("utf-8"))
+                buffer = []
+                buffered = 0
+
+        if buffer:
+            await response.write("".join(buffer).encode("utf-8"))
+        await response.write_eof()
+        return response
+
+    async def export_csv(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        granularity: str = CSV_GRANULARITY_MONTH,
+    ) -> str:
+        """Export monthly data as CSV. @zara"""
+        lines = [
+            line async for line in self.iter_csv(
+                start_year, start_month, end_year, end_month, granularity
+            )
+        ]
+        return "".join(f"{line}\n" for line in lines)
+
+    async def simulate_tariffs(
+        self,
+        scenarios: list[dict[str, Any]] | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> dict[str, Any]:
+        """Compare tariff scenarios over the full hourly history. @zara"""
+        from .tariff_simulator import TariffSimulator
+
+        return await TariffSimulator(self).async_simulate(
+            scenarios, start_year, end_year
+        )
 
     async def update_defaults(self, defaults: dict[str, Any]) -> bool:
         """Update default tariff values. @zara"""
@@ -645,3 +1023,4 @@ class MonthlyTariffManager:
     def invalidate_cache(self) -> None:
         """Invalidate the data cache. @zara"""
         self._cache = None
+        self._hourly_cache = None
@@ -0,0 +1,231 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Batch what-if tariff simulation over the hourly billing history. @zara"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .hourly_index import HourlyBillingIndex
+    from .monthly_tariff_manager import MonthlyTariffManager
+
+_LOGGER = logging.getLogger(__name__)
+
+IMPORT_MODE_DYNAMIC = "dynamic"
+IMPORT_MODE_FIXED = "fixed"
+
+
+class TariffSimulator:
+    """Evaluate many tariff scenarios in one vectorized pass. @zara"""
+
+    def __init__(self, manager: MonthlyTariffManager) -> None:
+        """Initialize the simulator. @zara"""
+        self._manager = manager
+
+    def default_scenarios(self) -> list[dict[str, Any]]:
+        """Build the standard comparison set from the configured defaults. @zara"""
+        defaults = self._manager._get_defaults()
+        return [
+            {
+                "name": "Dynamisch (Ist)",
+                "import_mode": IMPORT_MODE_DYNAMIC,
+                "import_price_ct": defaults["fixed_price_ct"],
+                "export_price_ct": defaults["feed_in_tariff_ct"],
+                "reference_price_ct": defaults["reference_price_ct"],
+            },
+            {
+                "name": "Festpreis",
+                "import_mode": IMPORT_MODE_FIXED,
+                "import_price_ct": defaults["fixed_price_ct"],
+                "export_price_ct": defaults["feed_in_tariff_ct"],
+                "reference_price_ct": defaults["reference_price_ct"],
+            },
+            {
+                "name": "EEG",
+                "import_mode": IMPORT_MODE_FIXED,
+                "import_price_ct": defaults["reference_price_ct"],
+                "eeg_share_percent": 100.0,
+                "eeg_import_price_ct": defaults["eeg_import_price_ct"],
+                "export_price_ct": defaults["eeg_feed_in_ct"],
+                "reference_price_ct": defaults["reference_price_ct"],
+            },
+        ]
+
+    def _normalize_scenario(
+        self, scenario: dict[str, Any], index: int, defaults: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Fill missing scenario fields with configured defaults. @zara"""
+        return {
+            "name": scenario.get("name") or f"Szenario {index + 1}",
+            "dynamic": scenario.get("import_mode", IMPORT_MODE_FIXED) == IMPORT_MODE_DYNAMIC,
+            "import_price_ct": float(scenario.get("import_price_ct", defaults["fixed_price_ct"])),
+            "dynamic_markup_ct": float(scenario.get("dynamic_markup_ct", 0.0)),
+            "export_price_ct": float(scenario.get("export_price_ct", defaults["feed_in_tariff_ct"])),
+            "reference_price_ct": float(scenario.get("reference_price_ct", defaults["reference_price_ct"])),
+            "eeg_share": float(scenario.get("eeg_share_percent", 0.0)) / 100,
+            "eeg_import_price_ct": float(scenario.get("eeg_import_price_ct", defaults["eeg_import_price_ct"])),
+            "grid_fee_ct": float(scenario.get("grid_fee_ct", 0.0)),
+            "base_fee_eur_month": float(scenario.get("base_fee_eur_month", 0.0)),
+        }
+
+    async def async_simulate(
+        self,
+        scenarios: list[dict[str, Any]] | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> dict[str, Any]:
+        """Simulate all scenarios over the hourly history. @zara"""
+        hourly_data, index = await self._manager._load_hourly_indexed()
+        hours = hourly_data.get("hours", {})
+
+        if scenarios is None:
+            scenarios = self.default_scenarios()
+
+        return await self._manager._hass.async_add_executor_job(
+            self._simulate_sync, hours, index, scenarios, start_year, end_year
+        )
+
+    def _simulate_sync(
+        self,
+        hours: dict[str, dict[str, Any]],
+        index: HourlyBillingIndex,
+        scenarios: list[dict[str, Any]],
+        start_year: int | None,
+        end_year: int | None,
+    ) -> dict[str, Any]:
+        """Run the vectorized simulation. @zara"""
+        import numpy as np
+
+        started = time.perf_counter()
+        defaults = self._manager._get_defaults()
+        specs = [
+            self._normalize_scenario(s, i, defaults) for i, s in enumerate(scenarios)
+        ]
+
+        # Months from the epoch-hour index, unparseable keys are not in it @zara
+        slices = [
+            (year, month, month_hours) for year, month, month_hours in index.month_slices()
+            if (start_year is None or year >= start_year)
+            and (end_year is None or year <= end_year)
+        ]
+        keys = [k for _, _, month_hours in slices for k in month_hours]
+        if not keys or not specs:
+            return {
+                "success": True,
+                "scenarios": [s["name"] for s in specs],
+                "months": [],
+                "years": [],
+                "monthly": {},
+                "yearly": {},
+                "consumption": {
+                    "import_kwh": [],
+                    "export_kwh": [],
+                    "self_consumption_kwh": [],
+                },
+                "hours_evaluated": 0,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+
+        def _column(field: str) -> Any:
+            return np.fromiter(
+                ((hours[k].get(field, 0) or 0) for k in keys),
+                dtype=np.float64,
+                count=len(keys),
+            )
+
+        import_kwh = _column("grid_import_kwh")
+        export_kwh = _column("grid_export_kwh")
+        price_ct = _column("price_ct_kwh")
+        self_kwh = _column("solar_to_house_kwh") + _column("battery_to_house_kwh")
+
+        month_keys = [f"{year:04d}-{month:02d}" for year, month, _ in slices]
+        n_months = len(month_keys)
+        month_idx = np.repeat(
+            np.arange(n_months), [len(month_hours) for _, _, month_hours in slices]
+        )
+
+        # One pass over all hours, every scenario is linear in these sums @zara
+        priced = price_ct > 0
+        import_total = np.bincount(month_idx, weights=import_kwh, minlength=n_months)
+        import_priced_cost = np.bincount(
+            month_idx, weights=np.where(priced, import_kwh * price_ct, 0.0), minlength=n_months
+        )
+        import_unpriced = np.bincount(
+            month_idx, weights=np.where(priced, 0.0, import_kwh), minlength=n_months
+        )
+        export_total = np.bincount(month_idx, weights=export_kwh, minlength=n_months)
+        self_total = np.bincount(month_idx, weights=self_kwh, minlength=n_months)
+
+        def _vector(field: str) -> Any:
+            return np.array([s[field] for s in specs], dtype=np.float64)[:, None]
+
+        dynamic = np.array([s["dynamic"] for s in specs])[:, None]
+        eeg_share = _vector("eeg_share")
+        fixed_price = (
+            (1 - eeg_share) * _vector("import_price_ct")
+            + eeg_share * _vector("eeg_import_price_ct")
+        )
+        surcharge = _vector("grid_fee_ct")
+
+        dynamic_cost_ct = (
+            import_priced_cost[None, :]
+            + _vector("dynamic_markup_ct") * import_total[None, :]
+            + fixed_price * import_unpriced[None, :]
+        )
+        fixed_cost_ct = fixed_price * import_total[None, :]
+        grid_cost = (
+            np.where(dynamic, dynamic_cost_ct, fixed_cost_ct)
+            + surcharge * import_total[None, :]
+        ) / 100 + _vector("base_fee_eur_month")
+        feed_in = _vector("export_price_ct") * export_total[None, :] / 100
+        savings = _vector("reference_price_ct") * self_total[None, :] / 100
+        net_cost = grid_cost - feed_in - savings
+
+        year_keys, year_idx = np.unique(
+            np.array([year for year, _, _ in slices]), return_inverse=True
+        )
+        year_matrix = np.zeros((n_months, len(year_keys)))
+        year_matrix[np.arange(n_months), year_idx] = 1.0
+
+        monthly = {
+            "grid_cost_eur": grid_cost,
+            "feed_in_revenue_eur": feed_in,
+            "savings_eur": savings,
+            "net_cost_eur": net_cost,
+        }
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _LOGGER.debug(
+            "Simulated %d tariff scenarios over %d hours in %.1f ms",
+            len(specs), len(keys), elapsed_ms,
+        )
+
+        return {
+            "success": True,
+            "scenarios": [s["name"] for s in specs],
+            "months": month_keys,
+            "years": [int(y) for y in year_keys],
+            "monthly": {
+                name: np.round(matrix, 2).tolist() for name, matrix in monthly.items()
+            },
+            "yearly": {
+                name: np.round(matrix @ year_matrix, 2).tolist()
+                for name, matrix in monthly.items()
+            },
+            "consumption": {
+                "import_kwh": np.round(import_total, 2).tolist(),
+                "export_kwh": np.round(export_total, 2).tolist(),
+                "self_consumption_kwh": np.round(self_total, 2).tolist(),
+            },
+            "hours_evaluated": len(keys),
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
@@ -14,6 +14,7 @@ import asyncio
 import logging
 import random
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import TYPE_CHECKING, AsyncIterator
 
@@ -26,6 +27,12 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pending reads inside dedupe_reads(), keyed by query and params and shared by
+# the tasks the block spawns. Not a transaction: each read still runs on its own @zara
+_dedupe_reads: ContextVar[dict[tuple, asyncio.Future] | None] = ContextVar(
+    "sfml_dedupe_reads", default=None
+)
+
 
 def get_manager() -> DatabaseConnectionManager | None:
     """Get the current database manager instance if available. @zara"""
@@ -153,11 +160,47 @@ class DatabaseConnectionManager:
 
         return await self.connect()
 
+    @asynccontextmanager
+    async def dedupe_reads(self) -> AsyncIterator[None]:
+        """Run identical reads only once within the block, also across gathered tasks.
+
+        Callers share the result of the first read. This is no isolation snapshot:
+        different queries may see different database states, and a write clears
+        the shared results. @zara
+        """
+        if _dedupe_reads.get() is not None:
+            yield
+            return
+        token = _dedupe_reads.set({})
+        try:
+            yield
+        finally:
+            _dedupe_reads.reset(token)
+
     async def execute_read(self, query: str, params: tuple | list | None = None) -> list[aiosqlite.Row]:
         """Execute a read query with retry on lock and auto-reconnect. @zara"""
         if params is None:
             params = []
 
+        shared = _dedupe_reads.get()
+        if shared is None:
+            return await self._execute_read(query, params)
+
+        key = (query, tuple(params))
+        pending = shared.get(key)
+        if pending is None:
+            pending = shared[key] = asyncio.ensure_future(self._execute_read(query, params))
+        try:
+            return list(await asyncio.shield(pending))
+        except Exception:
+            # Do not share a failed read, the next caller tries again @zara
+            if shared.get(key) is pending:
+                del shared[key]
+            raise
+
+    async def _execute_read(self, query: str, params: tuple | list) -> list[aiosqlite.Row]:
+        """Run one read query against the connection. @zara"""
+
         for attempt in range(3):
             if not await self._ensure_connected():
                 raise RuntimeError("Database not available")
@@ -185,6 +228,11 @@ class DatabaseConnectionManager:
         if params is None:
             params = []
 
+        # Reads after a write must see it @zara
+        shared = _dedupe_reads.get()
+        if shared is not None:
+            shared.clear()
+
         for attempt in range(3):
             if not await self._ensure_connected():
                 raise RuntimeError("Database not available")
@@ -0,0 +1,70 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Calendar slices of the epoch-hour billing index. @zara"""
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import _bootstrap  # noqa: E402
+
+hourly_index = _bootstrap.load("services.hourly_index", ("services",))
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def _hours(start: date, end: date) -> dict[str, dict]:
+    """Return one record per local hour, keyed like the billing history. @zara"""
+    current = datetime(start.year, start.month, start.day, tzinfo=BERLIN)
+    stop = datetime(end.year, end.month, end.day, tzinfo=BERLIN)
+    hours = {}
+    while current < stop:
+        hours[current.strftime("%Y-%m-%d %H")] = {}
+        current = (current.astimezone(timezone.utc) + timedelta(hours=1)).astimezone(BERLIN)
+    return hours
+
+
+def test_billing_period_start_uses_last_day_of_short_months() -> None:
+    start = hourly_index.billing_period_start
+    assert start(2024, 2, 30) == date(2024, 2, 29)
+    assert start(2025, 2, 29) == date(2025, 2, 28)
+    assert start(2025, 4, 31) == date(2025, 4, 30)
+    assert start(2025, 1, 31) == date(2025, 1, 31)
+    assert start(2025, 3, 15) == date(2025, 3, 15)
+
+
+def test_billing_period_keys_follow_the_clamped_start() -> None:
+    index = hourly_index.HourlyBillingIndex(_hours(date(2024, 1, 1), date(2026, 1, 1)), BERLIN)
+    keys = index.billing_period_keys(2024, 2, 31)
+    assert keys[0] == "2024-02-29 00"
+    assert keys[-1] == "2025-02-27 23"
+    # A day not in the month is no longer moved back to the 28th @zara
+    assert "2024-02-28 23" not in keys
+
+
+def test_day_keys_span_dst_transitions() -> None:
+    index = hourly_index.HourlyBillingIndex(_hours(date(2024, 3, 1), date(2024, 11, 1)), BERLIN)
+    assert len(index.day_keys(date(2024, 3, 31))) == 23
+    # 25 hours, but the repeated 02 hour has one key in the history @zara
+    assert len(index.day_keys(date(2024, 10, 27))) == 24
+    assert len(index.day_keys(date(2024, 6, 1))) == 24
+
+
+def test_month_slices_skip_unparseable_keys() -> None:
+    hours = _hours(date(2024, 1, 30), date(2024, 2, 2))
+    hours["garbage"] = {}
+    slices = hourly_index.HourlyBillingIndex(hours, BERLIN).month_slices()
+    assert [(year, month, len(keys)) for year, month, keys in slices] == [
+        (2024, 1, 48),
+        (2024, 2, 24),
+    ]
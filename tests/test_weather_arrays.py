@@ -0,0 +1,85 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""The array path must give the same daily weather as the row path. @zara"""
+from __future__ import annotations
+
+import random
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import _bootstrap  # noqa: E402
+
+aggregation = _bootstrap.load("weather_aggregation")
+weather_arrays = _bootstrap.load("weather_arrays")
+
+
+@dataclass
+class HourlyWeather:
+    """Hourly row shaped like the reader's weather objects. @zara"""
+
+    date: date
+    hour: int
+    temperature_c: float | None
+    humidity_percent: float | None
+    wind_speed_ms: float | None
+    precipitation_mm: float | None
+    solar_radiation_wm2: float | None
+    cloud_cover_percent: float | None
+
+
+def _rows(days: int = 730) -> list[HourlyWeather]:
+    """Two years of 1-decimal hourly values with gaps and a duplicate hour. @zara"""
+    rng = random.Random(7)
+    start = date(2024, 1, 1)
+    rows = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        for hour in range(24):
+            rows.append(HourlyWeather(
+                day, hour,
+                round(rng.gauss(10, 6), 1),
+                round(rng.uniform(30, 100), 1),
+                round(abs(rng.gauss(4, 3)), 1),
+                round(rng.random() * 2, 1) if rng.random() < 0.3 else 0.0,
+                None if rng.random() < 0.02 else round(max(0.0, rng.gauss(200, 250)), 1),
+                None if offset % 97 == 0 else round(rng.uniform(0, 100), 1),
+            ))
+        if offset % 50 == 0:
+            rows.append(HourlyWeather(day, 23, 1.5, 50.0, 1.0, 0.1, 0.0, 10.0))
+    return rows
+
+
+def test_observed_days_match_row_path() -> None:
+    """aggregate_daily_weather is identical for rows and arrays. @zara"""
+    rows = _rows()
+    expected = aggregation.aggregate_daily_weather(rows)
+    actual = aggregation.aggregate_daily_weather(
+        weather_arrays.HourlyWeatherArrays.from_rows(rows)
+    )
+    assert actual == expected
+
+
+def test_forecast_days_match_row_path() -> None:
+    """to_forecast_day is identical for rows and arrays. @zara"""
+    rows = _rows()
+    expected = {
+        key: acc.to_forecast_day()
+        for key, acc in aggregation.accumulate_daily_weather(rows).items()
+    }
+    actual = {
+        key: acc.to_forecast_day()
+        for key, acc in aggregation.accumulate_daily_weather(
+            weather_arrays.HourlyWeatherArrays.from_rows(rows)
+        ).items()
+    }
+    assert actual == expected
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 from .cache import TTLCache, get_json_cache
+from .latency import LatencyTrace
 from .file_ops import (
     read_json_safe,
     write_json_safe,
@@ -21,6 +22,7 @@ from .file_ops import (
 __all__ = [
     "TTLCache",
     "get_json_cache",
+    "LatencyTrace",
     "read_json_safe",
     "write_json_safe",
     "append_to_file_safe",
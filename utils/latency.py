@@ -0,0 +1,80 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Latency tracing for SFML Stats endpoints. @zara"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LatencyTrace:
+    """Record timed spans of one request and derive its critical path. @zara"""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the trace. @zara"""
+        self.name = name
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._spans: list[tuple[str, float, float]] = []
+
+    @asynccontextmanager
+    async def span(self, name: str) -> AsyncIterator[None]:
+        """Time a block, concurrent spans may overlap. @zara"""
+        start = time.perf_counter() - self._started
+        try:
+            yield
+        finally:
+            self._spans.append((name, start, time.perf_counter() - self._started))
+
+    def finish(self) -> dict[str, Any]:
+        """Close the trace, log it and return it as a dict. @zara"""
+        self._finished = time.perf_counter() - self._started
+        result = self.as_dict()
+        _LOGGER.debug(
+            "Latency %s: %.1f ms, critical path %s",
+            self.name,
+            result["total_ms"],
+            " -> ".join(f"{s['name']} {s['duration_ms']:.1f}ms" for s in result["critical_path"]),
+        )
+        return result
+
+    def _critical_path(self) -> list[tuple[str, float, float]]:
+        """Walk back from the end, always taking the span that finished last. @zara"""
+        path = []
+        boundary = float("inf")
+        remaining = sorted(self._spans, key=lambda s: s[2], reverse=True)
+        for span in remaining:
+            if span[2] <= boundary:
+                path.append(span)
+                boundary = span[1]
+        return list(reversed(path))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return spans and critical path in milliseconds. @zara"""
+        total = self._finished if self._finished is not None else time.perf_counter() - self._started
+
+        def _fmt(span: tuple[str, float, float]) -> dict[str, Any]:
+            name, start, end = span
+            return {
+                "name": name,
+                "start_ms": round(start * 1000, 1),
+                "duration_ms": round((end - start) * 1000, 1),
+            }
+
+        return {
+            "name": self.name,
+            "total_ms": round(total * 1000, 1),
+            "spans": [_fmt(s) for s in sorted(self._spans, key=lambda s: s[1])],
+            "critical_path": [_fmt(s) for s in self._critical_path()],
+        }
@@ -0,0 +1,205 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Hour-aligned weather forecast accuracy for SFML Stats. @zara"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable
+
+from .const import WEATHER_ACCURACY_MAX_DAYS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Variable name -> hourly row attribute @zara
+ACCURACY_VARIABLES: dict[str, str] = {
+    "temperature": "temperature_c",
+    "radiation": "solar_radiation_wm2",
+    "clouds": "cloud_cover_percent",
+    "wind": "wind_speed_ms",
+    "rain": "precipitation_mm",
+}
+
+HOURS_PER_DAY = 24
+
+# Rows of the cached per-day statistics array @zara
+_STAT_N = 0
+_STAT_ERR = 1
+_STAT_ABS = 2
+_STAT_SQ = 3
+
+
+def _date_key(value: Any) -> str:
+    """Return an ISO date string for a date or string. @zara"""
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)[:10]
+
+
+def hourly_grid(rows: Iterable[Any]) -> tuple[list[str], Any]:
+    """Pivot hourly rows into a (days, 24, variables) array with NaN gaps. @zara"""
+    import numpy as np
+
+    attributes = tuple(ACCURACY_VARIABLES.values())
+    if hasattr(rows, "hour_grid"):
+        return rows.hour_grid(attributes)
+
+    positions: dict[str, int] = {}
+    day_index: list[int] = []
+    hours: list[int] = []
+    values: list[list[Any]] = []
+    last_date = None
+    last_pos = 0
+
+    for row in rows:
+        hour = getattr(row, "hour", None)
+        if hour is None or not 0 <= hour < HOURS_PER_DAY:
+            continue
+        if row.date != last_date:
+            last_date = row.date
+            date_str = _date_key(last_date)
+            last_pos = positions.get(date_str, -1)
+            if last_pos < 0:
+                last_pos = positions[date_str] = len(positions)
+        day_index.append(last_pos)
+        hours.append(hour)
+        values.append([getattr(row, attr, None) for attr in attributes])
+
+    grid = np.full((len(positions), HOURS_PER_DAY, len(attributes)), np.nan)
+    if values:
+        # None becomes NaN in the float conversion, later rows win on duplicates @zara
+        grid[day_index, hours] = np.array(values, dtype=float)
+    return list(positions), grid
+
+
+def error_stats(observed: Any, forecast: Any) -> Any:
+    """Return per-day COUNT/SUM(err)/SUM(|err|)/SUM(err²) as (days, 4, variables). @zara"""
+    import numpy as np
+
+    diff = forecast - observed
+    valid = ~np.isnan(diff)
+    diff = np.where(valid, diff, 0.0)
+    return np.stack(
+        (
+            valid.sum(axis=1, dtype=float),
+            diff.sum(axis=1),
+            np.abs(diff).sum(axis=1),
+            (diff * diff).sum(axis=1),
+        ),
+        axis=1,
+    )
+
+
+class WeatherAccuracyEngine:
+    """Hourly observed/forecast grids with cached per-day error statistics. @zara"""
+
+    def __init__(self, max_days: int = WEATHER_ACCURACY_MAX_DAYS) -> None:
+        """Initialize empty grids holding at most max_days days each. @zara"""
+        self._max_days = max_days
+        self._observed: dict[str, Any] = {}
+        self._forecast: dict[str, Any] = {}
+        self._stats: dict[str, Any] = {}
+        self._empty_observed: set[str] = set()
+        self._empty_forecast: set[str] = set()
+        self._dirty: set[str] = set()
+
+    def _store(self, target: dict[str, Any], empty: set[str], rows: Iterable[Any]) -> int:
+        """Replace whole days in a grid store and mark them dirty. @zara"""
+        dates, grid = hourly_grid(rows)
+        for pos, date_str in enumerate(dates):
+            target[date_str] = grid[pos]
+            empty.discard(date_str)
+            self._dirty.add(date_str)
+        self._trim()
+        return len(dates)
+
+    def _trim(self) -> None:
+        """Drop the oldest days once a store exceeds the limit. @zara"""
+        known = (
+            self._observed.keys() | self._forecast.keys()
+            | self._empty_observed | self._empty_forecast
+        )
+        if len(known) <= self._max_days:
+            return
+        for date_str in sorted(known)[: len(known) - self._max_days]:
+            self._observed.pop(date_str, None)
+            self._forecast.pop(date_str, None)
+            self._stats.pop(date_str, None)
+            self._empty_observed.discard(date_str)
+            self._empty_forecast.discard(date_str)
+            self._dirty.discard(date_str)
+
+    def update_observed(self, rows: Iterable[Any]) -> int:
+        """Add or replace observed hourly days. @zara"""
+        return self._store(self._observed, self._empty_observed, rows)
+
+    def update_forecast(self, rows: Iterable[Any]) -> int:
+        """Add or replace forecast hourly days. @zara"""
+        return self._store(self._forecast, self._empty_forecast, rows)
+
+    def mark_empty(self, dates: Iterable[str], forecast: bool = False) -> None:
+        """Remember days the database has no observed or forecast hours for. @zara"""
+        store, empty = (
+            (self._forecast, self._empty_forecast) if forecast
+            else (self._observed, self._empty_observed)
+        )
+        empty.update(d for d in dates if d not in store)
+        self._trim()
+
+    def has_observed(self, date_str: str) -> bool:
+        """Return True if a day is loaded or known to have no observed hours. @zara"""
+        return date_str in self._observed or date_str in self._empty_observed
+
+    def has_forecast(self, date_str: str) -> bool:
+        """Return True if a day is loaded or known to have no forecast hours. @zara"""
+        return date_str in self._forecast or date_str in self._empty_forecast
+
+    def _flush(self) -> None:
+        """Recompute statistics of dirty days in one vectorized batch. @zara"""
+        if not self._dirty:
+            return
+        import numpy as np
+
+        dates = [d for d in self._dirty if d in self._observed and d in self._forecast]
+        self._dirty.clear()
+        if not dates:
+            return
+
+        stats = error_stats(
+            np.stack([self._observed[d] for d in dates]),
+            np.stack([self._forecast[d] for d in dates]),
+        )
+        for pos, date_str in enumerate(dates):
+            self._stats[date_str] = stats[pos]
+
+    def summarize(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, Any]:
+        """Return MAE, RMSE and bias per variable for an ISO date window. @zara"""
+        import numpy as np
+
+        self._flush()
+        dates = [
+            d for d in self._stats
+            if (start is None or d >= start) and (end is None or d <= end)
+        ]
+        result: dict[str, Any] = {"days": len(dates), "variables": {}}
+        if not dates:
+            return result
+
+        totals = np.sum([self._stats[d] for d in dates], axis=0)
+        for pos, variable in enumerate(ACCURACY_VARIABLES):
+            n = totals[_STAT_N, pos]
+            if not n:
+                continue
+            result["variables"][variable] = {
+                "mae": round(float(totals[_STAT_ABS, pos] / n), 2),
+                "rmse": round(float(np.sqrt(totals[_STAT_SQ, pos] / n)), 2),
+                "bias": round(float(totals[_STAT_ERR, pos] / n), 2),
+                "hours": int(n),
+            }
+        return result
@@ -0,0 +1,332 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Single-pass daily weather aggregation for SFML Stats. @zara"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable, Sequence
+
+from .const import SUN_HOURS_RADIATION_THRESHOLD
+
+class DailyWeatherAccumulator:
+    """Running COUNT/SUM/MIN/MAX aggregates for one day of hourly weather. @zara"""
+
+    __slots__ = (
+        "temp_n", "temp_sum", "temp_min", "temp_max",
+        "humidity_n", "humidity_sum",
+        "wind_n", "wind_sum", "wind_max",
+        "rain_n", "rain_sum",
+        "radiation_n", "radiation_sum", "sun_hours",
+        "clouds_n", "clouds_sum",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates. @zara"""
+        self.temp_n = 0
+        self.temp_sum = 0.0
+        self.temp_min = float("inf")
+        self.temp_max = float("-inf")
+        self.humidity_n = 0
+        self.humidity_sum = 0.0
+        self.wind_n = 0
+        self.wind_sum = 0.0
+        self.wind_max = float("-inf")
+        self.rain_n = 0
+        self.rain_sum = 0.0
+        self.radiation_n = 0
+        self.radiation_sum = 0.0
+        self.sun_hours = 0
+        self.clouds_n = 0
+        self.clouds_sum = 0.0
+
+    def add(self, weather: Any, sun_threshold: float) -> None:
+        """Add one hourly weather row. @zara"""
+        value = weather.temperature_c
+        if value is not None:
+            self.temp_n += 1
+            self.temp_sum += value
+            if value < self.temp_min:
+                self.temp_min = value
+            if value > self.temp_max:
+                self.temp_max = value
+
+        value = weather.humidity_percent
+        if value is not None:
+            self.humidity_n += 1
+            self.humidity_sum += value
+
+        value = weather.wind_speed_ms
+        if value is not None:
+            self.wind_n += 1
+            self.wind_sum += value
+            if value > self.wind_max:
+                self.wind_max = value
+
+        value = weather.precipitation_mm
+        if value is not None:
+            self.rain_n += 1
+            self.rain_sum += value
+
+        value = weather.solar_radiation_wm2
+        if value is not None:
+            self.radiation_n += 1
+            self.radiation_sum += value
+            if value > sun_threshold:
+                self.sun_hours += 1
+
+        value = weather.cloud_cover_percent
+        if value is not None:
+            self.clouds_n += 1
+            self.clouds_sum += value
+
+    def to_day(self, date_str: str) -> dict[str, Any] | None:
+        """Return the observed daily values, None without temperatures. @zara"""
+        if not self.temp_n:
+            return None
+
+        humidity_val = min(100.0, round(self.humidity_sum / self.humidity_n, 1)) if self.humidity_n else 0
+        wind_val = round(self.wind_sum / self.wind_n, 1) if self.wind_n else 0
+        wind_max_val = round(self.wind_max, 1) if self.wind_n else 0
+        radiation_val = max(0.0, round(self.radiation_sum / self.radiation_n, 1)) if self.radiation_n else 0
+        rain_val = max(0.0, round(self.rain_sum, 1)) if self.rain_n else 0
+        clouds_val = min(100.0, round(self.clouds_sum / self.clouds_n, 1)) if self.clouds_n else 0
+
+        return {
+            "date": date_str,
+            "temp_avg": round(self.temp_sum / self.temp_n, 1),
+            "temp_max": round(self.temp_max, 1),
+            "temp_min": round(self.temp_min, 1),
+            "humidity": humidity_val,
+            "wind": wind_val,
+            "radiation": radiation_val,
+            "rain": rain_val,
+            "clouds": clouds_val,
+            "humidity_avg": humidity_val,
+            "wind_avg": wind_val,
+            "wind_max": wind_max_val,
+            "radiation_avg": radiation_val,
+            "rain_total": rain_val,
+            "sun_hours": self.sun_hours,
+        }
+
+    def to_forecast_day(self) -> dict[str, Any] | None:
+        """Return the forecast daily values, None without temperatures. @zara"""
+        if not self.temp_n:
+            return None
+
+        return {
+            "temp_avg": round(self.temp_sum / self.temp_n, 1),
+            "temp_max": round(self.temp_max, 1),
+            "temp_min": round(self.temp_min, 1),
+            "radiation": round(self.radiation_sum / self.radiation_n, 1) if self.radiation_n else 0,
+            "clouds": round(self.clouds_sum / self.clouds_n, 1) if self.clouds_n else 0,
+            "humidity": round(self.humidity_sum / self.humidity_n, 1) if self.humidity_n else 0,
+            "wind": round(self.wind_sum / self.wind_n, 1) if self.wind_n else 0,
+            "rain": round(self.rain_sum, 1) if self.rain_n else 0,
+        }
+
+
+def accumulate_daily_weather(
+    hourly_weather: Iterable[Any],
+    sun_threshold: float = SUN_HOURS_RADIATION_THRESHOLD,
+) -> dict[str, DailyWeatherAccumulator]:
+    """Group hourly rows by date in one pass. @zara"""
+    if hasattr(hourly_weather, "accumulate"):
+        # HourlyWeatherArrays reduces whole columns at once @zara
+        return hourly_weather.accumulate(sun_threshold)
+
+    days: dict[str, DailyWeatherAccumulator] = {}
+    last_date = None
+    last_str = ""
+    accumulator = None
+
+    for weather in hourly_weather:
+        # Rows arrive ordered by date, so the isoformat/dict lookup runs once per day @zara
+        if weather.date != last_date:
+            last_date = weather.date
+            last_str = last_date.isoformat()
+            accumulator = days.get(last_str)
+            if accumulator is None:
+                accumulator = days[last_str] = DailyWeatherAccumulator()
+        accumulator.add(weather, sun_threshold)
+
+    return days
+
+
+def aggregate_daily_weather(
+    hourly_weather: Iterable[Any],
+    sun_threshold: float = SUN_HOURS_RADIATION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Aggregate hourly rows into sorted observed daily values. @zara"""
+    days = accumulate_daily_weather(hourly_weather, sun_threshold)
+    result = []
+    for date_str in sorted(days):
+        day = days[date_str].to_day(date_str)
+        if day is not None:
+            result.append(day)
+    return result
+
+
+class RollingAggregate:
+    """Sliding window over the newest N values with O(1) sum, mean, min and max. @zara"""
+
+    __slots__ = ("size", "field", "total", "_window", "_max", "_min")
+
+    def __init__(self, size: int, field: str) -> None:
+        """Initialize the window. @zara"""
+        self.size = size
+        self.field = field
+        self.total = 0.0
+        self._window: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+        self._min: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of values in the window. @zara"""
+        return len(self._window)
+
+    def push(self, seq: int, value: float) -> None:
+        """Add the newest value and expire the oldest one if full. @zara"""
+        self._window.append((seq, value))
+        self.total += value
+        if len(self._window) > self.size:
+            self.total -= self._window.popleft()[1]
+
+        # Monotonic deques, the front always holds the window extreme @zara
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+
+        oldest = self._window[0][0]
+        while self._max[0][0] < oldest:
+            self._max.popleft()
+        while self._min[0][0] < oldest:
+            self._min.popleft()
+
+    def retract(self, refill: tuple[int, float] | None) -> None:
+        """Remove the newest value, re-admitting an older one if given. @zara"""
+        self.total -= self._window.pop()[1]
+        if refill is not None:
+            self._window.appendleft(refill)
+            self.total += refill[1]
+
+        # Values evicted by the retracted one may be extremes again @zara
+        self._max.clear()
+        self._min.clear()
+        for seq, value in self._window:
+            while self._max and self._max[-1][1] <= value:
+                self._max.pop()
+            self._max.append((seq, value))
+            while self._min and self._min[-1][1] >= value:
+                self._min.pop()
+            self._min.append((seq, value))
+
+    @property
+    def mean(self) -> float:
+        """Return the window mean. @zara"""
+        return self.total / len(self._window) if self._window else 0.0
+
+    @property
+    def maximum(self) -> float:
+        """Return the window maximum. @zara"""
+        return self._max[0][1] if self._max else 0.0
+
+    @property
+    def minimum(self) -> float:
+        """Return the window minimum. @zara"""
+        return self._min[0][1] if self._min else 0.0
+
+
+class WeatherRollingStats:
+    """Rolling 7/30/365-day weather statistics maintained as days arrive. @zara"""
+
+    WEEK = 7
+    MONTH = 30
+    YEAR = 365
+    # Extra history so retracted days can refill the full year window @zara
+    HISTORY_MARGIN = 7
+
+    def __init__(self) -> None:
+        """Initialize empty windows. @zara"""
+        self._history: deque[tuple[int, dict[str, Any]]] = deque(
+            maxlen=self.YEAR + self.HISTORY_MARGIN
+        )
+        self._seq = 0
+        self._windows = {
+            "temp_avg": RollingAggregate(self.WEEK, "temp_avg"),
+            "sun_hours": RollingAggregate(self.WEEK, "sun_hours"),
+            "rain_total": RollingAggregate(self.MONTH, "rain_total"),
+            "temp_max": RollingAggregate(self.YEAR, "temp_max"),
+            "temp_min": RollingAggregate(self.YEAR, "temp_min"),
+            "wind_avg": RollingAggregate(self.YEAR, "wind_avg"),
+        }
+
+    def __len__(self) -> int:
+        """Return the number of days tracked. @zara"""
+        return len(self._history)
+
+    @property
+    def last_date(self) -> str | None:
+        """Return the newest tracked date. @zara"""
+        return self._history[-1][1]["date"] if self._history else None
+
+    def _push(self, day: dict[str, Any]) -> None:
+        """Add a day to every window. @zara"""
+        self._seq += 1
+        self._history.append((self._seq, day))
+        for window in self._windows.values():
+            window.push(self._seq, day.get(window.field, 0) or 0)
+
+    def _retract(self) -> None:
+        """Remove the newest day from every window. @zara"""
+        self._history.pop()
+        for window in self._windows.values():
+            refill = None
+            if len(self._history) >= window.size:
+                seq, day = self._history[-window.size]
+                refill = (seq, day.get(window.field, 0) or 0)
+            window.retract(refill)
+
+    def update(self, days: Sequence[dict[str, Any]], changed: Iterable[str] = ()) -> None:
+        """Sync with date-sorted days, replaying only changed and new ones. @zara"""
+        changed = set(changed)
+        last_date = self.last_date
+
+        if last_date is not None and changed:
+            earliest = min(changed)
+            while self._history and self.last_date >= earliest:
+                self._retract()
+            last_date = self.last_date
+
+        start = 0
+        if last_date is not None:
+            start = len(days)
+            while start > 0 and days[start - 1]["date"] > last_date:
+                start -= 1
+        else:
+            start = max(0, len(days) - self.YEAR)
+
+        for day in days[start:]:
+            self._push(day)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in the dashboard format. @zara"""
+        windows = self._windows
+        return {
+            "avgTemp": round(windows["temp_avg"].mean, 1),
+            "maxTemp": round(windows["temp_max"].maximum, 1),
+            "minTemp": round(windows["temp_min"].minimum, 1),
+            "totalRain": round(windows["rain_total"].total, 1),
+            "avgWind": round(windows["wind_avg"].mean, 1),
+            "sunHours": int(round(windows["sun_hours"].total)),
+        }
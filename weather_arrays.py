@@ -0,0 +1,213 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Struct-of-arrays container for hourly weather rows. @zara"""
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Any, Iterable, Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+HOURLY_WEATHER_FIELDS: tuple[str, ...] = (
+    "temperature_c",
+    "humidity_percent",
+    "wind_speed_ms",
+    "precipitation_mm",
+    "solar_radiation_wm2",
+    "cloud_cover_percent",
+)
+
+
+class HourlyWeatherArrays:
+    """Hourly weather as one NumPy column per field, NaN for missing values. @zara"""
+
+    __slots__ = ("day", "hour", "columns", "_starts")
+
+    def __init__(self, day: Any, hour: Any, columns: dict[str, Any]) -> None:
+        """Wrap columns already sorted by day and hour. @zara"""
+        self.day = day
+        self.hour = hour
+        self.columns = columns
+        self._starts: Any = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> HourlyWeatherArrays:
+        """Convert reader row objects in one pass. @zara"""
+        ordinals: list[int] = []
+        hours: list[int] = []
+        values: list[tuple[Any, ...]] = []
+        last_date = None
+        last_ordinal = 0
+
+        for row in rows:
+            if row.date != last_date:
+                last_date = row.date
+                day = last_date if isinstance(last_date, date) else date.fromisoformat(str(last_date)[:10])
+                last_ordinal = day.toordinal()
+            ordinals.append(last_ordinal)
+            hour = getattr(row, "hour", None)
+            hours.append(-1 if hour is None else hour)
+            values.append(tuple(getattr(row, name, None) for name in HOURLY_WEATHER_FIELDS))
+
+        return cls._from_lists(ordinals, hours, values)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Sequence[Any]]) -> HourlyWeatherArrays:
+        """Convert (date, hour, *HOURLY_WEATHER_FIELDS) database rows in one pass. @zara"""
+        ordinals: list[int] = []
+        hours: list[int] = []
+        values: list[tuple[Any, ...]] = []
+        last_date = None
+        last_ordinal = 0
+
+        for record in records:
+            if record[0] != last_date:
+                last_date = record[0]
+                last_ordinal = date.fromisoformat(str(last_date)[:10]).toordinal()
+            ordinals.append(last_ordinal)
+            hours.append(-1 if record[1] is None else record[1])
+            values.append(tuple(record[2:]))
+
+        return cls._from_lists(ordinals, hours, values)
+
+    @classmethod
+    def _from_lists(
+        cls,
+        ordinals: list[int],
+        hours: list[int],
+        values: list[tuple[Any, ...]],
+    ) -> HourlyWeatherArrays:
+        """Build sorted column arrays from per-row lists. @zara"""
+        import numpy as np
+
+        day_arr = np.array(ordinals, dtype=np.int32)
+        hour_arr = np.array(hours, dtype=np.int8)
+        # float64 like the row objects, float32 sums round differently at x.x5 @zara
+        matrix = np.array(values, dtype=np.float64).reshape(len(values), len(HOURLY_WEATHER_FIELDS))
+
+        order = np.lexsort((hour_arr, day_arr))
+        if len(order) and np.any(np.diff(order) < 0):
+            day_arr, hour_arr, matrix = day_arr[order], hour_arr[order], matrix[order]
+
+        columns = {
+            name: np.ascontiguousarray(matrix[:, pos])
+            for pos, name in enumerate(HOURLY_WEATHER_FIELDS)
+        }
+        return cls(day_arr, hour_arr, columns)
+
+    def __len__(self) -> int:
+        """Return the number of hourly rows. @zara"""
+        return len(self.day)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by all columns. @zara"""
+        return self.day.nbytes + self.hour.nbytes + sum(c.nbytes for c in self.columns.values())
+
+    def _day_starts(self) -> Any:
+        """Return the row offset where each distinct day begins. @zara"""
+        if self._starts is None:
+            import numpy as np
+
+            self._starts = np.flatnonzero(np.diff(self.day, prepend=self.day[:1] - 1))
+        return self._starts
+
+    @property
+    def dates(self) -> list[str]:
+        """Return the distinct ISO dates in order. @zara"""
+        return [date.fromordinal(int(o)).isoformat() for o in self.day[self._day_starts()]]
+
+    def select(self, start: date | None = None, end: date | None = None) -> HourlyWeatherArrays:
+        """Return the rows within an inclusive date range. @zara"""
+        import numpy as np
+
+        lo = np.searchsorted(self.day, start.toordinal(), "left") if start else 0
+        hi = np.searchsorted(self.day, end.toordinal(), "right") if end else len(self.day)
+        return HourlyWeatherArrays(
+            self.day[lo:hi],
+            self.hour[lo:hi],
+            {name: col[lo:hi] for name, col in self.columns.items()},
+        )
+
+    def hour_grid(self, fields: Sequence[str]) -> tuple[list[str], Any]:
+        """Pivot into a (days, 24, fields) array with NaN gaps. @zara"""
+        import numpy as np
+
+        starts = self._day_starts()
+        day_index = np.repeat(
+            np.arange(len(starts)), np.diff(np.append(starts, len(self.day)))
+        )
+        grid = np.full((len(starts), 24, len(fields)), np.nan)
+        valid = (self.hour >= 0) & (self.hour < 24)
+        for pos, name in enumerate(fields):
+            column = self.columns.get(name)
+            if column is not None:
+                grid[day_index[valid], self.hour[valid], pos] = column[valid]
+        return self.dates, grid
+
+    def accumulate(self, sun_threshold: float) -> dict[str, Any]:
+        """Build per-day accumulators with reduceat instead of a row loop. @zara"""
+        import numpy as np
+
+        from .weather_aggregation import DailyWeatherAccumulator
+
+        if not len(self.day):
+            return {}
+
+        starts = self._day_starts()
+
+        def _count(values: Any) -> Any:
+            return np.add.reduceat(~np.isnan(values), starts)
+
+        # (position in day, day) layout: reducing over axis 0 adds the hours of each day
+        # one after another like the row path, reduceat would sum pairwise and round
+        # differently at x.x5 @zara
+        lengths = np.diff(np.append(starts, len(self.day)))
+        day_index = np.repeat(np.arange(len(starts)), lengths)
+        position = np.arange(len(self.day)) - np.repeat(starts, lengths)
+        padded = np.zeros((int(lengths.max()), len(starts)))
+
+        def _sum(values: Any) -> Any:
+            padded.fill(0.0)
+            padded[position, day_index] = np.nan_to_num(values, nan=0.0)
+            return padded.sum(axis=0)
+
+        temp = self.columns["temperature_c"]
+        humidity = self.columns["humidity_percent"]
+        wind = self.columns["wind_speed_ms"]
+        rain = self.columns["precipitation_mm"]
+        radiation = self.columns["solar_radiation_wm2"]
+        clouds = self.columns["cloud_cover_percent"]
+
+        # NaN-ignoring reductions, all-NaN days yield NaN and are skipped below @zara
+        stats = {
+            "temp_n": _count(temp), "temp_sum": _sum(temp),
+            "temp_min": np.fmin.reduceat(temp, starts),
+            "temp_max": np.fmax.reduceat(temp, starts),
+            "humidity_n": _count(humidity), "humidity_sum": _sum(humidity),
+            "wind_n": _count(wind), "wind_sum": _sum(wind),
+            "wind_max": np.fmax.reduceat(wind, starts),
+            "rain_n": _count(rain), "rain_sum": _sum(rain),
+            "radiation_n": _count(radiation), "radiation_sum": _sum(radiation),
+            "sun_hours": np.add.reduceat(radiation > sun_threshold, starts),
+            "clouds_n": _count(clouds), "clouds_sum": _sum(clouds),
+        }
+        stats = {key: values.tolist() for key, values in stats.items()}
+
+        days: dict[str, DailyWeatherAccumulator] = {}
+        for pos, date_str in enumerate(self.dates):
+            accumulator = DailyWeatherAccumulator()
+            for key, values in stats.items():
+                value = values[pos]
+                if value == value:
+                    setattr(accumulator, key, value)
+            days[date_str] = accumulator
+        return days
@@ -10,37 +10,132 @@
 """Weather Data Collector for SFML Stats. @zara"""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
-from collections import defaultdict
+from typing import Any, Awaitable, Callable
 
 from homeassistant.core import HomeAssistant
 
+from .const import (
+    WEATHER_STATS_REFRESH_SECONDS,
+    WEATHER_ROLLUPS_FILE,
+    WEATHER_ROLLUP_RECOMPUTE_DAYS,
+)
 from .readers.solar_reader import SolarDataReader
+from .readers.weather_queries import HourlyWeatherQueries
 from .readers.weather_reader import WeatherDataReader
+from .storage.db_connection_manager import DatabaseConnectionManager
+from .utils.file_ops import read_json_safe, write_json_safe
+from .utils.latency import LatencyTrace
+from .weather_accuracy import WeatherAccuracyEngine
+from .weather_arrays import HourlyWeatherArrays
+from .weather_correlation import RadiationYieldModel
+from .weather_aggregation import (
+    WeatherRollingStats,
+    accumulate_daily_weather,
+    aggregate_daily_weather,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+ROLLUPS_VERSION = 1
+
+
+async def _read_date_range(
+    method: Callable[..., Awaitable[list[Any]]],
+    start_date: date | None,
+    end_date: date | None = None,
+) -> list[Any]:
+    """Call a compiled reader method and keep the rows in the date range.
+
+    The readers take no date arguments, so they still load their full table
+    and the window is applied here. @zara
+    """
+    rows = await method()
+    if start_date is None and end_date is None:
+        return rows
+    return [
+        row for row in rows
+        if (start_date is None or row.date >= start_date)
+        and (end_date is None or row.date <= end_date)
+    ]
+
+
+def _days_between(first: date, last: date) -> list[date]:
+    """Return all days from first to last inclusive. @zara"""
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+async def _read_hourly_arrays(
+    method: Callable[..., Awaitable[list[Any]]],
+    start_date: date | None,
+    end_date: date | None = None,
+) -> HourlyWeatherArrays:
+    """Read hourly rows and convert them to column arrays right away. @zara"""
+    rows = await _read_date_range(method, start_date, end_date)
+    return HourlyWeatherArrays.from_rows(rows)
+
 
 class WeatherDataCollector:
     """Collects weather data from Solar Forecast ML. @zara"""
 
-    def __init__(self, hass: HomeAssistant, data_path: Path) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        data_path: Path,
+        db_manager: DatabaseConnectionManager | None = None,
+    ) -> None:
         """Initialize collector. @zara"""
         self.hass = hass
         self.data_path = data_path
+        self._db_manager = db_manager
+        self._weather_reader: WeatherDataReader | None = None
+        self._solar_reader: SolarDataReader | None = None
+        self._weather_queries = HourlyWeatherQueries(db_manager) if db_manager is not None else None
+        self._latency: dict[str, dict[str, Any]] = {}
+        self._accuracy = WeatherAccuracyEngine()
+        self._radiation_yield = RadiationYieldModel()
+        self._rollups_file = data_path / WEATHER_ROLLUPS_FILE
+        self._rollups: dict[str, dict[str, Any]] | None = None
+        self._rollup_list: list[dict[str, Any]] | None = None
+        self._rollup_lock = asyncio.Lock()
+        self._rolling_stats = WeatherRollingStats()
+        self._last_refresh: float | None = None
+        self._refresh_task: asyncio.Task | None = None
 
         self.data_path.mkdir(parents=True, exist_ok=True)
 
+    def _get_readers(self) -> tuple[WeatherDataReader, SolarDataReader]:
+        """Return long-lived readers bound to the shared connection manager. @zara"""
+        if self._weather_reader is None or self._solar_reader is None:
+            config_path = Path(self.hass.config.path())
+            if self._db_manager is not None:
+                WeatherDataReader._db_manager = self._db_manager
+                SolarDataReader._db_manager = self._db_manager
+            self._weather_reader = WeatherDataReader(config_path)
+            self._solar_reader = SolarDataReader(config_path)
+        return self._weather_reader, self._solar_reader
+
+    def get_latency_traces(self) -> dict[str, dict[str, Any]]:
+        """Return the latest latency trace of each weather endpoint. @zara"""
+        return dict(self._latency)
+
+    def _finish_trace(self, trace: LatencyTrace) -> None:
+        """Store a finished trace. @zara"""
+        self._latency[trace.name] = trace.finish()
+
     async def collect_daily_data(self) -> None:
         """Weather data is provided by Solar Forecast ML. @zara"""
         _LOGGER.debug("Weather data is provided by Solar Forecast ML")
 
     async def get_history(self, days: int = 30) -> list[dict[str, Any]]:
         """Get last N days of weather history from Solar Forecast ML. @zara"""
-        sfml_data = await self._load_from_solar_forecast_ml()
+        trace = LatencyTrace("get_history")
+        sfml_data = await self._load_from_solar_forecast_ml(trace)
+        self._finish_trace(trace)
 
         if not sfml_data:
             _LOGGER.warning(
@@ -51,125 +146,186 @@ class WeatherDataCollector:
 
         return sfml_data[-days:] if len(sfml_data) > days else sfml_data
 
-    async def _load_from_solar_forecast_ml(self) -> list[dict[str, Any]]:
-        """Load and convert weather data from Solar Forecast ML database. @zara"""
+    async def _load_from_solar_forecast_ml(
+        self, trace: LatencyTrace | None = None
+    ) -> list[dict[str, Any]]:
+        """Load daily weather rollups, extending them with new hourly rows. @zara"""
+        trace = trace or LatencyTrace("rollup_refresh")
+        async with trace.span("rollup_lock"):
+            await self._rollup_lock.acquire()
         try:
-            config_path = Path(self.hass.config.path())
-            weather_reader = WeatherDataReader(config_path)
-
-            if not weather_reader.is_available:
-                _LOGGER.debug("Solar Forecast ML database not found")
-                return []
-
-            hourly_weather = await weather_reader.async_get_hourly_weather()
-
-            if not hourly_weather:
-                _LOGGER.debug("No hourly weather data in database")
-                return []
-
-            daily_temps: dict[str, list[float]] = defaultdict(list)
-            daily_humidity: dict[str, list[float]] = defaultdict(list)
-            daily_wind: dict[str, list[float]] = defaultdict(list)
-            daily_rain: dict[str, list[float]] = defaultdict(list)
-            daily_radiation: dict[str, list[float]] = defaultdict(list)
-            daily_clouds: dict[str, list[float]] = defaultdict(list)
-
-            for weather in hourly_weather:
-                date_str = weather.date.isoformat()
-
-                if weather.temperature_c is not None:
-                    daily_temps[date_str].append(weather.temperature_c)
-
-                if weather.humidity_percent is not None:
-                    daily_humidity[date_str].append(weather.humidity_percent)
-
-                if weather.wind_speed_ms is not None:
-                    daily_wind[date_str].append(weather.wind_speed_ms)
-
-                if weather.precipitation_mm is not None:
-                    daily_rain[date_str].append(weather.precipitation_mm)
-
-                if weather.solar_radiation_wm2 is not None:
-                    daily_radiation[date_str].append(weather.solar_radiation_wm2)
-
-                if weather.cloud_cover_percent is not None:
-                    daily_clouds[date_str].append(weather.cloud_cover_percent)
-
-            solar_by_date: dict[str, float] = {}
-            try:
-                config_path = Path(self.hass.config.path())
-                reader = SolarDataReader(config_path)
-                summaries = await reader.async_get_daily_summaries()
-                for summary in summaries:
-                    date_key = summary.date.isoformat()
-                    actual_kwh = summary.actual_total_kwh
-                    if date_key and actual_kwh:
-                        solar_by_date[date_key] = actual_kwh
-            except Exception as err:
-                _LOGGER.warning("Could not load solar summaries from database: %s", err)
-
-            daily_data = []
-            for date_str in sorted(daily_temps.keys()):
-                temps = daily_temps[date_str]
-                if not temps:
-                    continue
-
-                humidity_vals = daily_humidity.get(date_str, [])
-                wind_vals = daily_wind.get(date_str, [])
-                rain_vals = daily_rain.get(date_str, [])
-                radiation_vals = daily_radiation.get(date_str, [])
-                cloud_vals = daily_clouds.get(date_str, [])
-
-                sun_hours = sum(1 for r in radiation_vals if r > 100) if radiation_vals else 0
-
-                humidity_val = min(100.0, round(sum(humidity_vals) / len(humidity_vals), 1)) if humidity_vals else 0
-                wind_val = round(sum(wind_vals) / len(wind_vals), 1) if wind_vals else 0
-                wind_max_val = round(max(wind_vals), 1) if wind_vals else 0
-                radiation_val = max(0.0, round(sum(radiation_vals) / len(radiation_vals), 1)) if radiation_vals else 0
-                rain_val = max(0.0, round(sum(rain_vals), 1)) if rain_vals else 0
-                clouds_val = min(100.0, round(sum(cloud_vals) / len(cloud_vals), 1)) if cloud_vals else 0
-
-                daily_data.append({
-                    "date": date_str,
-                    "temp_avg": round(sum(temps) / len(temps), 1),
-                    "temp_max": round(max(temps), 1),
-                    "temp_min": round(min(temps), 1),
-                    "humidity": humidity_val,
-                    "wind": wind_val,
-                    "radiation": radiation_val,
-                    "rain": rain_val,
-                    "clouds": clouds_val,
-                    "humidity_avg": humidity_val,
-                    "wind_avg": wind_val,
-                    "wind_max": wind_max_val,
-                    "radiation_avg": radiation_val,
-                    "rain_total": rain_val,
-                    "sun_hours": sun_hours,
-                    "solar_kwh": solar_by_date.get(date_str, 0),
-                })
-
-            _LOGGER.info(
-                "Loaded %d days of weather history from Solar Forecast ML database",
-                len(daily_data)
+            async with trace.span("rollup_refresh"):
+                return await self._refresh_daily_rollups(trace)
+        except Exception as err:
+            _LOGGER.error("Error loading Solar Forecast ML weather data from database: %s", err, exc_info=True)
+            return self._rollup_list or []
+        finally:
+            self._rollup_lock.release()
+
+    async def _load_persisted_rollups(self) -> dict[str, dict[str, Any]]:
+        """Load persisted daily rollups from disk. @zara"""
+        data = await read_json_safe(self._rollups_file)
+        if not data or data.get("version") != ROLLUPS_VERSION:
+            return {}
+        return data.get("days", {})
+
+    async def _refresh_daily_rollups(self, trace: LatencyTrace) -> list[dict[str, Any]]:
+        """Recompute only days that can still receive new hourly rows. @zara"""
+        if self._rollups is None:
+            self._rollups = await self._load_persisted_rollups()
+            self._rollup_list = None
+            self._rolling_stats.update(self._get_rollup_list())
+            self._radiation_yield.update(self._get_rollup_list())
+            _LOGGER.debug("Loaded %d persisted weather rollup days", len(self._rollups))
+
+        since: date | None = None
+        if self._rollups:
+            last_day = date.fromisoformat(max(self._rollups))
+            since = last_day - timedelta(days=WEATHER_ROLLUP_RECOMPUTE_DAYS - 1)
+
+        self._last_refresh = time.monotonic()
+        weather_reader, _ = self._get_readers()
+
+        if not weather_reader.is_available:
+            _LOGGER.debug("Solar Forecast ML database not found")
+            return self._get_rollup_list()
+
+        # A full rebuild aggregates in SQLite; the recompute window is read hourly
+        # because the accuracy engine needs those hours as well @zara
+        group_by = since is None and (
+            self._weather_queries is not None
+            and await self._weather_queries.async_is_available()
+        )
+
+        async def _daily() -> list[dict[str, Any]]:
+            if group_by:
+                async with trace.span("daily_weather_group_by"):
+                    days = await self._weather_queries.async_get_daily_weather()
+                return [
+                    day for date_str, accumulator in days.items()
+                    if (day := accumulator.to_day(date_str)) is not None
+                ]
+
+            async with trace.span("hourly_weather"):
+                hourly = await self._read_hourly_weather(since)
+            if hourly:
+                self._accuracy.update_observed(hourly)
+            return aggregate_daily_weather(hourly)
+
+        async def _solar() -> dict[str, float]:
+            async with trace.span("solar_summaries"):
+                return await self._load_solar_by_date(since)
+
+        daily_weather, solar_by_date = await asyncio.gather(_daily(), _solar())
+
+        if not daily_weather:
+            _LOGGER.debug("No hourly weather data in database")
+            return self._get_rollup_list()
+
+        changed: list[str] = []
+        for day in daily_weather:
+            day["solar_kwh"] = solar_by_date.get(day["date"], 0)
+            if self._rollups.get(day["date"]) != day:
+                self._rollups[day["date"]] = day
+                changed.append(day["date"])
+
+        if changed:
+            self._rollup_list = None
+            self._rolling_stats.update(self._get_rollup_list(), changed)
+            self._radiation_yield.update(self._rollups[d] for d in changed)
+            await write_json_safe(
+                self._rollups_file,
+                {"version": ROLLUPS_VERSION, "days": self._rollups},
+                indent=None,
             )
-            return daily_data
 
+        _LOGGER.debug(
+            "Weather rollups: %d days total, %d recomputed since %s",
+            len(self._rollups), len(changed), since,
+        )
+        return self._get_rollup_list()
+
+    async def _read_hourly_weather(
+        self,
+        start_date: date | None,
+        end_date: date | None = None,
+    ) -> HourlyWeatherArrays:
+        """Read observed hours, with the date window in SQL when the table allows. @zara"""
+        if self._weather_queries is not None and await self._weather_queries.async_is_available():
+            return await self._weather_queries.async_get_hourly_weather(start_date, end_date)
+        weather_reader, _ = self._get_readers()
+        return await _read_hourly_arrays(
+            weather_reader.async_get_hourly_weather, start_date, end_date
+        )
+
+    async def _load_solar_by_date(self, since: date | None) -> dict[str, float]:
+        """Load actual solar production per day. @zara"""
+        solar_by_date: dict[str, float] = {}
+        try:
+            _, reader = self._get_readers()
+            summaries = await _read_date_range(
+                reader.async_get_daily_summaries, since
+            )
+            for summary in summaries:
+                date_key = summary.date.isoformat()
+                actual_kwh = summary.actual_total_kwh
+                if date_key and actual_kwh:
+                    solar_by_date[date_key] = actual_kwh
         except Exception as err:
-            _LOGGER.error("Error loading Solar Forecast ML weather data from database: %s", err, exc_info=True)
-            return []
+            _LOGGER.warning("Could not load solar summaries from database: %s", err)
+        return solar_by_date
+
+    def _get_rollup_list(self) -> list[dict[str, Any]]:
+        """Return rollups sorted by date. @zara"""
+        if self._rollup_list is None:
+            self._rollup_list = [
+                self._rollups[date_str] for date_str in sorted(self._rollups or {})
+            ]
+        return self._rollup_list
 
     async def get_comparison_data(self, days: int = 7) -> dict[str, Any]:
         """Get IST vs KI comparison data for weather analytics. @zara"""
-        ist_data = await self._load_from_solar_forecast_ml()
+        trace = LatencyTrace("get_comparison_data")
 
-        ki_data = await self._load_ki_forecast_data()
+        # Guess the KI window from known rollups so both loads can run together @zara
+        known = self._rollup_list or []
+        if len(known) >= days:
+            ki_start = date.fromisoformat(known[-days]["date"])
+        else:
+            ki_start = date.today() - timedelta(days=days)
+
+        async def _ist() -> list[dict[str, Any]]:
+            async with trace.span("ist_rollups"):
+                return await self._load_from_solar_forecast_ml(trace)
+
+        async def _ki() -> dict[str, dict[str, Any]]:
+            async with trace.span("ki_forecast"):
+                return await self._load_ki_forecast_data(ki_start, None)
+
+        ist_data, ki_data = await asyncio.gather(_ist(), _ki())
 
         if not ist_data:
             _LOGGER.warning("No IST weather data available for comparison")
+            self._finish_trace(trace)
             return {"success": False, "error": "No IST data available"}
 
         ist_data = ist_data[-days:] if len(ist_data) > days else ist_data
 
+        first_ist = date.fromisoformat(ist_data[0]["date"])
+        if first_ist < ki_start:
+            async with trace.span("ki_forecast_backfill"):
+                ki_data = {
+                    **await self._load_ki_forecast_data(
+                        first_ist, ki_start - timedelta(days=1)
+                    ),
+                    **ki_data,
+                }
+
+        async with trace.span("hourly_accuracy"):
+            hourly_accuracy = await self._get_hourly_accuracy(
+                ist_data[0]["date"], ist_data[-1]["date"]
+            )
+
         comparison = []
         for ist_day in ist_data:
             date_str = ist_day.get("date")
@@ -208,6 +364,7 @@ class WeatherDataCollector:
             temp_accuracy = 0
             rad_accuracy = 0
 
+        self._finish_trace(trace)
         return {
             "success": True,
             "data": comparison,
@@ -215,78 +372,108 @@ class WeatherDataCollector:
                 "temp_accuracy": round(temp_accuracy, 1),
                 "radiation_accuracy": round(rad_accuracy, 1),
                 "overall_accuracy": round((temp_accuracy + rad_accuracy) / 2, 1),
-                "days_compared": len(comparison)
+                "days_compared": len(comparison),
+                "hourly": hourly_accuracy,
             }
         }
 
-    async def _load_ki_forecast_data(self) -> dict[str, dict[str, Any]]:
-        """Load KI forecast data from database. @zara"""
+    async def _get_hourly_accuracy(self, start: str, end: str) -> dict[str, Any]:
+        """Return hour-aligned forecast errors, loading missing observed days. @zara"""
+        first = date.fromisoformat(start)
+        last = date.fromisoformat(end)
+        missing = [
+            day for day in _days_between(first, last)
+            if not self._accuracy.has_observed(day.isoformat())
+        ]
+        if missing:
+            # Persisted rollups skip the hourly read, fetch only the gap once @zara
+            try:
+                hourly = await self._read_hourly_weather(missing[0], missing[-1])
+                self._accuracy.update_observed(hourly)
+                # Past days still without hours will not gain any, skip them next time @zara
+                today = date.today()
+                self._accuracy.mark_empty(
+                    day.isoformat() for day in missing if day < today
+                )
+            except Exception as err:
+                _LOGGER.warning("Could not load hourly weather for accuracy: %s", err)
+        return self._accuracy.summarize(start, end)
+
+    async def get_forecast_accuracy(
+        self, start_date: date, end_date: date
+    ) -> dict[str, Any]:
+        """Return MAE, RMSE and bias per weather variable for a date window. @zara"""
+        missing = [
+            day for day in _days_between(start_date, end_date)
+            if not self._accuracy.has_forecast(day.isoformat())
+        ]
+        if missing and await self._read_forecast_hours(missing[0], missing[-1]) is not None:
+            today = date.today()
+            self._accuracy.mark_empty(
+                (day.isoformat() for day in missing if day < today), forecast=True
+            )
+        return {
+            "success": True,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            **await self._get_hourly_accuracy(
+                start_date.isoformat(), end_date.isoformat()
+            ),
+        }
+
+    async def _read_forecast_hours(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> HourlyWeatherArrays | None:
+        """Read forecast hours into the accuracy engine, None if the read failed. @zara"""
         try:
-            config_path = Path(self.hass.config.path())
-            weather_reader = WeatherDataReader(config_path)
+            weather_reader, _ = self._get_readers()
 
             if not weather_reader.is_available:
                 _LOGGER.debug("Solar Forecast ML database not found")
-                return {}
+                return None
 
-            hourly_forecast = await weather_reader.async_get_forecast_weather()
+            hourly_forecast = await _read_hourly_arrays(
+                weather_reader.async_get_forecast_weather, start_date, end_date
+            )
+        except Exception as err:
+            _LOGGER.error("Error loading KI forecast data from database: %s", err, exc_info=True)
+            return None
 
-            if not hourly_forecast:
-                _LOGGER.debug("No forecast data in database")
-                return {}
+        self._accuracy.update_forecast(hourly_forecast)
+        return hourly_forecast
 
-            daily_forecasts: dict[str, dict[str, Any]] = defaultdict(lambda: {
-                "temps": [],
-                "radiations": [],
-                "clouds": [],
-                "humidities": [],
-                "winds": [],
-                "rains": []
-            })
+    async def _load_ki_forecast_data(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Load KI forecast data from database. @zara"""
+        hourly_forecast = await self._read_forecast_hours(start_date, end_date)
+        if not hourly_forecast:
+            _LOGGER.debug("No forecast data in database")
+            return {}
 
-            for weather in hourly_forecast:
-                date_str = weather.date.isoformat()
-                day = daily_forecasts[date_str]
-
-                if weather.temperature_c is not None:
-                    day["temps"].append(weather.temperature_c)
-                if weather.solar_radiation_wm2 is not None:
-                    day["radiations"].append(weather.solar_radiation_wm2)
-                if weather.cloud_cover_percent is not None:
-                    day["clouds"].append(weather.cloud_cover_percent)
-                if weather.humidity_percent is not None:
-                    day["humidities"].append(weather.humidity_percent)
-                if weather.wind_speed_ms is not None:
-                    day["winds"].append(weather.wind_speed_ms)
-                if weather.precipitation_mm is not None:
-                    day["rains"].append(weather.precipitation_mm)
-
-            result = {}
-            for date_str, data in daily_forecasts.items():
-                if data["temps"]:
-                    result[date_str] = {
-                        "temp_avg": round(sum(data["temps"]) / len(data["temps"]), 1),
-                        "temp_max": round(max(data["temps"]), 1),
-                        "temp_min": round(min(data["temps"]), 1),
-                        "radiation": round(sum(data["radiations"]) / len(data["radiations"]), 1) if data["radiations"] else 0,
-                        "clouds": round(sum(data["clouds"]) / len(data["clouds"]), 1) if data["clouds"] else 0,
-                        "humidity": round(sum(data["humidities"]) / len(data["humidities"]), 1) if data["humidities"] else 0,
-                        "wind": round(sum(data["winds"]) / len(data["winds"]), 1) if data["winds"] else 0,
-                        "rain": round(sum(data["rains"]), 1) if data["rains"] else 0,
-                    }
-
-            _LOGGER.info("Loaded KI forecast data for %d days from database", len(result))
-            return result
+        result = {}
+        for date_str, accumulator in accumulate_daily_weather(hourly_forecast).items():
+            day = accumulator.to_forecast_day()
+            if day is not None:
+                result[date_str] = day
 
-        except Exception as err:
-            _LOGGER.error("Error loading KI forecast data from database: %s", err, exc_info=True)
-            return {}
+        _LOGGER.info("Loaded KI forecast data for %d days from database", len(result))
+        return result
 
     async def get_statistics(self) -> dict[str, Any]:
-        """Calculate weather statistics from Solar Forecast ML history. @zara"""
-        history_data = await self.get_history(days=365)
-
-        if not history_data:
+        """Return rolling weather statistics without reloading history. @zara"""
+        trace = LatencyTrace("get_statistics")
+        if not self._rolling_stats:
+            await self._load_from_solar_forecast_ml(trace)
+        elif self._is_refresh_due():
+            self._schedule_refresh()
+        self._finish_trace(trace)
+
+        if not self._rolling_stats:
             return {
                 "avgTemp": 0,
                 "maxTemp": 0,
@@ -296,16 +483,36 @@ class WeatherDataCollector:
                 "sunHours": 0
             }
 
-        week_data = history_data[-7:] if len(history_data) >= 7 else history_data
-        month_data = history_data[-30:] if len(history_data) >= 30 else history_data
+        return self._rolling_stats.as_dict()
 
-        total_sun_hours = sum(d.get("sun_hours", 0) for d in week_data)
+    async def get_radiation_yield(self, days: int = 30) -> dict[str, Any]:
+        """Return the radiation-to-yield fit with residuals of the last N days. @zara"""
+        if not self._rollups:
+            await self._load_from_solar_forecast_ml()
+        elif self._is_refresh_due():
+            self._schedule_refresh()
 
-        return {
-            "avgTemp": round(sum(d.get("temp_avg", 0) for d in week_data) / len(week_data), 1) if week_data else 0,
-            "maxTemp": round(max((d.get("temp_max", 0) for d in history_data), default=0), 1),
-            "minTemp": round(min((d.get("temp_min", 0) for d in history_data), default=0), 1),
-            "totalRain": round(sum(d.get("rain_total", 0) for d in month_data), 1),
-            "avgWind": round(sum(d.get("wind_avg", 0) for d in history_data) / len(history_data), 1) if history_data else 0,
-            "sunHours": total_sun_hours
-        }
+        result = self._radiation_yield.as_dict(days)
+        if not result.get("fitted"):
+            return {
+                "success": False,
+                "error": "Not enough days with radiation and production data",
+                **result,
+            }
+        return {"success": True, **result}
+
+    def _is_refresh_due(self) -> bool:
+        """Check whether the rollups are older than the refresh interval. @zara"""
+        return (
+            self._last_refresh is None
+            or time.monotonic() - self._last_refresh > WEATHER_STATS_REFRESH_SECONDS
+        )
+
+    def _schedule_refresh(self) -> None:
+        """Refresh rollups in the background, at most one task at a time. @zara"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = self.hass.async_create_background_task(
+            self._load_from_solar_forecast_ml(),
+            "sfml_stats_weather_rollup_refresh",
+        )
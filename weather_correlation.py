@@ -0,0 +1,162 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Incremental radiation-to-yield regression for SFML Stats. @zara"""
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+HOURS_PER_DAY = 24
+OUTLIER_SIGMA = 2.5
+MAX_OUTLIERS = 10
+MIN_FIT_DAYS = 3
+
+
+def daily_irradiation_kwh_m2(day: dict[str, Any]) -> float:
+    """Convert the daily mean radiation in W/m² to kWh/m². @zara"""
+    radiation = day.get("radiation_avg", day.get("radiation")) or 0
+    return radiation * HOURS_PER_DAY / 1000
+
+
+class RadiationYieldModel:
+    """Linear fit of daily yield against irradiation, updated per changed day. @zara"""
+
+    def __init__(self) -> None:
+        """Initialize empty running sums. @zara"""
+        self._points: dict[str, tuple[float, float]] = {}
+        self._n = 0
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._syy = 0.0
+        self._result: dict[str, Any] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of fitted days. @zara"""
+        return self._n
+
+    def _apply(self, x: float, y: float, sign: int) -> None:
+        """Add or remove one point from the running sums. @zara"""
+        self._n += sign
+        self._sx += sign * x
+        self._sy += sign * y
+        self._sxx += sign * x * x
+        self._sxy += sign * x * y
+        self._syy += sign * y * y
+
+    def update(self, days: Iterable[dict[str, Any]]) -> int:
+        """Replace the contribution of the given days, returns changed count. @zara"""
+        changed = 0
+        for day in days:
+            date_str = day["date"]
+            x = daily_irradiation_kwh_m2(day)
+            y = day.get("solar_kwh") or 0
+            point = (x, y) if x > 0 and y > 0 else None
+
+            old = self._points.get(date_str)
+            if old == point:
+                continue
+            if old is not None:
+                self._apply(*old, sign=-1)
+                del self._points[date_str]
+            if point is not None:
+                self._apply(*point, sign=1)
+                self._points[date_str] = point
+            changed += 1
+
+        if changed:
+            self._result = None
+            if self._n == 0:
+                # Drop float drift once nothing is left @zara
+                self._sx = self._sy = self._sxx = self._sxy = self._syy = 0.0
+        return changed
+
+    def _fit(self) -> dict[str, Any]:
+        """Compute coefficients, residuals and outliers from the running sums. @zara"""
+        import numpy as np
+
+        n = self._n
+        if n < MIN_FIT_DAYS or self._sxx <= 0:
+            return {"days": n, "fitted": False}
+
+        yield_factor = self._sxy / self._sxx
+        var_x = n * self._sxx - self._sx * self._sx
+        var_y = n * self._syy - self._sy * self._sy
+        cov = n * self._sxy - self._sx * self._sy
+        slope = cov / var_x if var_x > 0 else yield_factor
+        intercept = (self._sy - slope * self._sx) / n
+        r = cov / math.sqrt(var_x * var_y) if var_x > 0 and var_y > 0 else 0.0
+
+        dates = sorted(self._points)
+        xy = np.array([self._points[d] for d in dates], dtype=float)
+        expected = xy[:, 0] * yield_factor
+        residuals = xy[:, 1] - expected
+        residual_std = float(residuals.std())
+
+        outliers: list[dict[str, Any]] = []
+        if residual_std > 0:
+            z = residuals / residual_std
+            flagged = np.flatnonzero(np.abs(z) > OUTLIER_SIGMA)
+            flagged = flagged[np.argsort(-np.abs(z[flagged]))][:MAX_OUTLIERS]
+            outliers = [
+                {
+                    "date": dates[i],
+                    "actual_kwh": round(float(xy[i, 1]), 2),
+                    "expected_kwh": round(float(expected[i]), 2),
+                    "residual": round(float(residuals[i]), 2),
+                    "z_score": round(float(z[i]), 2),
+                }
+                for i in flagged
+            ]
+
+        return {
+            "days": n,
+            "fitted": True,
+            "kwh_per_kwh_m2": round(yield_factor, 3),
+            "slope": round(slope, 3),
+            "intercept": round(intercept, 3),
+            "r": round(r, 3),
+            "r_squared": round(r * r, 3),
+            "residual_std": round(residual_std, 3),
+            "outliers": outliers,
+            "_dates": dates,
+            "_xy": xy,
+            "_residuals": residuals,
+            "_expected": expected,
+        }
+
+    def as_dict(self, days: int | None = None) -> dict[str, Any]:
+        """Return the cached fit with residuals of the last N days. @zara"""
+        if self._result is None:
+            self._result = self._fit()
+        result = self._result
+        public = {k: v for k, v in result.items() if not k.startswith("_")}
+        if not result.get("fitted"):
+            public["residuals"] = []
+            return public
+
+        dates = result["_dates"]
+        start = max(0, len(dates) - days) if days else 0
+        xy = result["_xy"]
+        public["residuals"] = [
+            {
+                "date": dates[i],
+                "irradiation_kwh_m2": round(float(xy[i, 0]), 2),
+                "actual_kwh": round(float(xy[i, 1]), 2),
+                "expected_kwh": round(float(result["_expected"][i]), 2),
+                "residual": round(float(result["_residuals"][i]), 2),
+            }
+            for i in range(start, len(dates))
+        ]
+        return public